@@ -0,0 +1 @@
+# Empty - makes benchmarks a package
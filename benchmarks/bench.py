@@ -0,0 +1,186 @@
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+import tracemalloc
+from datetime import datetime, timezone
+from src.validator import ResumeValidator
+from src.detector import detect_all_sections, extract_basic_info
+from src import rules, utils
+from .corpus import CorpusGenerator, FIELD_ALIASES
+
+DATE_KEYS = set(FIELD_ALIASES["start"] + FIELD_ALIASES["end"])
+URL_KEYS = set(FIELD_ALIASES["link"] + FIELD_ALIASES["cert_url"])
+
+def _clear_caches():
+    for check in utils.CHECKS.values():
+        check.cache_clear()
+    utils.DATE_PARSER.parse.cache_clear()
+
+def _peak_kb(fn, inputs):
+    # Peak memory allocated during one pass over inputs, above what was
+    # allocated before it. Kept out of the timed passes, which tracing would
+    # slow down.
+    _clear_caches()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        for item in inputs:
+            fn(item)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return (peak - base) // 1024
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def measure(fn, inputs, repeat=1):
+    _clear_caches()
+    latencies = []
+    clock = time.perf_counter_ns
+    started = clock()
+    for _ in range(repeat):
+        for item in inputs:
+            t0 = clock()
+            fn(item)
+            latencies.append(clock() - t0)
+    elapsed = (clock() - started) / 1e9
+    latencies.sort()
+    return {
+        "calls": len(latencies),
+        "seconds": round(elapsed, 6),
+        "per_sec": round(len(latencies) / elapsed, 1) if elapsed else None,
+        "p50_us": round(_percentile(latencies, 0.50) / 1000, 2),
+        "p99_us": round(_percentile(latencies, 0.99) / 1000, 2),
+        "peak_kb": _peak_kb(fn, inputs)
+    }
+
+def _atomic_values(docs, sections):
+    values = {"date": [], "url": [], "email": [], "phone": []}
+    for doc, found in zip(docs, sections):
+        for entry_list in found.values():
+            if not isinstance(entry_list, list):
+                continue
+            for entry in entry_list:
+                if not isinstance(entry, dict):
+                    continue
+                for key, value in entry.items():
+                    if not isinstance(value, str):
+                        continue
+                    if key in DATE_KEYS:
+                        values["date"].append(value)
+                    elif key in URL_KEYS:
+                        values["url"].append(value)
+        info = extract_basic_info(doc)
+        values["email"].append(info["email"])
+        values["phone"].append(info["phone"])
+    return values
+
+def build_suite(docs):
+    validator = ResumeValidator()
+    sections = [detect_all_sections(doc) for doc in docs]
+    infos = [extract_basic_info(doc) for doc in docs]
+    suite = {
+        "validate": (validator.validate, docs),
+        "detect_all_sections": (detect_all_sections, docs),
+        "extract_basic_info": (extract_basic_info, docs),
+        "validate_links": (rules.validate_links, docs),
+        "validate_basic_info": (rules.validate_basic_info, infos)
+    }
+    for name in ("experience", "education", "projects", "certifications"):
+        fn = getattr(rules, "validate_" + name)
+        inputs = [found[name] for found in sections if name in found]
+        suite["validate_" + name] = (fn, inputs)
+    values = _atomic_values(docs, sections)
+    suite["utils.validate_date"] = (utils.validate_date, values["date"])
+    suite["utils.validate_url"] = (utils.validate_url, values["url"])
+    suite["utils.validate_email"] = (utils.validate_email, values["email"])
+    suite["utils.validate_phone"] = (utils.validate_phone, values["phone"])
+    return suite
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous or not previous.get("per_sec") or not current.get("per_sec"):
+            continue
+        change = current["per_sec"] / previous["per_sec"] - 1
+        marker = ""
+        if change < -threshold:
+            marker = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:32s} {previous['per_sec']:>12.1f} -> {current['per_sec']:>12.1f}/s {change:+7.1%}{marker}",
+              file=sys.stderr)
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the resume validator.")
+    parser.add_argument("--input", help="NDJSON corpus to use instead of generating one")
+    parser.add_argument("--records", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--entries", type=int, default=3)
+    parser.add_argument("--depth", type=int, default=0)
+    parser.add_argument("--alias-rate", type=float, default=0.5)
+    parser.add_argument("--dirty-rate", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=1, help="passes over the corpus per benchmark")
+    parser.add_argument("--only", action="append", help="run only benchmarks with this name (repeatable)")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="previous results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="slowdown fraction that counts as a regression (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    if args.input:
+        with open(args.input, "r", encoding="utf-8") as f:
+            docs = [json.loads(line) for line in f if line.strip()]
+    else:
+        generator = CorpusGenerator(args.seed, args.entries, args.depth, args.alias_rate, args.dirty_rate)
+        docs = list(generator.generate(args.records))
+
+    results = {}
+    for name, (fn, inputs) in build_suite(docs).items():
+        if args.only and name not in args.only:
+            continue
+        results[name] = measure(fn, inputs, args.repeat)
+        r = results[name]
+        print(f"{name:32s} {r['calls']:>8d} calls {r['per_sec']:>12.1f}/s "
+              f"p50 {r['p50_us']:>9.1f}us p99 {r['p99_us']:>9.1f}us peak {r['peak_kb']}KB",
+              file=sys.stderr)
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "records": len(docs),
+            "params": {k: v for k, v in vars(args).items() if k not in ("output", "compare")}
+        },
+        "results": results
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    regressions = []
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+    if regressions:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
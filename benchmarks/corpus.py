@@ -0,0 +1,163 @@
+import sys
+import json
+import random
+import argparse
+
+SECTION_ALIASES = {
+    "experience": ["experience", "work_experience", "Work Experience", "employment_history", "jobs", "internships"],
+    "education": ["education", "academics", "academic_details", "qualifications", "schooling"],
+    "projects": ["projects", "personal_projects", "Academic Projects", "portfolio", "project_experience"],
+    "certifications": ["certifications", "certificates", "licenses", "credentials", "certs"]
+}
+FIELD_ALIASES = {
+    "title": ["title", "position", "role", "job_title", "designation"],
+    "company": ["company", "employer", "organization", "company_name"],
+    "start": ["startDate", "start_date", "from", "joining_date"],
+    "end": ["endDate", "end_date", "to", "leaving_date"],
+    "description": ["description", "summary", "details"],
+    "highlights": ["highlights", "responsibilities", "duties", "points"],
+    "degree": ["degree", "qualification", "course", "program"],
+    "institution": ["institution", "school", "college", "university"],
+    "grade": ["grade", "gpa", "cgpa", "percentage"],
+    "name": ["name", "title", "project_name", "projectName"],
+    "tech": ["technologies", "tech_stack", "tools", "built_with"],
+    "link": ["link", "github", "url", "repo"],
+    "issuer": ["issuer", "issued_by", "provider", "platform"],
+    "cert_url": ["verification_url", "credential_url", "url"],
+    "email": ["email", "emails", "mail", "e-mail", "emailId"],
+    "phone": ["phone", "mobile", "phone_number", "telephone"],
+    "full_name": ["name", "full_name", "fullName", "candidate_name"],
+    "id": ["candidate_id", "id", "userId", "applicant_id"]
+}
+WORDS = (
+    "built designed implemented scalable service platform data pipeline api "
+    "python java react node mongodb mysql django flask spring aws docker "
+    "kubernetes users latency throughput reduced improved migrated team led "
+    "mentored tested deployed monitoring analytics dashboard machine learning"
+).split()
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella", "Stark Industries", "Wayne Enterprises"]
+SCHOOLS = ["State University", "Institute of Technology", "City College", "National School"]
+DOMAINS = ["gmail.com", "yahoo.com", "outlook.com", "example.org"]
+PLATFORMS = ["linkedin", "github", "portfolio", "leetcode", "website"]
+GOOD_DATES = ["2019-06-01", "2020-01", "Jan 2021", "March 2018", "15/08/2017", "2022", "05 Sep 2016", "Aug 12, 2020"]
+BAD_DATES = ["20-20-2020", "sometime 2019", "Q3 2021", "2021-13-01", "31/02/2020"]
+GOOD_URLS = ["https://github.com/user/repo", "https://www.linkedin.com/in/someone", "https://example.dev/app", "www.portfolio.io"]
+BAD_URLS = ["https://linkedin/someone", "not a url", "http://", "github dot com"]
+
+class CorpusGenerator:
+    def __init__(self, seed=0, entries=3, depth=0, alias_rate=0.5, dirty_rate=0.1):
+        self.random = random.Random(seed)
+        self.entries = entries
+        self.depth = depth
+        self.alias_rate = alias_rate
+        self.dirty_rate = dirty_rate
+
+    def key(self, field):
+        aliases = FIELD_ALIASES.get(field) or SECTION_ALIASES[field]
+        if self.random.random() < self.alias_rate:
+            return self.random.choice(aliases)
+        return aliases[0]
+
+    def dirty(self):
+        return self.random.random() < self.dirty_rate
+
+    def text(self, low=4, high=20):
+        return " ".join(self.random.choice(WORDS) for _ in range(self.random.randint(low, high)))
+
+    def date(self):
+        return self.random.choice(BAD_DATES if self.dirty() else GOOD_DATES)
+
+    def url(self):
+        return self.random.choice(BAD_URLS if self.dirty() else GOOD_URLS)
+
+    def nest(self, value):
+        for _ in range(self.depth):
+            value = {"data": value} if self.random.random() < 0.5 else [value]
+        return value
+
+    def experience(self):
+        return {
+            self.key("title"): self.text(1, 3),
+            self.key("company"): self.random.choice(COMPANIES),
+            self.key("start"): self.date(),
+            self.key("end"): self.random.choice(["present", self.date()]),
+            self.key("highlights"): [self.text() for _ in range(self.random.randint(1, 5))]
+        }
+
+    def education(self):
+        grade = "%.2f/10 CGPA" % self.random.uniform(5, 10)
+        if self.dirty():
+            grade = self.random.choice(["150%", "12/10", "excellent"])
+        return {
+            self.key("degree"): self.text(1, 4),
+            self.key("institution"): self.random.choice(SCHOOLS),
+            self.key("grade"): grade,
+            self.key("end"): self.date()
+        }
+
+    def project(self):
+        return {
+            self.key("name"): self.text(1, 4),
+            "points": {ch: self.text() for ch in "abcd"[:self.random.randint(1, 4)]},
+            self.key("tech"): self.random.sample(WORDS[8:22], 3),
+            self.key("link"): self.url()
+        }
+
+    def certification(self):
+        return {
+            "name": self.text(2, 5),
+            self.key("issuer"): self.random.choice(COMPANIES),
+            self.key("cert_url"): self.url()
+        }
+
+    def resume(self, index):
+        user = "user%d" % self.random.randint(1, 10 ** 6)
+        email = user + "@" + self.random.choice(DOMAINS)
+        if self.dirty():
+            email = email.replace("@", "")
+        phone = "+1 555 %07d" % self.random.randint(0, 9999999)
+        if self.dirty():
+            phone = "n/a"
+        doc = {
+            self.key("id"): "C%06d" % index,
+            self.key("full_name"): self.text(2, 2).title(),
+            "contact": {self.key("email"): email, self.key("phone"): phone}
+        }
+        for platform in self.random.sample(PLATFORMS, self.random.randint(1, 3)):
+            doc[platform] = self.url()
+        sections = {
+            "experience": self.experience,
+            "education": self.education,
+            "projects": self.project,
+            "certifications": self.certification
+        }
+        for section, make in sections.items():
+            count = self.random.randint(max(self.entries - 1, 0), self.entries + 1)
+            doc[self.key(section)] = self.nest([make() for _ in range(count)])
+        doc["skills"] = ", ".join(self.random.sample(WORDS, 8))
+        return doc
+
+    def generate(self, count):
+        for index in range(count):
+            yield self.resume(index)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic resume corpus.")
+    parser.add_argument("--records", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--entries", type=int, default=3, help="average entries per section")
+    parser.add_argument("--depth", type=int, default=0, help="extra nesting around each section")
+    parser.add_argument("--alias-rate", type=float, default=0.5, help="chance of an alias key spelling")
+    parser.add_argument("--dirty-rate", type=float, default=0.1, help="chance of an invalid value")
+    parser.add_argument("--format", choices=["ndjson", "json"], default="ndjson")
+    args = parser.parse_args(argv)
+    generator = CorpusGenerator(args.seed, args.entries, args.depth, args.alias_rate, args.dirty_rate)
+    records = generator.generate(args.records)
+    if args.format == "json":
+        json.dump(list(records), sys.stdout)
+    else:
+        for record in records:
+            sys.stdout.write(json.dumps(record) + "\n")
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,475 @@
 import sys
 import json
-from src.validator import ResumeValidator
+import argparse
+from src.validator import ResumeValidator, select_sections
+from src.cache import make_cache, DEFAULT_CACHE_ENTRIES
+from src.parser import iter_records, iter_raw_records
+from src.pool import (
+    validate_parallel, report_parallel, validate_raw, validate_record, DEFAULT_CHUNK_SIZE
+)
+from src.server import run_server, DEFAULT_HOST, DEFAULT_PORT, DEFAULT_QUEUE_SIZE
+from src.tracing import TRACER
+from src.codec import JSONWriter, OUTPUT_MODES, load, dumpb
+from src.sources import (
+    expand_paths, is_multi_input, iter_files, file_results,
+    DEFAULT_READ_THREADS, DEFAULT_READ_AHEAD
+)
+from src.report import ValidationReport, merge_reports, DEFAULT_TOP
+from src.pipeline import ValidationPipeline, DEFAULT_QUEUE_DEPTH, DEFAULT_DECODE_THREADS
+from src.checkpoint import parse_shard, shard_records, run_ndjson, DEFAULT_CHECKPOINT_EVERY
 
-def main():
-    validator = ResumeValidator()
+def section_list(value):
+    try:
+        return sorted(select_sections(value.split(",")))
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+def shard_spec(value):
     try:
-        if len(sys.argv) > 1:
-            file_path = sys.argv[1]
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+        return parse_shard(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not >= 1")
+    return number
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Validate resume JSON documents.")
+    parser.add_argument(
+        "inputs", nargs="*", metavar="input",
+        help="JSON or NDJSON file (default: stdin); several files, directories "
+             "or glob patterns are read concurrently and each result gets its \"source\""
+    )
+    parser.add_argument("--config", help="rule config file (default: config.yaml)")
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="validate records one at a time and write one NDJSON result line per record"
+    )
+    parser.add_argument(
+        "--input-format", choices=["auto", "json", "ndjson"], default="auto",
+        help="input layout for --stream (default: auto)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=0,
+        help="validate in N worker processes (implies --stream; with --serve, 0 uses one thread)"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+        help="records sent to a worker at a time (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--unordered", action="store_true",
+        help="with --workers or --pipeline, write results as they finish instead of in input order"
+    )
+    parser.add_argument(
+        "--cache-size", type=int, default=0,
+        help="cache up to N results keyed by document hash (default: off)"
+    )
+    parser.add_argument(
+        "--cache-db",
+        help="keep the result cache in this SQLite file instead of memory"
+    )
+    parser.add_argument(
+        "--serve", action="store_true",
+        help="run an HTTP validation server instead of reading input"
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help="server bind address")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="server port")
+    parser.add_argument(
+        "--queue-size", type=int, default=DEFAULT_QUEUE_SIZE,
+        help="server jobs allowed to wait before requests get 503 (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--trace", action="store_true",
+        help="time each validation stage, add per-record timings under \"debug\" "
+             "and keep per-stage latency histograms (served at /metrics with --serve)"
+    )
+    parser.add_argument(
+        "--metrics-out",
+        help="with --trace, write the stage histograms to this file (default: stderr)"
+    )
+    parser.add_argument(
+        "--metrics-format", choices=["json", "prometheus"], default="json",
+        help="format for --metrics-out (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--sections", type=section_list,
+        help="comma-separated sections to validate, e.g. experience,education "
+             "(default: all); links and basic_info are selectable too"
+    )
+    parser.add_argument(
+        "--fail-fast", action="store_true",
+        help="stop validating once validation_status is decided; "
+             "links and basic_info are skipped"
+    )
+    parser.add_argument(
+        "--output-format", choices=OUTPUT_MODES, default="pretty",
+        help="layout of batch results (--stream and --workers always write ndjson) "
+             "(default: %(default)s)"
+    )
+    parser.add_argument(
+        "--dedup", action="store_true",
+        help="for a JSON array input, print how often the date, URL, email and "
+             "phone checks reused an earlier result to stderr"
+    )
+    parser.add_argument(
+        "--report", action="store_true",
+        help="print one aggregate report (status, section and issue counts) "
+             "instead of per-record results; records are streamed and not kept"
+    )
+    parser.add_argument(
+        "--top", type=int, default=DEFAULT_TOP,
+        help="issues listed under top_issues in --report output (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--merge-reports", nargs="+", metavar="REPORT",
+        help="merge --report outputs, e.g. from separate shards, into one report"
+    )
+    parser.add_argument(
+        "--read-threads", type=int, default=DEFAULT_READ_THREADS,
+        help="threads reading files for directory or glob input, also with --pipeline "
+             "(default: %(default)s)"
+    )
+    parser.add_argument(
+        "--read-ahead", type=int, default=DEFAULT_READ_AHEAD,
+        help="files read ahead of validation at most (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--shard", type=shard_spec, metavar="I/N",
+        help="process only slice I (0-based) of N equal byte ranges of an NDJSON file"
+    )
+    parser.add_argument(
+        "--checkpoint", metavar="OUTPUT",
+        help="write NDJSON results for an NDJSON file to OUTPUT, checkpointing "
+             "progress in OUTPUT.ckpt; rerunning resumes where it stopped"
+    )
+    parser.add_argument(
+        "--checkpoint-every", type=positive_int, default=DEFAULT_CHECKPOINT_EVERY,
+        help="records between checkpoints (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--index", action="store_true",
+        help="build or reuse a byte-offset index (INPUT.idx) of an NDJSON file "
+             "and split shards on it"
+    )
+    parser.add_argument(
+        "--pipeline", action="store_true",
+        help="overlap reading, decoding, validation and writing in concurrent stages "
+             "(writes ndjson) and print per-stage metrics to stderr"
+    )
+    parser.add_argument(
+        "--decode-threads", type=int, default=DEFAULT_DECODE_THREADS,
+        help="with --pipeline, threads decoding JSON; with --workers the workers "
+             "decode (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--validate-tasks", type=int,
+        help="with --pipeline, chunks being validated at once "
+             "(default: 2 per worker, 1 without --workers)"
+    )
+    parser.add_argument(
+        "--queue-depth", type=int, default=DEFAULT_QUEUE_DEPTH,
+        help="with --pipeline, chunks queued between stages (default: %(default)s)"
+    )
+    args = parser.parse_args(argv)
+    args.multi = is_multi_input(args.inputs)
+    args.input = args.inputs[0] if args.inputs and not args.multi else None
+    return args
+
+def cache_spec(args):
+    if not args.cache_db and args.cache_size <= 0:
+        return None
+    size = args.cache_size if args.cache_size > 0 else DEFAULT_CACHE_ENTRIES
+    return (args.cache_db, size)
+
+def run_stream(validator, source, input_format, out):
+    for record in iter_records(source, input_format):
+        out.write(validate_record(validator, record).to_dict())
+    out.flush()
+
+def run_parallel(raw_records, args, out):
+    lines = validate_parallel(
+        raw_records,
+        args.workers,
+        chunk_size=args.chunk_size,
+        ordered=not args.unordered,
+        config_path=args.config,
+        cache_spec=cache_spec(args),
+        trace=args.trace,
+        sections=args.sections,
+        fail_fast=args.fail_fast
+    )
+    for line in lines:
+        out.write_line(line)
+    out.flush()
+
+def run_report(validator, source, input_format, top):
+    report = ValidationReport(top)
+    for record in iter_records(source, input_format):
+        report.add(validate_record(validator, record))
+    return report
+
+def run_report_parallel(raw_records, args):
+    return report_parallel(
+        raw_records,
+        args.workers,
+        chunk_size=args.chunk_size,
+        config_path=args.config,
+        cache_spec=cache_spec(args),
+        trace=args.trace,
+        sections=args.sections,
+        fail_fast=args.fail_fast,
+        top=args.top
+    )
+
+def iter_input_files(args, parse=True):
+    return iter_files(
+        expand_paths(args.inputs), args.read_threads, args.read_ahead, parse
+    )
+
+def run_files(validator, args, out):
+    # Files are parsed on the reader threads, or by the workers with
+    # --workers so that raw bytes rather than parsed documents cross the
+    # process boundary.
+    if args.workers > 0:
+        lines = validate_parallel(
+            iter_input_files(args, parse=False),
+            args.workers,
+            chunk_size=args.chunk_size,
+            ordered=not args.unordered,
+            config_path=args.config,
+            cache_spec=cache_spec(args),
+            trace=args.trace,
+            sections=args.sections,
+            fail_fast=args.fail_fast
+        )
+        for line in lines:
+            out.write_line(line)
+    else:
+        results = (
+            result.to_dict()
+            for path, content in iter_input_files(args)
+            for result in file_results(validator, path, content)
+        )
+        if out.mode == "ndjson":
+            for result in results:
+                out.write(result)
+        else:
+            out.write_all(results)
+    out.flush()
+
+def report_files(validator, args):
+    if args.workers > 0:
+        return report_parallel(
+            iter_input_files(args, parse=False),
+            args.workers,
+            chunk_size=args.chunk_size,
+            config_path=args.config,
+            cache_spec=cache_spec(args),
+            trace=args.trace,
+            sections=args.sections,
+            fail_fast=args.fail_fast,
+            top=args.top
+        )
+    report = ValidationReport(args.top)
+    for path, content in iter_input_files(args):
+        for result in file_results(validator, path, content):
+            report.add(result)
+    return report
+
+def run_ranged(validator, args):
+    # --shard, --checkpoint and --index read one memory-mapped NDJSON file.
+    if args.multi or not args.input:
+        raise ValueError("--shard, --checkpoint and --index need one NDJSON input file")
+    if args.report:
+        if args.checkpoint:
+            raise ValueError("--report cannot be combined with --checkpoint")
+        records = shard_records(args.input, args.shard, args.index)
+        if args.workers > 0:
+            report = run_report_parallel(records, args)
         else:
-            data = json.load(sys.stdin)
-        if isinstance(data, list):
-            results = [validator.validate(item) for item in data]
+            report = ValidationReport(args.top)
+            for raw in records:
+                report.add(validate_raw(validator, raw))
+        out = JSONWriter(sys.stdout, args.output_format)
+        out.write(report.to_dict())
+        out.flush()
+        return
+
+    def validate_lines(raws):
+        if args.workers > 0:
+            # A checkpoint marks a prefix of the input as done, so its
+            # results must be written in input order.
+            return validate_parallel(
+                raws,
+                args.workers,
+                chunk_size=args.chunk_size,
+                ordered=not args.unordered or bool(args.checkpoint),
+                config_path=args.config,
+                cache_spec=cache_spec(args),
+                trace=args.trace,
+                sections=args.sections,
+                fail_fast=args.fail_fast
+            )
+        return (dumpb(validate_raw(validator, raw).to_dict()) for raw in raws)
+
+    if args.checkpoint:
+        summary = run_ndjson(
+            args.input, validate_lines, args.checkpoint, args.shard, args.index,
+            args.checkpoint_every
+        )
+        print(json.dumps({"checkpoint": summary}), file=sys.stderr)
+        return
+    out = JSONWriter(sys.stdout, "ndjson")
+    for line in validate_lines(shard_records(args.input, args.shard, args.index)):
+        out.write_line(line)
+    out.flush()
+
+def run_pipeline(validator, args):
+    if args.report or args.shard or args.checkpoint or args.index:
+        raise ValueError("--pipeline cannot be combined with --report, --shard, --checkpoint or --index")
+    pipeline = ValidationPipeline(
+        validator,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        read_threads=args.read_threads,
+        decode_threads=args.decode_threads,
+        validate_tasks=args.validate_tasks,
+        queue_depth=args.queue_depth,
+        ordered=not args.unordered,
+        initargs=(args.config, cache_spec(args), args.trace, args.sections, args.fail_fast),
+        trace=args.trace
+    )
+    out = JSONWriter(sys.stdout, "ndjson")
+    if args.multi:
+        metrics = pipeline.run(expand_paths(args.inputs), out, files=True)
+    elif args.input:
+        with open(args.input, 'rb') as f:
+            metrics = pipeline.run(iter_raw_records(f, args.input_format), out)
+    else:
+        metrics = pipeline.run(iter_raw_records(sys.stdin.buffer, args.input_format), out)
+    print(json.dumps({"pipeline": metrics}), file=sys.stderr)
+
+def write_metrics(args):
+    report = TRACER.dump(args.metrics_format)
+    if args.metrics_out:
+        with open(args.metrics_out, "w", encoding="utf-8") as f:
+            f.write(report)
+    else:
+        print(report, file=sys.stderr)
+
+def run(args):
+    if args.merge_reports:
+        reports = []
+        for path in args.merge_reports:
+            with open(path, 'rb') as f:
+                reports.append(load(f))
+        JSONWriter(sys.stdout, args.output_format).write(merge_reports(reports, args.top).to_dict())
+        return
+    spec = cache_spec(args)
+    validator = ResumeValidator(
+        args.config,
+        cache=make_cache(*spec) if spec else None,
+        trace=args.trace,
+        sections=args.sections,
+        fail_fast=args.fail_fast
+    )
+    if args.pipeline:
+        run_pipeline(validator, args)
+        return
+    if args.shard or args.checkpoint or args.index:
+        run_ranged(validator, args)
+        return
+    if args.report:
+        out = JSONWriter(sys.stdout, args.output_format)
+        if args.multi:
+            report = report_files(validator, args)
+        elif args.workers > 0:
+            if args.input:
+                with open(args.input, 'rb') as f:
+                    report = run_report_parallel(iter_raw_records(f, args.input_format), args)
+            else:
+                report = run_report_parallel(
+                    iter_raw_records(sys.stdin.buffer, args.input_format), args
+                )
+        elif args.input:
+            with open(args.input, 'r', encoding='utf-8') as f:
+                report = run_report(validator, f, args.input_format, args.top)
         else:
-            results = validator.validate(data)
-        print(json.dumps(results, indent=2, ensure_ascii=False))
-    except FileNotFoundError:
-        print(json.dumps({"error": f"File not found: {sys.argv[1]}"}), file=sys.stderr)
+            report = run_report(validator, sys.stdin, args.input_format, args.top)
+        out.write(report.to_dict())
+        out.flush()
+        return
+    if args.workers > 0 or args.stream:
+        out = JSONWriter(sys.stdout, "ndjson")
+    else:
+        out = JSONWriter(sys.stdout, args.output_format)
+    if args.multi:
+        run_files(validator, args, out)
+        return
+    if args.workers > 0:
+        if args.input:
+            with open(args.input, 'rb') as f:
+                run_parallel(iter_raw_records(f, args.input_format), args, out)
+        else:
+            run_parallel(iter_raw_records(sys.stdin.buffer, args.input_format), args, out)
+        return
+    if args.stream:
+        if args.input:
+            with open(args.input, 'r', encoding='utf-8') as f:
+                run_stream(validator, f, args.input_format, out)
+        else:
+            run_stream(validator, sys.stdin, args.input_format, out)
+        return
+    if args.input:
+        with open(args.input, 'rb') as f:
+            data = load(f)
+    else:
+        data = load(sys.stdin.buffer)
+    if isinstance(data, list) and args.dedup:
+        results, report = validator.validate_batch(data)
+        out.write_all(results)
+        print(json.dumps({"dedup": report}), file=sys.stderr)
+    elif isinstance(data, list):
+        out.write_all(validator.validate(item) for item in data)
+    else:
+        out.write(validator.validate(data))
+    out.flush()
+
+def main():
+    args = parse_args()
+    if args.serve:
+        run_server(
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            queue_size=args.queue_size,
+            config_path=args.config,
+            chunk_size=args.chunk_size,
+            cache_spec=cache_spec(args),
+            trace=args.trace,
+            sections=args.sections,
+            fail_fast=args.fail_fast
+        )
+        return
+    try:
+        run(args)
+        if args.trace:
+            write_metrics(args)
+    except FileNotFoundError as e:
+        print(json.dumps({"error": f"File not found: {e.filename}"}), file=sys.stderr)
         sys.exit(1)
     except json.JSONDecodeError as e:
         print(json.dumps({"error": f"Invalid JSON: {str(e)}"}), file=sys.stderr)
         sys.exit(1)
+    except ValueError as e:
+        print(json.dumps({"error": str(e)}), file=sys.stderr)
+        sys.exit(1)
     except Exception as e:
         print(json.dumps({"error": f"Unexpected error: {str(e)}"}), file=sys.stderr)
         sys.exit(1)
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
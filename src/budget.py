@@ -0,0 +1,101 @@
+import time
+from collections import namedtuple
+
+# Per-record work limits. A record nested deeper or holding more values than
+# allowed, or one whose time runs out while it is being validated, gets the
+# status BUDGET_EXCEEDED instead of a result: bounding the worst record
+# keeps tail latency in check, at the cost of not validating giant
+# outliers. A limit of 0 turns that limit off; all of them are off unless
+# configured.
+
+BUDGET_EXCEEDED = "BUDGET_EXCEEDED"
+DEFAULT_MAX_DEPTH = 0
+DEFAULT_MAX_NODES = 0
+DEFAULT_MAX_TIME_MS = 0
+
+Budget = namedtuple("Budget", ["max_depth", "max_nodes", "max_time_ms"])
+
+DEFAULT_BUDGET = Budget(DEFAULT_MAX_DEPTH, DEFAULT_MAX_NODES, DEFAULT_MAX_TIME_MS)
+
+class BudgetExceeded(Exception):
+    pass
+
+def make_budget(rules):
+    limits = []
+    for name, default in zip(Budget._fields, DEFAULT_BUDGET):
+        value = rules.get(name, default)
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+            raise ValueError(f"Invalid {name}: {value!r} (expected a number >= 0)")
+        limits.append(value)
+    return Budget(*limits)
+
+class Deadline:
+    # The walks of every stage take one and call check() as they open each
+    # container, so a single slow stage cannot run far past the limit.
+    __slots__ = ("at", "max_time_ms")
+
+    def __init__(self, max_time_ms):
+        self.at = time.perf_counter() + max_time_ms / 1000
+        self.max_time_ms = max_time_ms
+
+    def check(self):
+        if time.perf_counter() > self.at:
+            raise BudgetExceeded(f"Validation took longer than {self.max_time_ms} ms")
+
+def start_deadline(budget):
+    if not budget.max_time_ms:
+        return None
+    return Deadline(budget.max_time_ms)
+
+def check_deadline(deadline):
+    if deadline is not None:
+        deadline.check()
+
+def check_document(data, budget, deadline=None, depth=1):
+    # One walk over data that raises BudgetExceeded at the first limit it
+    # crosses; the validator runs it before anything else reads the record.
+    # depth is that of data itself when it sits inside a larger document.
+    max_depth = budget.max_depth
+    max_nodes = budget.max_nodes
+    if not (max_depth or max_nodes) or not isinstance(data, (dict, list)):
+        return
+    nodes = 1
+    stack = [(data, depth)]
+    while stack:
+        obj, depth = stack.pop()
+        values = obj.values() if isinstance(obj, dict) else obj
+        nodes += len(values)
+        if max_nodes and nodes > max_nodes:
+            raise BudgetExceeded(f"Document has more than {max_nodes} values")
+        if deadline is not None:
+            deadline.check()
+        at_limit = max_depth and depth >= max_depth
+        for value in values:
+            if isinstance(value, (dict, list)):
+                if at_limit:
+                    raise BudgetExceeded(f"Document is nested deeper than {max_depth} levels")
+                stack.append((value, depth + 1))
+
+def check_changes(document, changes, budget, missing=None, deadline=None):
+    # check_document for an edited document that passed it before the edit,
+    # given the (path tokens, old value, new value) changes: only values the
+    # edit wrote can be nested too deep, one at a path of n keys sitting at
+    # depth n + 1. A later operation of the edit may have removed a value
+    # that is too deep, so the verdict on one is left to the full walk, as
+    # is the node limit, which counts the whole document.
+    if budget.max_nodes:
+        check_document(document, budget, deadline)
+        return
+    max_depth = budget.max_depth
+    if not max_depth:
+        return
+    for tokens, old, new in changes:
+        if new is missing or not isinstance(new, (dict, list)):
+            continue
+        try:
+            if len(tokens) + 1 > max_depth:
+                raise BudgetExceeded
+            check_document(new, budget, deadline, len(tokens) + 1)
+        except BudgetExceeded:
+            check_document(document, budget, deadline)
+            return
@@ -0,0 +1,115 @@
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from . import codec
+
+DEFAULT_CACHE_ENTRIES = 100000
+# Bumped whenever the layout of cached results changes, so a persistent
+# cache never hands back an entry written in an older layout.
+RESULT_FORMAT = 3
+
+def document_key(document, plan_version):
+    # Key order is part of the document: field lookups take the first
+    # matching key, so reordered keys can give a different result.
+    digest = hashlib.sha256(codec.dumpb(document)).hexdigest()
+    return f"{RESULT_FORMAT}:{plan_version}:{digest}"
+
+class MemoryResultCache:
+    def __init__(self, max_entries=DEFAULT_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+class SQLiteResultCache:
+    # Entries are evicted least-recently-used first once the table grows past
+    # max_entries. Several processes can share one file.
+    def __init__(self, path, max_entries=DEFAULT_CACHE_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, used INTEGER NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS results_used ON results (used)")
+        self._conn.commit()
+        self._clock = self._conn.execute(
+            "SELECT COALESCE(MAX(used), 0) FROM results"
+        ).fetchone()[0]
+        self._count = len(self)
+
+    def _tick(self):
+        self._clock += 1
+        return self._clock
+
+    def get(self, key):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE results SET used = ? WHERE key = ?", (self._tick(), key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, key, value):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, value, used) VALUES (?, ?, ?)",
+                (key, value, self._tick())
+            )
+            self._count += 1
+            if self._count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM results WHERE key IN ("
+                    "SELECT key FROM results ORDER BY used LIMIT "
+                    "MAX((SELECT COUNT(*) FROM results) - ?, 0))",
+                    (self.max_entries,)
+                )
+                self._count = len(self)
+            self._conn.commit()
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self):
+        self._conn.close()
+
+def make_cache(db_path=None, max_entries=DEFAULT_CACHE_ENTRIES):
+    if db_path:
+        return SQLiteResultCache(db_path, max_entries)
+    if max_entries > 0:
+        return MemoryResultCache(max_entries)
+    return None
@@ -0,0 +1,223 @@
+import os
+import mmap
+import json
+import struct
+from array import array
+from bisect import bisect_left
+from collections import deque
+
+# Resumable, shardable runs over one NDJSON file. The file is memory-mapped
+# and processed by byte range: a record belongs to the shard its first byte
+# falls in, so any machine can find its slice from the file size alone.
+# Results go to an output file whose committed length is checkpointed
+# together with the input offset of the next record.
+
+DEFAULT_CHECKPOINT_EVERY = 1000
+INDEX_SUFFIX = ".idx"
+CHECKPOINT_SUFFIX = ".ckpt"
+_INDEX_MAGIC = b"RVIDX1\0\0"
+_INDEX_HEADER = struct.Struct("<8sQQQ")
+
+def parse_shard(value):
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard {value!r}: expected i/N, e.g. 0/4")
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid shard {value!r}: need 0 <= i < N")
+    return index, count
+
+def build_index(data, size):
+    # Start offsets of every non-blank line.
+    offsets = array("Q")
+    pos = 0
+    while pos < size:
+        newline = data.find(b"\n", pos)
+        stop = size if newline < 0 else newline + 1
+        if data[pos:stop].strip():
+            offsets.append(pos)
+        pos = stop
+    return offsets
+
+def load_index(path, data, stat):
+    # Reuses <path>.idx when it was built for this very file (same size and
+    # mtime), otherwise builds it and tries to save it for the next run.
+    index_path = path + INDEX_SUFFIX
+    try:
+        with open(index_path, "rb") as f:
+            magic, size, mtime_ns, count = _INDEX_HEADER.unpack(f.read(_INDEX_HEADER.size))
+            if magic == _INDEX_MAGIC and size == stat.st_size and mtime_ns == stat.st_mtime_ns:
+                offsets = array("Q")
+                offsets.fromfile(f, count)
+                return offsets
+    except (OSError, struct.error, EOFError):
+        pass
+    offsets = build_index(data, stat.st_size)
+    try:
+        with open(index_path + ".tmp", "wb") as f:
+            f.write(_INDEX_HEADER.pack(_INDEX_MAGIC, stat.st_size, stat.st_mtime_ns, len(offsets)))
+            offsets.tofile(f)
+        os.replace(index_path + ".tmp", index_path)
+    except OSError:
+        pass
+    return offsets
+
+def _align(data, size, offset, index=None):
+    # The first record start at or after offset.
+    if offset <= 0:
+        return 0
+    if offset >= size:
+        return size
+    if index is not None:
+        position = bisect_left(index, offset)
+        return index[position] if position < len(index) else size
+    newline = data.find(b"\n", offset - 1)
+    return size if newline < 0 else newline + 1
+
+def shard_range(data, size, shard=None, index=None):
+    part, count = shard or (0, 1)
+    return (
+        _align(data, size, size * part // count, index),
+        _align(data, size, size * (part + 1) // count, index)
+    )
+
+def iter_range(data, start, end):
+    # Yields (end offset, raw line) for each non-blank line in [start, end).
+    pos = start
+    while pos < end:
+        newline = data.find(b"\n", pos, end)
+        stop = end if newline < 0 else newline + 1
+        line = data[pos:stop].strip()
+        if line:
+            yield stop, line
+        pos = stop
+
+class NDJSONShard:
+    # A memory-mapped NDJSON file narrowed to the byte range of one shard.
+    def __init__(self, path, shard=None, use_index=False):
+        self.path = path
+        self.shard = shard or (0, 1)
+        self.use_index = use_index
+        self.data = b""
+        self.index = None
+
+    def __enter__(self):
+        with open(self.path, "rb") as f:
+            self.stat = os.fstat(f.fileno())
+            self.size = self.stat.st_size
+            if self.size:
+                self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.use_index:
+            self.index = load_index(self.path, self.data, self.stat)
+        self.start, self.end = shard_range(self.data, self.size, self.shard, self.index)
+        return self
+
+    def __exit__(self, *exc):
+        if self.size:
+            self.data.close()
+
+    @property
+    def name(self):
+        return f"{self.shard[0]}/{self.shard[1]}"
+
+    def count(self):
+        # Records in the shard, known without reading it only with an index.
+        if self.index is None:
+            return None
+        return bisect_left(self.index, self.end) - bisect_left(self.index, self.start)
+
+    def records(self, start=None):
+        return iter_range(self.data, self.start if start is None else start, self.end)
+
+def shard_records(path, shard=None, use_index=False):
+    with NDJSONShard(path, shard, use_index) as part:
+        for _, raw in part.records():
+            yield raw
+
+class Checkpoint:
+    def __init__(self, path, identity):
+        self.path = path
+        self.identity = identity
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        except ValueError as e:
+            raise ValueError(f"Unreadable checkpoint {self.path}: {str(e)}")
+        for key, value in self.identity.items():
+            if state.get(key) != value:
+                raise ValueError(
+                    f"Checkpoint {self.path} was written for a different run "
+                    f"({key}: {state.get(key)!r}, now {value!r}); remove it to start over"
+                )
+        return state
+
+    def save(self, offset, output_size, records, done=False):
+        state = dict(
+            self.identity, offset=offset, output_size=output_size,
+            records=records, done=done
+        )
+        with open(self.path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(self.path + ".tmp", self.path)
+        return state
+
+def _commit(out, checkpoint, offset, records, done=False):
+    out.flush()
+    os.fsync(out.fileno())
+    return checkpoint.save(offset, out.tell(), records, done)
+
+def run_ndjson(path, validate_lines, output, shard=None, use_index=False,
+               every=DEFAULT_CHECKPOINT_EVERY):
+    # validate_lines maps an iterable of raw records to one encoded result
+    # line each, in order. Results are appended to `output`, resuming after
+    # its last checkpoint if there is one. Returns a summary of the run.
+    if every < 1:
+        raise ValueError(f"Invalid checkpoint interval: {every} (expected >= 1)")
+    with NDJSONShard(path, shard, use_index) as part:
+        summary = {"input": path, "shard": part.name, "start": part.start, "end": part.end}
+        if part.index is not None:
+            summary["total"] = part.count()
+        checkpoint = Checkpoint(output + CHECKPOINT_SUFFIX, {
+            "input": os.path.abspath(path),
+            "size": part.size,
+            "mtime_ns": part.stat.st_mtime_ns,
+            "shard": part.name
+        })
+        state = checkpoint.load()
+        start, records = part.start, 0
+        if state is not None and os.path.exists(output):
+            summary["resumed_at"] = state["offset"]
+            if state["done"]:
+                summary["records"] = state["records"]
+                return summary
+            start, records = state["offset"], state["records"]
+            out = open(output, "r+b")
+            # Anything written after the last checkpoint is redone.
+            out.truncate(state["output_size"])
+            out.seek(state["output_size"])
+        else:
+            out = open(output, "wb")
+        with out:
+            ends = deque()
+
+            def raws():
+                for stop, raw in part.records(start):
+                    ends.append(stop)
+                    yield raw
+
+            for line in validate_lines(raws()):
+                out.write(line + b"\n")
+                records += 1
+                if records % every == 0:
+                    _commit(out, checkpoint, ends.popleft(), records)
+                else:
+                    ends.popleft()
+            _commit(out, checkpoint, part.end, records, done=True)
+        summary["records"] = records
+        return summary
@@ -0,0 +1,118 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Output layouts: "pretty" matches json.dumps(indent=2), "compact" has no
+# whitespace, "ndjson" writes one compact document per line.
+OUTPUT_MODES = ("pretty", "compact", "ndjson")
+BACKEND = "orjson" if orjson else "json"
+
+def _std_dumps(obj, mode="compact", sort_keys=False, ensure_ascii=False):
+    if mode == "pretty":
+        return json.dumps(obj, indent=2, ensure_ascii=ensure_ascii, sort_keys=sort_keys)
+    return json.dumps(
+        obj, separators=(",", ":"), ensure_ascii=ensure_ascii, sort_keys=sort_keys
+    )
+
+def _std_dumpb(obj, mode="compact", sort_keys=False):
+    try:
+        return _std_dumps(obj, mode, sort_keys).encode("utf-8")
+    except UnicodeEncodeError:
+        # Lone surrogates have no UTF-8 form; escape them instead.
+        return _std_dumps(obj, mode, sort_keys, ensure_ascii=True).encode("ascii")
+    except RecursionError as e:
+        raise ValueError(str(e))
+
+def _std_loads(data):
+    try:
+        return json.loads(data)
+    except RecursionError as e:
+        # Nesting deeper than the interpreter allows is bad input, not a
+        # crash of the whole run.
+        raise ValueError(str(e))
+
+if orjson:
+    def loads(data):
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects a few things the stdlib accepts (NaN, integers
+            # wider than 64 bits), and the stdlib message is the one users
+            # already know, so let it have the final say.
+            if isinstance(data, (bytes, bytearray)):
+                data = data.decode("utf-8")
+            return _std_loads(data)
+
+    def dumpb(obj, mode="compact", sort_keys=False):
+        option = orjson.OPT_INDENT_2 if mode == "pretty" else 0
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            # Lone surrogates, oversized integers and the like.
+            return _std_dumpb(obj, mode, sort_keys)
+else:
+    def loads(data):
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        return _std_loads(data)
+
+    dumpb = _std_dumpb
+
+def dumps(obj, mode="compact", sort_keys=False):
+    return dumpb(obj, mode, sort_keys).decode("utf-8")
+
+def load(stream):
+    return loads(stream.read())
+
+def binary_stream(stream):
+    return getattr(stream, "buffer", stream)
+
+class JSONWriter:
+    # Writes encoded results straight to a binary stream, so a large batch
+    # is never joined into one string. A list written in "pretty" or
+    # "compact" mode is streamed element by element as one JSON array.
+    def __init__(self, stream, mode="pretty"):
+        if mode not in OUTPUT_MODES:
+            raise ValueError(f"Unknown output mode: {mode}")
+        self.stream = binary_stream(stream)
+        self.mode = mode
+
+    def write(self, obj):
+        if self.mode == "ndjson":
+            self.stream.write(dumpb(obj) + b"\n")
+        else:
+            self.stream.write(dumpb(obj, self.mode) + b"\n")
+
+    def write_line(self, line):
+        if isinstance(line, str):
+            line = line.encode("utf-8")
+        self.stream.write(line + b"\n")
+
+    def write_all(self, items):
+        if self.mode == "ndjson":
+            for item in items:
+                self.stream.write(dumpb(item) + b"\n")
+            return
+        pretty = self.mode == "pretty"
+        # JSON strings cannot hold a raw newline, so indenting every line
+        # of an element nests it exactly as json.dumps(indent=2) would.
+        opening, separator, closing = (b"[\n  ", b",\n  ", b"\n]\n") if pretty else (b"[", b",", b"]\n")
+        first = True
+        for item in items:
+            data = dumpb(item, self.mode)
+            if pretty:
+                data = data.replace(b"\n", b"\n  ")
+            self.stream.write(opening if first else separator)
+            self.stream.write(data)
+            first = False
+        self.stream.write(b"[]\n" if first else closing)
+
+    def flush(self):
+        self.stream.flush()
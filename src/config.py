@@ -0,0 +1,15 @@
+import os
+import yaml
+
+DEFAULT_CONFIG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "config.yaml"
+)
+
+def load_config(path=None):
+    if path is None:
+        if not os.path.exists(DEFAULT_CONFIG_PATH):
+            return {}
+        path = DEFAULT_CONFIG_PATH
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
@@ -0,0 +1,88 @@
+import re
+import calendar
+from datetime import datetime
+from functools import lru_cache
+
+DEFAULT_DATE_FORMATS = [
+    "%Y-%m-%d", "%Y-%m", "%Y",
+    "%d/%m/%Y", "%m/%d/%Y",
+    "%d-%m-%Y", "%m-%d-%Y",
+    "%Y/%m/%d",
+    "%b %Y", "%B %Y",
+    "%d %b %Y", "%d %B %Y",
+    "%b %d, %Y", "%B %d, %Y",
+    "%Y.%m.%d", "%d.%m.%Y"
+]
+DEFAULT_CACHE_SIZE = 65536
+
+def _names(values):
+    return "|".join(sorted((v.lower() for v in values if v), key=len, reverse=True))
+
+# Same shapes strptime accepts for each directive. Anything not listed
+# falls back to a wildcard, which keeps the dispatch regex a superset of
+# what strptime would accept for that format.
+DIRECTIVE_PATTERNS = {
+    "Y": r"\d\d\d\d",
+    "y": r"\d\d",
+    "m": r"1[0-2]|0[1-9]|[1-9]",
+    "d": r"3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9]",
+    "b": _names(calendar.month_abbr),
+    "B": _names(calendar.month_name),
+    "%": "%"
+}
+
+def format_regex(fmt):
+    parts = []
+    i = 0
+    while i < len(fmt):
+        ch = fmt[i]
+        if ch == "%" and i + 1 < len(fmt):
+            parts.append("(?:%s)" % DIRECTIVE_PATTERNS.get(fmt[i + 1], ".*?"))
+            i += 2
+        elif ch.isspace():
+            while i < len(fmt) and fmt[i].isspace():
+                i += 1
+            parts.append(r"\s+")
+        else:
+            parts.append(re.escape(ch))
+            i += 1
+    return "".join(parts)
+
+class DateParser:
+    def __init__(self, formats=None, cache_size=DEFAULT_CACHE_SIZE):
+        self.formats = tuple(formats or DEFAULT_DATE_FORMATS)
+        # One alternative per format; the index of the group that matched is
+        # the first format strptime could possibly accept.
+        self._dispatch = re.compile(
+            "|".join(
+                "(%s)\\Z" % format_regex(fmt) for fmt in self.formats
+            ),
+            re.IGNORECASE
+        )
+        self.parse = lru_cache(maxsize=cache_size)(self._parse)
+
+    def _parse(self, text):
+        if text.lower() in ("null", "none", ""):
+            return None
+        match = self._dispatch.match(text)
+        if match is None:
+            return None
+        for fmt in self.formats[match.lastindex - 1:]:
+            try:
+                return datetime.strptime(text, fmt)
+            except ValueError:
+                continue
+        return None
+
+    def cache_info(self):
+        return self.parse.cache_info()
+
+_shared_parsers = {}
+
+def shared_date_parser(formats=None):
+    key = tuple(formats or DEFAULT_DATE_FORMATS)
+    parser = _shared_parsers.get(key)
+    if parser is None:
+        parser = DateParser(key)
+        _shared_parsers[key] = parser
+    return parser
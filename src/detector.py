@@ -2,72 +2,73 @@ from .utils import (
     validate_email, validate_phone, is_null_or_empty,
     extract_phone_from_object, extract_email_from_object
 )
-
-def normalize_key(key):
-    return (
-        key.lower()
-        .replace(" ", "_")
-        .replace("-", "_")
-    )
+from .matcher import MATCHER, normalize_key
+from weakref import WeakKeyDictionary
 
 def key_matches(key, patterns):
-    normalized_key = normalize_key(key)
-
-    for pattern in patterns:
-        pattern_norm = normalize_key(pattern)
-        if normalized_key == pattern_norm:
-            return True
-        if normalized_key.startswith(pattern_norm + "_"):
-            return True
-        if normalized_key.endswith("_" + pattern_norm):
-            return True
-    return False
+    return MATCHER.matches(key, patterns)
+
+# The traversals below keep their own stack instead of recursing, so no
+# document is too deep for them. Walks that stop at the first match push
+# children in reverse; walks that carry state down the tree keep one
+# iterator per open container. Either way values are visited in the order
+# of a recursive depth-first walk. Walks that take a deadline (see
+# budget.Deadline) check it as they open each container.
+
+_DONE = object()
+_NO_KEY = object()
+
+def _members(obj):
+    # (key, value) pairs of an object; list items are keyed "list_item".
+    if isinstance(obj, dict):
+        return iter(obj.items())
+    return (("list_item", item) for item in obj)
 
 def find_field(data, possible_names):
-    if isinstance(data, dict):
-        for key, value in data.items():
-            if key_matches(key, possible_names):
-                return value
-        for value in data.values():
-            result = find_field(value, possible_names)
-            if result is not None:
-                return result
-    elif isinstance(data, list):
-        for item in data:
-            result = find_field(item, possible_names)
-            if result is not None:
-                return result
+    compiled = MATCHER.affix_set(possible_names)
+    candidates = MATCHER.candidates
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            for key, value in obj.items():
+                if not candidates(key).isdisjoint(compiled):
+                    if value is not None:
+                        return value
+                    break
+            else:
+                stack.extend(reversed(obj.values()))
+        elif isinstance(obj, list):
+            stack.extend(reversed(obj))
     return None
 
+def looks_like_link(value):
+    value = value.lower()
+    return (
+        "http" in value or "www." in value or ".com" in value
+        or ".io" in value or ".dev" in value
+        or "github" in value or "linkedin" in value
+    )
+
 def find_all_links(data):
     links = []
-    def search(obj):
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                if isinstance(value, str):
-                    if any(domain in value.lower() for domain in [
-                        "http", "www.", ".com", ".io", ".dev",
-                        "github", "linkedin"
-                    ]):
-                        links.append((key, value))
-                else:
-                    search(value)
-        elif isinstance(obj, list):
-            for item in obj:
-                if isinstance(item, str):
-                    if any(domain in item.lower() for domain in [
-                        "http", "www.", ".com", ".io", ".dev",
-                        "github", "linkedin"
-                    ]):
-                        links.append(("list_item", item))
-                else:
-                    search(item)
-    search(data)
+    if not isinstance(data, (dict, list)):
+        return links
+    stack = [_members(data)]
+    while stack:
+        for key, value in stack[-1]:
+            if isinstance(value, str):
+                if looks_like_link(value):
+                    links.append((key, value))
+            elif isinstance(value, (dict, list)):
+                stack.append(_members(value))
+                break
+        else:
+            stack.pop()
     return links
 
-def detect_all_sections(data):
-    section_patterns = {
-         "experience": [
+SECTION_PATTERNS = {
+    "experience": [
         "experience", "experiences",
         "work", "work_history", "workhistory",
         "employment", "employment_history",
@@ -145,82 +146,517 @@ def detect_all_sections(data):
         "professional_summary",
         "career_objective"
     ]
-    }
+}
+
+BASIC_INFO_PATTERNS = {
+    "candidate_id": ["candidate_id", "id", "userId", "user_id", "candidateId", "applicant_id"],
+    "name": ["name", "full_name", "fullName", "candidate_name", "applicant_name"],
+    "contact": ["contact", "contacts", "basics", "personal_info", "personal"],
+    "email": ["email", "email_id", "emailId", "mail", "emails", "e-mail"],
+    "phone": ["phone", "mobile", "phone_number", "telephone", "tel", "contact_number"],
+    "first_name": ["first_name", "firstname"],
+    "last_name": ["last_name", "lastname"]
+}
+
+PLATFORM_FIELDS = [
+    "linkedin", "github", "portfolio",
+    "website", "youtube", "twitter",
+    "leetcode", "codeforces",
+    "codechef", "hackerrank",
+    "stackoverflow", "medium",
+    "blog"
+]
+PLATFORM_PATTERNS = {
+    field: [
+        field,
+        field + "_profile",
+        field + "_url",
+        field + "_link",
+        field + "Url",
+        field + "Link"
+    ]
+    for field in PLATFORM_FIELDS
+}
+
+SECTION_TABLE = MATCHER.register_table("section", SECTION_PATTERNS)
+BASIC_INFO_TABLE = MATCHER.register_table("basic", BASIC_INFO_PATTERNS)
+DOCUMENT_TABLE = SECTION_TABLE + BASIC_INFO_TABLE
+PLATFORM_TABLE = MATCHER.register_table("platform", PLATFORM_PATTERNS)
+
+def find_fields(data, table, matcher=MATCHER, exact=False, deadline=None):
+    # Resolves every slot of a compiled table in one walk. Each slot gets the
+    # same value find_field would return for its pattern list on its own, or
+    # with exact=True, what rules.get_field would.
+    found = {}
+    slots_for = matcher.exact_slots if exact else matcher.affix_slots
+    # Most keys match nothing and most values are scalars, so both are let
+    # through with as little work as possible. A frame is [children,
+    # pending, len(found) when pending was last narrowed]; pending is only
+    # rebuilt once something was found below.
+    stack = [[iter((data,)), frozenset(table), 0]]
+    while stack:
+        frame = stack[-1]
+        if frame[2] != len(found):
+            frame[1] = frame[1].difference(found)
+            frame[2] = len(found)
+        pending = frame[1]
+        if not pending:
+            stack.pop()
+            continue
+        for obj in frame[0]:
+            if isinstance(obj, dict):
+                if deadline is not None:
+                    deadline.check()
+                local = {}
+                for key, value in obj.items():
+                    slots = slots_for(key)
+                    if slots and not slots.isdisjoint(pending):
+                        for slot in slots & pending:
+                            if slot not in local:
+                                local[slot] = value
+                if local:
+                    for slot, value in local.items():
+                        if value is not None:
+                            found[slot] = value
+                    pending = pending.difference(local)
+                stack.append([iter(obj.values()), pending, len(found)])
+                break
+            if isinstance(obj, list):
+                if deadline is not None:
+                    deadline.check()
+                stack.append([iter(obj), pending, len(found)])
+                break
+        else:
+            stack.pop()
+    return found
+
+def _steps(path, obj):
+    # (path, value) for each member of an object or list.
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            yield path + (key,), value
+    else:
+        for index, item in enumerate(obj):
+            yield path + (index,), item
+
+def find_paths(data, table, matcher=MATCHER, exact=False, deadline=None):
+    # find_fields, but returns {slot: (path, value)}; a path is the keys and
+    # list indices leading from data to the value. Frames also hold the
+    # path of their container.
+    found = {}
+    slots_for = matcher.exact_slots if exact else matcher.affix_slots
+    stack = [[iter((((), data),)), frozenset(table), 0]]
+    while stack:
+        frame = stack[-1]
+        if frame[2] != len(found):
+            frame[1] = frame[1].difference(found)
+            frame[2] = len(found)
+        pending = frame[1]
+        if not pending:
+            stack.pop()
+            continue
+        for path, obj in frame[0]:
+            if isinstance(obj, dict):
+                local = {}
+                for key, value in obj.items():
+                    slots = slots_for(key)
+                    if slots and not slots.isdisjoint(pending):
+                        for slot in slots & pending:
+                            if slot not in local:
+                                local[slot] = (path + (key,), value)
+                if local:
+                    for slot, hit in local.items():
+                        if hit[1] is not None:
+                            found[slot] = hit
+                    pending = pending.difference(local)
+            elif not isinstance(obj, list):
+                continue
+            if deadline is not None:
+                deadline.check()
+            stack.append([_steps(path, obj), pending, len(found)])
+            break
+        else:
+            stack.pop()
+    return found
+
+# Documents exported from the same template share their key structure, and
+# find_fields only depends on that structure: the keys of every object in
+# order, the items of every list, and which values are null. A document's
+# shape captures exactly that, except that a list item whose shape repeats
+# an earlier item of the same list is left out, since find_fields cannot
+# find anything in it that the earlier item did not already give it. So
+# lists of uniform entries have the same shape whatever their length.
+
+MAX_SHAPE_PLANS = 1024
+SHAPE_WINDOW = 256
+SHAPE_BYPASS = 4096
+# Shapes nest as deep as the document, and hashing one costs time in
+# proportion to its size at every list it sits in, so documents nested
+# deeper than this are not fingerprinted.
+MAX_SHAPE_DEPTH = 64
+
+def document_shape(obj, lists, positions, deadline=None):
+    # lists collects, in preorder, the original indices of the items each
+    # kept list retains; positions maps id(list) to its place in lists.
+    # Frames are [0, values, shapes, keys] for objects and [1, items,
+    # shapes, list number, seen, kept, item index, mark] for lists, where
+    # mark is len(lists) before the current item was opened. Returns None
+    # for a document nested deeper than MAX_SHAPE_DEPTH.
+    stack = []
+    while True:
+        if isinstance(obj, (dict, list)):
+            if len(stack) >= MAX_SHAPE_DEPTH:
+                return None
+            if deadline is not None:
+                deadline.check()
+        if isinstance(obj, dict):
+            stack.append([0, iter(obj.values()), [], tuple(obj)])
+            shape = None
+        elif isinstance(obj, list):
+            number = len(lists)
+            lists.append(None)
+            positions[id(obj)] = number
+            stack.append([1, iter(obj), [], number, set(), [], 0, 0])
+            shape = None
+        else:
+            shape = 2 if obj is None else 3
+        # Hand finished shapes up until some container has another child.
+        while stack:
+            frame = stack[-1]
+            if shape is not None:
+                if frame[0] == 0:
+                    frame[2].append(shape)
+                else:
+                    if shape in frame[4]:
+                        del lists[frame[7]:]
+                    else:
+                        frame[4].add(shape)
+                        frame[5].append(frame[6])
+                        frame[2].append(shape)
+                    frame[6] += 1
+            obj = next(frame[1], _DONE)
+            if obj is not _DONE:
+                if frame[0] == 1:
+                    frame[7] = len(lists)
+                break
+            stack.pop()
+            if frame[0] == 0:
+                shape = (0, frame[3], tuple(frame[2]))
+            else:
+                lists[frame[3]] = frame[5]
+                shape = (1, tuple(frame[2]))
+        else:
+            return shape
+
+def _plan_steps(data, path, lists, positions):
+    # Rewrites list indices on a path as (list number, kept item number),
+    # which mean the same item in any document of the same shape.
+    steps = []
+    obj = data
+    for step in path:
+        if isinstance(obj, list):
+            number = positions[id(obj)]
+            steps.append((number, lists[number].index(step)))
+        else:
+            steps.append(step)
+        obj = obj[step]
+    return tuple(steps)
+
+def _follow(data, steps, lists):
+    obj = data
+    for step in steps:
+        if isinstance(step, tuple):
+            obj = obj[lists[step[0]][step[1]]]
+        else:
+            obj = obj[step]
+    return obj
+
+class ShapePlanCache:
+    # find_fields for one matcher and table, remembering for each document
+    # shape the path of every slot it found. When too few documents repeat
+    # a shape, fingerprinting is switched off for a while.
+    def __init__(self, table, matcher=MATCHER, exact=False, max_plans=MAX_SHAPE_PLANS):
+        self.table = table
+        self.matcher = matcher
+        self.exact = exact
+        self.max_plans = max_plans
+        self.plans = {}
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self._window = [0, 0]
+        self._bypass = 0
+
+    def find_fields(self, data, deadline=None):
+        if self._bypass:
+            self._bypass -= 1
+            self.bypassed += 1
+            return find_fields(data, self.table, self.matcher, self.exact, deadline)
+        lists = []
+        positions = {}
+        shape = document_shape(data, lists, positions, deadline)
+        if shape is None:
+            return find_fields(data, self.table, self.matcher, self.exact, deadline)
+        plan = self.plans.get(shape)
+        self._count(plan is not None)
+        if plan is not None:
+            self.hits += 1
+            return {slot: _follow(data, steps, lists) for slot, steps in plan.items()}
+        self.misses += 1
+        found = find_paths(data, self.table, self.matcher, self.exact, deadline)
+        if len(self.plans) >= self.max_plans:
+            self.plans.clear()
+        self.plans[shape] = {
+            slot: _plan_steps(data, path, lists, positions)
+            for slot, (path, _) in found.items()
+        }
+        return {slot: value for slot, (_, value) in found.items()}
+
+    def _count(self, hit):
+        window = self._window
+        window[0] += hit
+        window[1] += 1
+        if window[1] >= SHAPE_WINDOW:
+            if window[0] * 8 < window[1]:
+                self._bypass = SHAPE_BYPASS
+            window[0] = window[1] = 0
+
+    def stats(self):
+        return {
+            "plans": len(self.plans),
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed
+        }
+
+_shape_caches = WeakKeyDictionary()
+
+def shape_cache(table, matcher=MATCHER, exact=False):
+    caches = _shape_caches.get(matcher)
+    if caches is None:
+        caches = _shape_caches[matcher] = {}
+    cache = caches.get((table, exact))
+    if cache is None:
+        cache = caches[(table, exact)] = ShapePlanCache(table, matcher, exact)
+    return cache
+
+def shape_cache_stats():
+    # ShapePlanCache.stats() summed over every live cache.
+    totals = {"plans": 0, "hits": 0, "misses": 0, "bypassed": 0}
+    for caches in list(_shape_caches.values()):
+        for cache in caches.values():
+            for name, value in cache.stats().items():
+                totals[name] += value
+    return totals
+
+def scan_links(data, table=PLATFORM_TABLE, matcher=MATCHER, deadline=None):
+    # One walk that returns what find_all_links(data) returns, plus the value
+    # find_field would pick for every platform slot of the table.
+    links = []
+    found = {}
+    slots_for = matcher.affix_slots
+    stack = []
+    obj, pending = data, frozenset(table)
+    while True:
+        if isinstance(obj, (dict, list)):
+            if deadline is not None:
+                deadline.check()
+            if pending and isinstance(obj, dict):
+                local = {}
+                for key, value in obj.items():
+                    slots = slots_for(key)
+                    if slots and not slots.isdisjoint(pending):
+                        for slot in slots & pending:
+                            if slot not in local:
+                                local[slot] = value
+                for slot, value in local.items():
+                    if value is not None:
+                        found[slot] = value
+                pending = pending.difference(local)
+            stack.append([_members(obj), pending, len(found)])
+        # Find the next container to open, collecting links on the way.
+        while stack:
+            frame = stack[-1]
+            if frame[1] and frame[2] != len(found):
+                frame[1] = frame[1].difference(found)
+                frame[2] = len(found)
+            for key, value in frame[0]:
+                if isinstance(value, str):
+                    if looks_like_link(value):
+                        links.append((key, value))
+                elif isinstance(value, (dict, list)):
+                    obj, pending = value, frame[1]
+                    break
+            else:
+                stack.pop()
+                continue
+            break
+        else:
+            return links, found
+
+def scan_changes(changes, matchers=(MATCHER,), missing=None):
+    # Takes (path tokens, old value, new value) edits and returns every slot
+    # whose key occurs on an edited path or inside an old or new value, and
+    # the link-like strings among those values. A slot that does not occur
+    # cannot have found a different value after the edit.
+    slots = set()
+    links = []
+    affix_slots = [matcher.affix_slots for matcher in matchers]
+    stack = []
+    for tokens, old, new in changes:
+        for token in tokens:
+            for slots_for in affix_slots:
+                slots.update(slots_for(token))
+        # Pairs of (key or _NO_KEY, value), so each key is read just before
+        # its value, as a recursive walk would.
+        if new is not missing:
+            stack.append((_NO_KEY, new))
+        if old is not missing:
+            stack.append((_NO_KEY, old))
+        while stack:
+            key, obj = stack.pop()
+            if key is not _NO_KEY:
+                for slots_for in affix_slots:
+                    slots.update(slots_for(key))
+            if isinstance(obj, dict):
+                stack.extend(reversed(obj.items()))
+            elif isinstance(obj, list):
+                stack.extend((_NO_KEY, item) for item in reversed(obj))
+            elif isinstance(obj, str) and looks_like_link(obj):
+                links.append(obj)
+    return slots, links
+
+def _collect_sections(found):
     detected = {}
-    for section, patterns in section_patterns.items():
-        value = find_field(data, patterns)
+    for slot in SECTION_TABLE:
+        section = slot[1]
+        value = found.get(slot)
         if value is not None:
             if isinstance(value, (dict, list)) and len(value) == 0:
                 continue
             detected[section] = value
     return detected
 
-def extract_basic_info(data):
-    info = {
-        "candidate_id": "unknown",
-        "name": "unknown",
-        "email": "unknown",
-        "phone": "unknown",
-        "email_valid": False,
-        "phone_valid": False
-    }
-    id_names = ["candidate_id", "id", "userId", "user_id", "candidateId", "applicant_id"]
-    found_id = find_field(data, id_names)
+def detect_all_sections(data):
+    return _collect_sections(find_fields(data, SECTION_TABLE))
+
+def _basic_candidate_id(found, basic_patterns, deadline=None):
+    found_id = found.get("candidate_id")
     if found_id is not None and not is_null_or_empty(found_id):
-        info["candidate_id"] = str(found_id)
-    name_names = ["name", "full_name", "fullName", "candidate_name", "applicant_name"]
-    found_name = find_field(data, name_names)
+        return str(found_id)
+    return "unknown"
+
+def _basic_name(found, basic_patterns, deadline=None):
+    name = "unknown"
+    found_name = found.get("name")
     if found_name and not is_null_or_empty(found_name):
-        info["name"] = str(found_name)
-    contact_obj = find_field(data, ["contact", "contacts", "basics", "personal_info", "personal"])
+        name = str(found_name)
+    contact_obj = found.get("contact")
+    if name == "unknown" and contact_obj and isinstance(contact_obj, dict):
+        for n in basic_patterns["name"]:
+            if n in contact_obj and not is_null_or_empty(contact_obj[n]):
+                name = str(contact_obj[n])
+                break
+    if name == "unknown":
+        first = found.get("first_name")
+        last = found.get("last_name")
+        if first and last and not is_null_or_empty(first) and not is_null_or_empty(last):
+            name = f"{first} {last}"
+    return name
+
+def _basic_email(found, basic_patterns, deadline=None):
+    contact_obj = found.get("contact")
     if contact_obj and isinstance(contact_obj, dict):
-        extracted_email = extract_email_from_object(contact_obj)
+        extracted_email = extract_email_from_object(contact_obj, deadline)
         if extracted_email != "unknown":
-            info["email"] = extracted_email
-            info["email_valid"] = validate_email(extracted_email)
-        extracted_phone = extract_phone_from_object(contact_obj)
+            return extracted_email
+    found_email = found.get("email")
+    if found_email:
+        if isinstance(found_email, list) and found_email:
+            for e in found_email:
+                if isinstance(e, str) and validate_email(e):
+                    return e
+            return str(found_email[0])
+        elif isinstance(found_email, str):
+            return found_email
+    return "unknown"
+
+def _basic_phone(found, basic_patterns, deadline=None):
+    contact_obj = found.get("contact")
+    if contact_obj and isinstance(contact_obj, dict):
+        extracted_phone = extract_phone_from_object(contact_obj, deadline)
         if extracted_phone != "unknown":
-            info["phone"] = extracted_phone
-            info["phone_valid"] = validate_phone(extracted_phone)
-        if info["name"] == "unknown":
-            for n in name_names:
-                if n in contact_obj and not is_null_or_empty(contact_obj[n]):
-                    info["name"] = str(contact_obj[n])
-                    break
-    if info["email"] == "unknown":
-        email_names = ["email", "email_id", "emailId", "mail", "emails", "e-mail"]
-        found_email = find_field(data, email_names)
-        if found_email:
-            if isinstance(found_email, list) and found_email:
-                for e in found_email:
-                    if isinstance(e, str) and validate_email(e):
-                        info["email"] = e
-                        info["email_valid"] = True
-                        break
-                if info["email"] == "unknown" and found_email:
-                    info["email"] = str(found_email[0])
-                    info["email_valid"] = validate_email(str(found_email[0]))
-            elif isinstance(found_email, str):
-                info["email"] = found_email
-                info["email_valid"] = validate_email(found_email)
-    if info["phone"] == "unknown":
-        phone_names = ["phone", "mobile", "phone_number", "telephone", "tel", "contact_number"]
-        found_phone = find_field(data, phone_names)
-
-        if found_phone:
-            if isinstance(found_phone, list) and found_phone:
-                for p in found_phone:
-                    if isinstance(p, (str, int)) and validate_phone(str(p)):
-                        info["phone"] = str(p)
-                        info["phone_valid"] = True
-                        break
-            elif isinstance(found_phone, (str, int, float)):
-                info["phone"] = str(found_phone)
-                info["phone_valid"] = validate_phone(str(found_phone))
-
-    if info["name"] == "unknown":
-        first = find_field(data, ["first_name", "firstname"])
-        last = find_field(data, ["last_name", "lastname"])
-        if first and last and not is_null_or_empty(first) and not is_null_or_empty(last):
-            info["name"] = f"{first} {last}"
+            return extracted_phone
+    found_phone = found.get("phone")
+    if found_phone:
+        if isinstance(found_phone, list) and found_phone:
+            for p in found_phone:
+                if isinstance(p, (str, int)) and validate_phone(str(p)):
+                    return str(p)
+        elif isinstance(found_phone, (str, int, float)):
+            return str(found_phone)
+    return "unknown"
+
+# Each basic-info field, how it is built and the slots it is built from, so
+# an edit that touches none of those slots cannot change the field.
+BASIC_FIELDS = {
+    "candidate_id": (_basic_candidate_id, ("candidate_id",)),
+    "name": (_basic_name, ("name", "contact", "first_name", "last_name")),
+    "email": (_basic_email, ("contact", "email")),
+    "phone": (_basic_phone, ("contact", "phone"))
+}
+
+def _basic_fields(found, fields, basic_patterns=BASIC_INFO_PATTERNS, deadline=None):
+    found = {slot[1]: value for slot, value in found.items()}
+    return {
+        field: BASIC_FIELDS[field][0](found, basic_patterns, deadline)
+        for field in fields
+    }
+
+def _build_basic_info(found, basic_patterns=BASIC_INFO_PATTERNS, deadline=None):
+    info = _basic_fields(found, BASIC_FIELDS, basic_patterns, deadline)
+    info["email_valid"] = info["email"] != "unknown" and validate_email(info["email"])
+    info["phone_valid"] = info["phone"] != "unknown" and validate_phone(info["phone"])
     return info
+
+def extract_basic_info(data):
+    return _build_basic_info(find_fields(data, BASIC_INFO_TABLE))
+
+def document_table(sections):
+    # The scan table for a subset of sections; basic info is always scanned
+    # because the result header needs it.
+    return tuple(
+        slot for slot in SECTION_TABLE if slot[1] in sections
+    ) + BASIC_INFO_TABLE
+
+def scan_document(data, matcher=MATCHER, basic_patterns=BASIC_INFO_PATTERNS,
+                  table=DOCUMENT_TABLE, deadline=None):
+    found = shape_cache(table, matcher).find_fields(data, deadline)
+    return _collect_sections(found), _build_basic_info(
+        {slot: value for slot, value in found.items() if slot[0] == "basic"},
+        basic_patterns, deadline
+    )
+
+def rescan_document(data, changed, matcher=MATCHER, basic_patterns=BASIC_INFO_PATTERNS,
+                    table=DOCUMENT_TABLE, deadline=None):
+    # scan_document for an edited document, given the slots scan_changes
+    # found in the edit: looks up only the sections of the table among them
+    # and the basic-info fields built from them. Returns the names of the
+    # sections looked up, those found and the rebuilt basic-info fields.
+    sections = [slot for slot in table if slot[0] == "section" and slot in changed]
+    fields = [
+        field for field, (_, sources) in BASIC_FIELDS.items()
+        if any(("basic", source) in changed for source in sources)
+    ]
+    lookup = dict.fromkeys(sections)
+    for field in fields:
+        lookup.update(dict.fromkeys(("basic", source) for source in BASIC_FIELDS[field][1]))
+    found = find_fields(data, tuple(lookup), matcher, deadline=deadline) if lookup else {}
+    return (
+        {slot[1] for slot in sections},
+        _collect_sections(found),
+        _basic_fields(
+            {slot: value for slot, value in found.items() if slot[0] == "basic"},
+            fields, basic_patterns, deadline
+        )
+    )
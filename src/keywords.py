@@ -0,0 +1,120 @@
+from collections import deque
+
+# Whole-word multi-keyword search (Aho-Corasick). The automaton is built once
+# per keyword list; a scan reads each character of the text once, so its
+# cost depends on the text and the number of hits, not on how many
+# keywords there are.
+
+DEFAULT_TECH_KEYWORDS = (
+    "python", "java", "c++", "c#", "javascript",
+    ("react", ("react", "reactjs")), ("node", ("node", "nodejs")),
+    "mongodb", "mysql",
+    "django", "flask", "spring", "html",
+    "css", "machine learning", "ai",
+    "deep learning", "nlp"
+)
+
+def _is_word_char(ch):
+    # Digits end a word, so version suffixes still match: "python3",
+    # "html5".
+    return ch.isalpha() or ch == "_"
+
+class KeywordMatcher:
+    def __init__(self, keywords=DEFAULT_TECH_KEYWORDS):
+        # keywords are names or (name, aliases) pairs; matching ignores case
+        # and reports the name.
+        self.names = []
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+        for keyword in keywords:
+            if isinstance(keyword, str):
+                name, aliases = keyword, (keyword,)
+            else:
+                name, aliases = keyword
+            self.names.append(name)
+            for alias in aliases:
+                alias = alias.strip().lower()
+                if alias:
+                    self._add(alias, len(self.names) - 1)
+        self._link()
+
+    def __len__(self):
+        return len(self.names)
+
+    def _add(self, alias, name_id):
+        state = 0
+        for ch in alias:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        # Only sides of the alias that are word characters need a boundary:
+        # "c++" may be followed by anything, "java" not by a letter.
+        self._out[state] += ((
+            name_id, len(alias), _is_word_char(alias[0]), _is_word_char(alias[-1])
+        ),)
+
+    def _link(self):
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                f = goto[f].get(ch, 0)
+                fail[nxt] = f if f != nxt else 0
+                out[nxt] += out[fail[nxt]]
+
+    def _scan(self, text):
+        # Yields the name id of every whole-word hit, left to right by end.
+        text = text.lower()
+        goto, fail, out = self._goto, self._fail, self._out
+        last = len(text) - 1
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for name_id, length, check_start, check_end in out[state]:
+                start = i - length + 1
+                if check_start and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if check_end and i < last and _is_word_char(text[i + 1]):
+                    continue
+                yield name_id
+
+    def contains(self, text):
+        for _ in self._scan(text):
+            return True
+        return False
+
+    def find_all(self, text):
+        # The names found in text, each once, in order of first match.
+        found = {}
+        for name_id in self._scan(text):
+            found.setdefault(name_id, None)
+        return [self.names[name_id] for name_id in found]
+
+def load_keywords(path):
+    # One technology per line: "name" or "name: alias, alias". Blank lines
+    # and lines starting with # are skipped.
+    keywords = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            name, _, aliases = line.partition(":")
+            name = name.strip()
+            keywords.append((name, [name] + aliases.split(",")))
+    return keywords
+
+TECH_MATCHER = KeywordMatcher()
@@ -0,0 +1,100 @@
+MAX_CACHED_KEYS = 100000
+
+def normalize_key(key):
+    return (
+        key.lower()
+        .replace(" ", "_")
+        .replace("-", "_")
+    )
+
+def key_candidates(normalized_key):
+    # A pattern p matches a key k when k == p, k starts with p + "_" or k
+    # ends with "_" + p, so the only patterns that can match are k itself and
+    # the pieces of k on either side of each underscore.
+    candidates = {normalized_key}
+    for i, ch in enumerate(normalized_key):
+        if ch == "_":
+            candidates.add(normalized_key[:i])
+            candidates.add(normalized_key[i + 1:])
+    return frozenset(candidates)
+
+class KeyMatcher:
+    def __init__(self):
+        self._affix_index = {}
+        self._exact_index = {}
+        self._affix_sets = {}
+        self._exact_sets = {}
+        self._candidate_cache = {}
+        self._affix_cache = {}
+        self._exact_cache = {}
+
+    def register(self, slot, patterns):
+        for pattern in patterns:
+            slots = self._affix_index.setdefault(normalize_key(pattern), [])
+            if slot not in slots:
+                slots.append(slot)
+            slots = self._exact_index.setdefault(pattern.lower(), [])
+            if slot not in slots:
+                slots.append(slot)
+        self.affix_set(patterns)
+        self.exact_set(patterns)
+        self._affix_cache.clear()
+        self._exact_cache.clear()
+        return slot
+
+    def register_table(self, prefix, groups):
+        return tuple(
+            self.register((prefix, name), patterns)
+            for name, patterns in groups.items()
+        )
+
+    def affix_set(self, patterns):
+        patterns = tuple(patterns)
+        compiled = self._affix_sets.get(patterns)
+        if compiled is None:
+            compiled = frozenset(normalize_key(p) for p in patterns)
+            self._affix_sets[patterns] = compiled
+        return compiled
+
+    def exact_set(self, names):
+        names = tuple(names)
+        compiled = self._exact_sets.get(names)
+        if compiled is None:
+            compiled = frozenset(n.lower() for n in names)
+            self._exact_sets[names] = compiled
+        return compiled
+
+    def candidates(self, key):
+        cached = self._candidate_cache.get(key)
+        if cached is None:
+            if len(self._candidate_cache) >= MAX_CACHED_KEYS:
+                self._candidate_cache.clear()
+            cached = key_candidates(normalize_key(key))
+            self._candidate_cache[key] = cached
+        return cached
+
+    def matches(self, key, patterns):
+        return not self.candidates(key).isdisjoint(self.affix_set(patterns))
+
+    def affix_slots(self, key):
+        cached = self._affix_cache.get(key)
+        if cached is None:
+            if len(self._affix_cache) >= MAX_CACHED_KEYS:
+                self._affix_cache.clear()
+            slots = set()
+            for candidate in self.candidates(key):
+                slots.update(self._affix_index.get(candidate, ()))
+            cached = frozenset(slots)
+            self._affix_cache[key] = cached
+        return cached
+
+    def exact_slots(self, key):
+        cached = self._exact_cache.get(key)
+        if cached is None:
+            if len(self._exact_cache) >= MAX_CACHED_KEYS:
+                self._exact_cache.clear()
+            cached = frozenset(self._exact_index.get(key.lower(), ()))
+            self._exact_cache[key] = cached
+        return cached
+
+MATCHER = KeyMatcher()
@@ -1,18 +1,20 @@
+import io
 import json
 import sys
+from . import codec
 
 def parse_input(source=None):
     if isinstance(source, dict):
         return source
     if isinstance(source, str):
         try:
-            with open(source, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(source, "rb") as f:
+                return codec.load(f)
         except Exception as e:
             raise ValueError(f"Error reading JSON file: {str(e)}")
     try:
         if not sys.stdin.isatty():
-            return json.load(sys.stdin)
+            return codec.load(codec.binary_stream(sys.stdin))
     except Exception as e:
         raise ValueError(f"Error reading JSON from stdin: {str(e)}")
     raise ValueError("No valid JSON input provided")
@@ -22,4 +24,152 @@ def normalize_batch(input_data):
         return input_data
     if isinstance(input_data, dict):
         return [input_data]
-    raise ValueError("Invalid JSON format. Expected object or list.")
\ No newline at end of file
+    raise ValueError("Invalid JSON format. Expected object or list.")
+
+CHUNK_SIZE = 1 << 16
+_decoder = json.JSONDecoder()
+
+class _JSONStreamReader:
+    def __init__(self, stream, chunk_size=CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size=None):
+        if self.eof:
+            return False
+        chunk = self.stream.read(size or self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        if self.pos:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        self.buf += chunk
+        return True
+
+    def peek(self):
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars):
+        ch = self.peek()
+        if not ch or ch not in chars:
+            raise json.JSONDecodeError(
+                f"Expecting one of {chars!r}", self.buf, self.pos
+            )
+        self.pos += 1
+        return ch
+
+    def value(self, raw=False):
+        self.peek()
+        size = self.chunk_size
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                # Input cut short by the chunk boundary fails at the end of
+                # the buffer; an error with a line break after it is real,
+                # and reading on would only pull the rest of the input in.
+                if self.buf.find("\n", e.pos) >= 0 or not self.fill(size):
+                    raise
+                size *= 2
+                continue
+            # A number or literal that runs to the end of the buffer may
+            # continue in the next chunk, so only accept it once something
+            # follows it or the input is exhausted.
+            if end == len(self.buf) and self.fill(size):
+                continue
+            if raw:
+                obj = self.buf[self.pos:end]
+            self.pos = end
+            return obj
+
+    def skip_line(self, pos):
+        # Consumes the input up to the end of the line holding pos and
+        # returns it.
+        offset = max(pos - self.pos, 0)
+        while True:
+            end = self.buf.find("\n", self.pos + offset)
+            if end >= 0:
+                break
+            if not self.fill():
+                end = len(self.buf)
+                break
+        text = self.buf[self.pos:end]
+        self.pos = end
+        return text
+
+def _iter_array(reader, raw=False):
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.pos += 1
+    else:
+        while True:
+            yield reader.value(raw)
+            if reader.expect(",]") == "]":
+                break
+    if reader.peek():
+        raise json.JSONDecodeError("Extra data", reader.buf, reader.pos)
+
+def _iter_values(reader, raw=False):
+    # A value that does not parse is cut off at the end of the line the
+    # error is on and passed on as a record of its own: as raw text for the
+    # workers to reject, or as its ValueError in place of a document.
+    while reader.peek():
+        try:
+            value = reader.value(raw)
+        except (ValueError, RecursionError) as e:
+            text = reader.skip_line(getattr(e, "pos", reader.pos))
+            value = text if raw else _loads_or_error(text)
+        yield value
+
+def _loads_or_error(text):
+    try:
+        return codec.loads(text)
+    except ValueError as e:
+        return e
+
+def iter_json_array(stream, chunk_size=CHUNK_SIZE):
+    return _iter_array(_JSONStreamReader(stream, chunk_size))
+
+def iter_json_values(stream, chunk_size=CHUNK_SIZE):
+    return _iter_values(_JSONStreamReader(stream, chunk_size))
+
+def iter_ndjson(stream):
+    # A line that is not valid JSON is yielded as its ValueError, so that
+    # one bad record fails on its own instead of ending the stream.
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield _loads_or_error(line)
+
+def iter_records(stream, input_format="auto"):
+    # Yields documents; with NDJSON or concatenated values, a record that
+    # does not parse comes through as its ValueError (see validate_record).
+    if input_format == "ndjson":
+        return iter_ndjson(stream)
+    if input_format == "json":
+        return iter(normalize_batch(codec.load(stream)))
+    reader = _JSONStreamReader(stream)
+    if reader.peek() == "[":
+        return _iter_array(reader)
+    return _iter_values(reader)
+
+def iter_raw_records(stream, input_format="auto"):
+    # Yields each record as undecoded JSON (bytes for NDJSON, str slices
+    # otherwise) so it can be handed to another process without pickling
+    # the parsed document. `stream` must be a binary stream.
+    if input_format == "ndjson":
+        return (line for line in (line.strip() for line in stream) if line)
+    reader = _JSONStreamReader(io.TextIOWrapper(stream, encoding="utf-8"))
+    if reader.peek() == "[":
+        return _iter_array(reader, raw=True)
+    return _iter_values(reader, raw=True)
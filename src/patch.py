@@ -0,0 +1,214 @@
+import copy
+
+# RFC 6902 JSON Patch. apply_patch never mutates its input: containers on
+# the path of an operation are shallow-copied once, so untouched subtrees of
+# the result are the very same objects as in the original document.
+
+MISSING = object()
+
+def json_equal(a, b, strict=False):
+    # RFC 6902 equality: 1 == 1.0 but True != 1. strict also tells 1 from
+    # 1.0, which matters when the value ends up in a message.
+    stack = [(a, b)]
+    while stack:
+        a, b = stack.pop()
+        if type(a) is not type(b):
+            if strict or isinstance(a, bool) or isinstance(b, bool):
+                return False
+            if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+                if a != b:
+                    return False
+                continue
+            return False
+        if isinstance(a, dict):
+            if a.keys() != b.keys():
+                return False
+            stack.extend((a[k], b[k]) for k in a)
+        elif isinstance(a, list):
+            if len(a) != len(b):
+                return False
+            stack.extend(zip(a, b))
+        elif a != b:
+            return False
+    return True
+
+def parse_pointer(pointer):
+    if pointer == "":
+        return []
+    if not isinstance(pointer, str) or not pointer.startswith("/"):
+        raise ValueError(f"Invalid JSON pointer: {pointer!r}")
+    return [
+        token.replace("~1", "/").replace("~0", "~")
+        for token in pointer[1:].split("/")
+    ]
+
+def _index(container, token, pointer, allow_end=False):
+    if allow_end and token == "-":
+        return len(container)
+    if not token.isdigit() or (len(token) > 1 and token[0] == "0"):
+        raise ValueError(f"Invalid array index {token!r} in {pointer!r}")
+    index = int(token)
+    limit = len(container) + (1 if allow_end else 0)
+    if index >= limit:
+        raise ValueError(f"Array index out of range in {pointer!r}")
+    return index
+
+def _child(container, token, pointer):
+    if isinstance(container, dict):
+        if token not in container:
+            raise ValueError(f"Path not found: {pointer!r}")
+        return container[token]
+    if isinstance(container, list):
+        return container[_index(container, token, pointer)]
+    raise ValueError(f"Path not found: {pointer!r}")
+
+def resolve(document, pointer):
+    value = document
+    for token in parse_pointer(pointer):
+        value = _child(value, token, pointer)
+    return value
+
+class _Patcher:
+    def __init__(self, document):
+        self.document = document
+        self.owned = {}
+
+    def _own(self, value):
+        if id(value) in self.owned:
+            return value
+        value = dict(value) if isinstance(value, dict) else list(value)
+        self.owned[id(value)] = value
+        return value
+
+    def _parent(self, tokens, pointer):
+        # Returns a private copy of the container holding the last token,
+        # re-linking private copies of every container above it.
+        if not isinstance(self.document, (dict, list)):
+            raise ValueError(f"Path not found: {pointer!r}")
+        self.document = self._own(self.document)
+        parent = self.document
+        for token in tokens[:-1]:
+            child = _child(parent, token, pointer)
+            if not isinstance(child, (dict, list)):
+                raise ValueError(f"Path not found: {pointer!r}")
+            child = self._own(child)
+            if isinstance(parent, dict):
+                parent[token] = child
+            else:
+                parent[_index(parent, token, pointer)] = child
+            parent = child
+        return parent
+
+    def add(self, pointer, value):
+        tokens = parse_pointer(pointer)
+        if not tokens:
+            old, self.document = self.document, value
+            return old
+        parent = self._parent(tokens, pointer)
+        if isinstance(parent, dict):
+            old = parent.get(tokens[-1], MISSING)
+            parent[tokens[-1]] = value
+            return old
+        parent.insert(_index(parent, tokens[-1], pointer, allow_end=True), value)
+        return MISSING
+
+    def remove(self, pointer):
+        tokens = parse_pointer(pointer)
+        if not tokens:
+            raise ValueError("Cannot remove the document root")
+        parent = self._parent(tokens, pointer)
+        if isinstance(parent, dict):
+            if tokens[-1] not in parent:
+                raise ValueError(f"Path not found: {pointer!r}")
+            return parent.pop(tokens[-1])
+        return parent.pop(_index(parent, tokens[-1], pointer))
+
+    def replace(self, pointer, value):
+        tokens = parse_pointer(pointer)
+        if not tokens:
+            old, self.document = self.document, value
+            return old
+        parent = self._parent(tokens, pointer)
+        if isinstance(parent, dict):
+            if tokens[-1] not in parent:
+                raise ValueError(f"Path not found: {pointer!r}")
+            old = parent[tokens[-1]]
+            parent[tokens[-1]] = value
+        else:
+            index = _index(parent, tokens[-1], pointer)
+            old = parent[index]
+            parent[index] = value
+        return old
+
+def _member(operation, name, default=MISSING):
+    value = operation.get(name, default)
+    if value is MISSING:
+        raise ValueError(f"Patch operation {operation.get('op')!r} needs {name!r}")
+    return value
+
+def apply_patch(document, operations):
+    # Returns (new_document, changes). Each change is (tokens, old, new): the
+    # path of an edited location with the values before and after the edit,
+    # MISSING where there was none. changes is None when the patch replaced
+    # the root or the document is not an object.
+    if not isinstance(operations, list):
+        raise ValueError("A JSON patch must be a list of operations")
+    patcher = _Patcher(document)
+    changes = []
+    for operation in operations:
+        if not isinstance(operation, dict):
+            raise ValueError("Each patch operation must be an object")
+        op = operation.get("op")
+        path = _member(operation, "path")
+        if op == "test":
+            if not json_equal(resolve(patcher.document, path), _member(operation, "value")):
+                raise ValueError(f"Test failed at {path!r}")
+            continue
+        if op == "add":
+            value = copy.deepcopy(_member(operation, "value"))
+            changes.append((parse_pointer(path), patcher.add(path, value), value))
+        elif op == "remove":
+            changes.append((parse_pointer(path), patcher.remove(path), MISSING))
+        elif op == "replace":
+            value = copy.deepcopy(_member(operation, "value"))
+            changes.append((parse_pointer(path), patcher.replace(path, value), value))
+        elif op in ("move", "copy"):
+            source = _member(operation, "from")
+            value = resolve(patcher.document, source)
+            if op == "move":
+                if path == source:
+                    continue
+                if path.startswith(source + "/"):
+                    raise ValueError(f"Cannot move {source!r} into its own child {path!r}")
+                changes.append((parse_pointer(source), patcher.remove(source), MISSING))
+            else:
+                value = copy.deepcopy(value)
+            changes.append((parse_pointer(path), patcher.add(path, value), value))
+        else:
+            raise ValueError(f"Unknown patch operation: {op!r}")
+    if not isinstance(document, dict) or not isinstance(patcher.document, dict):
+        return patcher.document, None
+    if any(not tokens for tokens, _, _ in changes):
+        return patcher.document, None
+    return patcher.document, changes
+
+def document_changes(old, new):
+    # The same change list for two whole documents, one entry per top-level
+    # key that differs, or None when they cannot be compared key by key.
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return None
+    common_old = [key for key in old if key in new]
+    common_new = [key for key in new if key in old]
+    if common_old != common_new:
+        return None
+    changes = []
+    for key in old.keys() | new.keys():
+        before = old.get(key, MISSING)
+        after = new.get(key, MISSING)
+        if before is after or (
+            before is not MISSING and after is not MISSING
+            and json_equal(before, after, strict=True)
+        ):
+            continue
+        changes.append(([key], before, after))
+    return changes
@@ -0,0 +1,291 @@
+import time
+import asyncio
+from itertools import islice
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from . import pool, codec
+from .sources import read_file, decode_file, file_results, DEFAULT_READ_THREADS
+from .tracing import TRACER
+
+# Validation as asyncio stages joined by bounded queues:
+# source -> [read] -> [decode] -> validate -> write. Every stage does its
+# blocking work on an executor with its own concurrency, so reading,
+# decoding, validating and writing different chunks overlap instead of
+# taking turns. Chunks carry a sequence number and the writer restores
+# input order. A cap on chunks in flight bounds memory, including the
+# writer's reorder buffer, whatever the input size.
+
+DEFAULT_QUEUE_DEPTH = 4
+DEFAULT_DECODE_THREADS = 1
+_END = None
+
+class StageMetrics:
+    def __init__(self, name, concurrency):
+        self.name = name
+        self.concurrency = concurrency
+        self.chunks = 0
+        self.items = 0
+        self.busy = 0.0
+        self.starved = 0.0
+        self.blocked = 0.0
+        self.depth_total = 0
+        self.depth_max = 0
+
+    def sample(self, queue):
+        # Depth of the stage's input queue, taken at every chunk it picks up.
+        depth = queue.qsize()
+        self.depth_total += depth
+        if depth > self.depth_max:
+            self.depth_max = depth
+
+    def to_dict(self):
+        return {
+            "concurrency": self.concurrency,
+            "chunks": self.chunks,
+            "items": self.items,
+            # busy is time chunks spent on the executor, summed over the
+            # stage's tasks; starved is time waiting for input, blocked time
+            # waiting for room downstream.
+            "busy_seconds": round(self.busy, 6),
+            "starved_seconds": round(self.starved, 6),
+            "blocked_seconds": round(self.blocked, 6),
+            "queue_depth": {
+                "mean": round(self.depth_total / self.chunks, 2) if self.chunks else 0,
+                "max": self.depth_max
+            }
+        }
+
+def _take(items, count):
+    return list(islice(items, count))
+
+def read_chunk(paths):
+    return [read_file(path, parse=False) for path in paths]
+
+def decode_chunk(chunk):
+    # Raw records become documents, (path, bytes) pairs become (path,
+    # content); anything that fails to decode is kept as its ValueError.
+    decoded = []
+    for item in chunk:
+        if isinstance(item, tuple):
+            path, content = item
+            if isinstance(content, (bytes, bytearray)):
+                try:
+                    content = decode_file(path, content)
+                except ValueError as e:
+                    content = e
+            decoded.append((path, content))
+        else:
+            try:
+                decoded.append(codec.loads(item))
+            except ValueError as e:
+                decoded.append(e)
+    return decoded
+
+def validate_decoded(validator, chunk):
+    lines = []
+    for item in chunk:
+        if isinstance(item, tuple):
+            results = file_results(validator, *item)
+        else:
+            results = (pool.validate_record(validator, item),)
+        lines.extend(codec.dumpb(result.to_dict()) for result in results)
+    return lines
+
+def _write_lines(out, lines):
+    for line in lines:
+        out.write_line(line)
+
+class _Stage:
+    def __init__(self, name, fn, executor, concurrency, traced=False):
+        self.fn = fn
+        self.executor = executor
+        self.traced = traced
+        self.running = concurrency
+        self.metrics = StageMetrics(name, concurrency)
+
+class ValidationPipeline:
+    # With workers, validation runs in a process pool that is sent raw
+    # chunks: the workers decode, so documents never cross the process
+    # boundary and there is no separate decode stage. Without workers the
+    # given validator runs on one thread next to a decode stage.
+    def __init__(self, validator=None, workers=0, chunk_size=pool.DEFAULT_CHUNK_SIZE,
+                 read_threads=DEFAULT_READ_THREADS,
+                 decode_threads=DEFAULT_DECODE_THREADS, validate_tasks=None,
+                 queue_depth=DEFAULT_QUEUE_DEPTH, ordered=True, initargs=(),
+                 trace=False):
+        for name, value in (
+            ("chunk size", chunk_size), ("read threads", read_threads),
+            ("decode threads", decode_threads), ("queue depth", queue_depth)
+        ):
+            if value < 1:
+                raise ValueError(f"Invalid pipeline {name}: {value} (expected >= 1)")
+        if validate_tasks is not None and validate_tasks < 1:
+            raise ValueError(f"Invalid pipeline validate tasks: {validate_tasks} (expected >= 1)")
+        self.validator = validator
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.read_threads = read_threads
+        self.decode_threads = decode_threads
+        self.validate_tasks = validate_tasks or (workers * 2 if workers > 0 else 1)
+        self.queue_depth = queue_depth
+        self.ordered = ordered
+        self.initargs = initargs
+        self.trace = trace
+
+    def run(self, items, out, files=False):
+        # items are raw records, or paths when files is true. Writes one
+        # encoded result line per record to out and returns the metrics.
+        return asyncio.run(self._run(items, out, files))
+
+    async def _run(self, items, out, files):
+        executors = []
+
+        def executor(cls, workers, **kwargs):
+            executors.append(cls(max_workers=workers, **kwargs))
+            return executors[-1]
+
+        try:
+            # The source and the writer get a thread each, so reading the
+            # next chunk never waits behind a write.
+            source = executor(ThreadPoolExecutor, 1)
+            sink = executor(ThreadPoolExecutor, 1)
+            stages = []
+            if files:
+                stages.append(_Stage(
+                    "read", read_chunk,
+                    executor(ThreadPoolExecutor, self.read_threads), self.read_threads
+                ))
+            if self.workers > 0:
+                fn = pool.validate_chunk
+                if self.trace:
+                    fn = partial(pool.traced_call, pool.validate_chunk)
+                stages.append(_Stage(
+                    "validate", fn,
+                    executor(
+                        ProcessPoolExecutor, self.workers,
+                        initializer=pool.init_worker, initargs=self.initargs
+                    ),
+                    self.validate_tasks, self.trace
+                ))
+            else:
+                stages.append(_Stage(
+                    "decode", decode_chunk,
+                    executor(ThreadPoolExecutor, self.decode_threads), self.decode_threads
+                ))
+                stages.append(_Stage(
+                    "validate", partial(validate_decoded, self.validator),
+                    executor(ThreadPoolExecutor, 1), self.validate_tasks
+                ))
+            return await self._flow(items, out, stages, source, sink)
+        finally:
+            for pool_executor in executors:
+                pool_executor.shutdown(cancel_futures=True)
+
+    async def _flow(self, items, out, stages, reader, sink):
+        loop = asyncio.get_running_loop()
+        queues = [asyncio.Queue(self.queue_depth) for _ in range(len(stages) + 1)]
+        window = asyncio.Semaphore(
+            self.queue_depth * len(queues) + sum(s.metrics.concurrency for s in stages)
+        )
+        source = StageMetrics("source", 1)
+        writer = StageMetrics("write", 1)
+        started = time.perf_counter()
+
+        async def feed():
+            outbox = queues[0]
+            seq = 0
+            while True:
+                await window.acquire()
+                begin = time.perf_counter()
+                chunk = await loop.run_in_executor(reader, _take, items, self.chunk_size)
+                source.busy += time.perf_counter() - begin
+                if not chunk:
+                    window.release()
+                    break
+                source.chunks += 1
+                source.items += len(chunk)
+                begin = time.perf_counter()
+                await outbox.put((seq, chunk))
+                source.blocked += time.perf_counter() - begin
+                seq += 1
+            await outbox.put(_END)
+
+        async def work(stage, inbox, outbox):
+            metrics = stage.metrics
+            while True:
+                begin = time.perf_counter()
+                item = await inbox.get()
+                metrics.starved += time.perf_counter() - begin
+                if item is _END:
+                    # Passed on so the stage's other tasks stop too; the
+                    # last one to stop ends the next stage.
+                    await inbox.put(_END)
+                    stage.running -= 1
+                    if not stage.running:
+                        await outbox.put(_END)
+                    return
+                metrics.sample(inbox)
+                seq, chunk = item
+                begin = time.perf_counter()
+                result = await loop.run_in_executor(stage.executor, stage.fn, chunk)
+                metrics.busy += time.perf_counter() - begin
+                if stage.traced:
+                    result, timings = result
+                    TRACER.merge(timings)
+                metrics.chunks += 1
+                metrics.items += len(result)
+                begin = time.perf_counter()
+                await outbox.put((seq, result))
+                metrics.blocked += time.perf_counter() - begin
+
+        async def write():
+            inbox = queues[-1]
+            pending = {}
+            expected = 0
+            while True:
+                begin = time.perf_counter()
+                item = await inbox.get()
+                writer.starved += time.perf_counter() - begin
+                if item is _END:
+                    return
+                writer.sample(inbox)
+                seq, lines = item
+                if not self.ordered:
+                    ready = [lines]
+                else:
+                    pending[seq] = lines
+                    ready = []
+                    while expected in pending:
+                        ready.append(pending.pop(expected))
+                        expected += 1
+                for lines in ready:
+                    begin = time.perf_counter()
+                    await loop.run_in_executor(sink, _write_lines, out, lines)
+                    writer.busy += time.perf_counter() - begin
+                    writer.chunks += 1
+                    writer.items += len(lines)
+                    window.release()
+
+        tasks = [asyncio.ensure_future(feed()), asyncio.ensure_future(write())]
+        for index, stage in enumerate(stages):
+            tasks.extend(
+                asyncio.ensure_future(work(stage, queues[index], queues[index + 1]))
+                for _ in range(stage.metrics.concurrency)
+            )
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        await loop.run_in_executor(sink, out.flush)
+        seconds = time.perf_counter() - started
+        return {
+            "records": writer.items,
+            "seconds": round(seconds, 6),
+            "records_per_second": round(writer.items / seconds, 1) if seconds else 0,
+            "stages": {
+                metrics.name: metrics.to_dict()
+                for metrics in [source] + [s.metrics for s in stages] + [writer]
+            }
+        }
@@ -0,0 +1,315 @@
+import os
+import json
+import hashlib
+from collections import namedtuple
+from types import MappingProxyType
+from .config import load_config, DEFAULT_CONFIG_PATH
+from .dates import shared_date_parser
+from .matcher import KeyMatcher
+from .keywords import KeywordMatcher, load_keywords, TECH_MATCHER
+from .detector import SECTION_PATTERNS, BASIC_INFO_PATTERNS
+from .budget import make_budget
+
+EXPERIENCE_FIELDS = {
+    "title": [
+        "title", "position", "role",
+        "job_title", "designation",
+        "profile", "jobRole"
+    ],
+    "company": [
+        "company", "employer",
+        "organization", "firm",
+        "company_name", "org"
+    ],
+    "start": [
+        "startDate", "start_date",
+        "from", "start",
+        "joining_date"
+    ],
+    "end": [
+        "endDate", "end_date",
+        "to", "end",
+        "leaving_date"
+    ],
+    "description": [
+        "summary", "description",
+        "details", "about"
+    ],
+    "highlights": [
+        "highlights", "responsibilities",
+        "duties", "points", "tasks"
+    ]
+}
+
+EDUCATION_FIELDS = {
+    "degree": [
+        "degree", "qualification",
+        "degree_name", "course",
+        "program", "field_of_study"
+    ],
+    "institution": [
+        "institution", "school",
+        "college", "university",
+        "institution_name", "institute",
+        "academy"
+    ],
+    "grade": [
+        "grade", "gpa", "cgpa",
+        "percentage", "score",
+        "marks", "result"
+    ],
+    "start": [
+        "startDate", "start_date",
+        "from", "start",
+        "admission_date"
+    ],
+    "end": [
+        "endDate", "end_date",
+        "to", "end",
+        "graduation_date"
+    ],
+    "duration": [
+        "duration", "academic_duration",
+        "period"
+    ]
+}
+
+PROJECT_FIELDS = {
+    "name": [
+        "name", "title", "project_name",
+        "project_title", "project", "projectName"
+    ],
+    "points": ["points", "highlights", "bullets"],
+    "description": [
+        "description", "summary", "details",
+        "about", "project_summary"
+    ],
+    "technologies": [
+        "technologies", "tech", "tech_stack",
+        "tools", "stack", "built_with",
+        "techstack", "techStack"
+    ],
+    "link": [
+        "link", "github", "url",
+        "github_link", "repo",
+        "repository", "repo_link",
+        "github_url"
+    ],
+    "nested_link": [
+        "github_url", "url", "link"
+    ]
+}
+
+CERTIFICATION_FIELDS = {
+    "name": [
+        "name", "certificate",
+        "title", "certificate_name",
+        "cert_name", "credential"
+    ],
+    "issuer": [
+        "issuer", "organization",
+        "issued_by", "provider",
+        "authority", "platform"
+    ],
+    "url": [
+        "verification_url",
+        "credential_url",
+        "certificate_url",
+        "url", "link"
+    ]
+}
+
+SECTION_FIELDS = {
+    "experience": EXPERIENCE_FIELDS,
+    "education": EDUCATION_FIELDS,
+    "projects": PROJECT_FIELDS,
+    "certifications": CERTIFICATION_FIELDS
+}
+
+# Logical fields each field_mappings entry adds aliases to.
+FIELD_MAPPING_TARGETS = {
+    "title": [("experience", "title")],
+    "company": [("experience", "company")],
+    "start_date": [("experience", "start"), ("education", "start")],
+    "end_date": [("experience", "end"), ("education", "end")],
+    "description": [("experience", "description"), ("projects", "description")],
+    "name": [("basic", "name")],
+    "email": [("basic", "email")],
+    "phone": [("basic", "phone")]
+}
+
+# Fields a section's required_fields and required_any may name. An entry
+# fails with "Missing <field>" for each required field it lacks, and with
+# "Insufficient <section> details" when it has none of its required_any.
+REQUIRED_FIELD_CHOICES = {
+    "experience": ("title", "company", "description", "start_date", "end_date"),
+    "education": ("degree", "institution", "start_date", "end_date"),
+    "projects": ("name", "description"),
+    "certifications": ("name", "issuer", "url")
+}
+REQUIRED_FIELD_KEYS = ("required_fields", "required_any")
+
+DEFAULT_SECTION_SETTINGS = {
+    "experience": {
+        "required_any": ["title", "company", "description"],
+        "validate_dates": True,
+        "validate_duration": True,
+        "min_description_length": 5
+    },
+    "education": {
+        "required_any": ["degree", "institution"],
+        "validate_dates": True,
+        "validate_duration": True
+    },
+    "projects": {
+        "required_fields": ["name", "description"],
+        "require_technologies": True,
+        "min_description_length": 10
+    },
+    "certifications": {
+        "required_any": ["name", "issuer"],
+        "validate_url": True
+    }
+}
+
+SectionPlan = namedtuple("SectionPlan", [
+    "name",
+    "fields",
+    "required_fields",
+    "required_any",
+    "validate_dates",
+    "validate_duration",
+    "min_duration_days",
+    "min_description_length",
+    "require_technologies",
+    "list_technologies",
+    "validate_url",
+    "date_parser",
+    "technologies",
+    "field_matcher"
+])
+
+RulePlan = namedtuple("RulePlan", [
+    "version",
+    "sections",
+    "basic_fields",
+    "matcher",
+    "date_parser",
+    "budget",
+    "source",
+    "mtime"
+])
+
+def _merge_aliases(base, extra):
+    merged = list(base)
+    for alias in extra or ():
+        if alias not in merged:
+            merged.append(alias)
+    return tuple(merged)
+
+def _plan_version(config, keywords=None):
+    # A keyword file is part of the rules, so its contents count too.
+    canonical = json.dumps(config, sort_keys=True, default=str)
+    if keywords:
+        canonical += json.dumps(keywords, sort_keys=True)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:12]
+
+def _keyword_path(path, source):
+    if os.path.isabs(path) or not source:
+        return path
+    return os.path.join(os.path.dirname(os.path.abspath(source)), path)
+
+def compile_plan(config=None, source=None, mtime=None):
+    config = config or {}
+    rules = config.get("rules") or {}
+    section_config = config.get("sections") or {}
+    mappings = config.get("field_mappings") or {}
+
+    fields = {
+        section: {name: tuple(aliases) for name, aliases in table.items()}
+        for section, table in SECTION_FIELDS.items()
+    }
+    fields["basic"] = {
+        name: tuple(aliases) for name, aliases in BASIC_INFO_PATTERNS.items()
+    }
+    for mapping, aliases in mappings.items():
+        if mapping not in FIELD_MAPPING_TARGETS:
+            raise ValueError(f"Unknown field mapping: {mapping}")
+        for section, name in FIELD_MAPPING_TARGETS[mapping]:
+            fields[section][name] = _merge_aliases(fields[section][name], aliases)
+
+    date_parser = shared_date_parser(rules.get("date_formats"))
+    keywords = {}
+    sections = {}
+    for section, defaults in DEFAULT_SECTION_SETTINGS.items():
+        settings = dict(defaults)
+        if "min_description_length" in rules and section in ("experience", "projects"):
+            settings["min_description_length"] = rules["min_description_length"]
+        if section == "experience" and "min_experience_duration_days" in rules:
+            settings["min_duration_days"] = rules["min_experience_duration_days"]
+        settings.update(section_config.get(section) or {})
+        required = {}
+        for key in REQUIRED_FIELD_KEYS:
+            required[key] = tuple(dict.fromkeys(settings.get(key) or ()))
+            for field in required[key]:
+                if field not in REQUIRED_FIELD_CHOICES[section]:
+                    raise ValueError(
+                        f"Unknown required field '{field}' for section '{section}'"
+                    )
+        technologies = TECH_MATCHER
+        keyword_file = settings.get("technology_keywords")
+        if keyword_file:
+            path = _keyword_path(keyword_file, source)
+            try:
+                keywords[section] = load_keywords(path)
+            except OSError as e:
+                raise ValueError(f"Cannot read technology keywords {path}: {e.strerror}")
+            technologies = KeywordMatcher(keywords[section])
+        # Logical field names are the slots, for rules.entry_fields.
+        field_matcher = KeyMatcher()
+        for name, aliases in fields[section].items():
+            field_matcher.register(name, aliases)
+        sections[section] = SectionPlan(
+            name=section,
+            fields=MappingProxyType(fields[section]),
+            required_fields=required["required_fields"],
+            required_any=required["required_any"],
+            validate_dates=bool(settings.get("validate_dates", False)),
+            validate_duration=bool(settings.get("validate_duration", False)),
+            min_duration_days=settings.get("min_duration_days", 1),
+            min_description_length=settings.get("min_description_length", 0),
+            require_technologies=bool(settings.get("require_technologies", False)),
+            list_technologies=bool(settings.get("list_technologies", False)),
+            validate_url=bool(settings.get("validate_url", False)),
+            date_parser=date_parser,
+            technologies=technologies,
+            field_matcher=field_matcher
+        )
+
+    matcher = KeyMatcher()
+    matcher.register_table("section", SECTION_PATTERNS)
+    matcher.register_table("basic", fields["basic"])
+    return RulePlan(
+        version=_plan_version(config, keywords),
+        sections=MappingProxyType(sections),
+        basic_fields=MappingProxyType(fields["basic"]),
+        matcher=matcher,
+        date_parser=date_parser,
+        budget=make_budget(rules),
+        source=source,
+        mtime=mtime
+    )
+
+def load_plan(path=None):
+    source = path or DEFAULT_CONFIG_PATH
+    mtime = os.path.getmtime(source) if os.path.exists(source) else None
+    return compile_plan(load_config(path), source=source, mtime=mtime)
+
+def plan_changed(plan):
+    # True when the config file the plan came from was modified since.
+    source = plan.source
+    if not source or not os.path.exists(source):
+        return False
+    return os.path.getmtime(source) != plan.mtime
+
+DEFAULT_PLAN = load_plan()
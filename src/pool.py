@@ -0,0 +1,153 @@
+import os
+from collections import deque
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from .validator import ResumeValidator
+from . import codec
+from .cache import make_cache
+from .tracing import TRACER
+from .results import ValidationResult
+from .report import ValidationReport, DEFAULT_TOP, DEFAULT_CAPACITY
+from .sources import file_results
+from .utils import check_cache_info
+from .detector import shape_cache_stats
+
+DEFAULT_CHUNK_SIZE = 256
+
+_validator = None
+
+def init_worker(config_path=None, cache_spec=None, trace=False, sections=None,
+                fail_fast=False):
+    global _validator
+    cache = make_cache(*cache_spec) if cache_spec else None
+    _validator = ResumeValidator(
+        config_path, cache=cache, trace=trace, sections=sections, fail_fast=fail_fast
+    )
+
+def worker_validator():
+    return _validator
+
+def validate_record(validator, record):
+    # record is a document, or the ValueError it failed to decode with.
+    if isinstance(record, ValueError):
+        return ValidationResult.from_error(f"Invalid JSON: {str(record)}")
+    return validator.validate_compact(record)
+
+def validate_raw(validator, raw):
+    try:
+        record = codec.loads(raw)
+    except ValueError as e:
+        record = e
+    return validate_record(validator, record)
+
+def _chunk_results(chunk):
+    # A chunk holds raw records or, for file input, (path, content) pairs.
+    for item in chunk:
+        if isinstance(item, tuple):
+            yield from file_results(_validator, *item)
+        else:
+            yield validate_raw(_validator, item)
+
+def validate_chunk(chunk):
+    return [codec.dumpb(result.to_dict()) for result in _chunk_results(chunk)]
+
+def report_chunk(chunk, capacity=DEFAULT_CAPACITY):
+    report = ValidationReport(capacity=capacity)
+    for result in _chunk_results(chunk):
+        report.add(result)
+    return report
+
+def cache_stats():
+    # Hit and miss counters of this process's memoized checks and document
+    # shape plans.
+    return {
+        "pid": os.getpid(),
+        "checks": check_cache_info(),
+        "shapes": shape_cache_stats()
+    }
+
+def traced_call(fn, arg):
+    # Ships the worker's stage histograms back with each result so the
+    # parent process can keep the process-wide totals.
+    return fn(arg), TRACER.drain()
+
+def iter_chunks(records, chunk_size=DEFAULT_CHUNK_SIZE):
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _map_chunks(fn, raw_records, workers, chunk_size, ordered, max_pending,
+                initargs, trace):
+    # Yields fn(chunk) for each chunk of raw records. Only a bounded number
+    # of chunks is in flight at once, so a huge input is never read far
+    # ahead of the workers.
+    max_pending = max_pending or workers * 4
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_worker,
+        initargs=initargs
+    ) as executor:
+        if trace:
+            submit = lambda chunk: executor.submit(traced_call, fn, chunk)
+        else:
+            submit = lambda chunk: executor.submit(fn, chunk)
+
+        def result(future):
+            if not trace:
+                return future.result()
+            value, stages = future.result()
+            TRACER.merge(stages)
+            return value
+
+        if ordered:
+            pending = deque()
+            for chunk in iter_chunks(raw_records, chunk_size):
+                pending.append(submit(chunk))
+                if len(pending) >= max_pending:
+                    yield result(pending.popleft())
+            while pending:
+                yield result(pending.popleft())
+        else:
+            pending = set()
+            for chunk in iter_chunks(raw_records, chunk_size):
+                pending.add(submit(chunk))
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield result(future)
+            for future in as_completed(pending):
+                yield result(future)
+
+def validate_parallel(raw_records, workers, chunk_size=DEFAULT_CHUNK_SIZE,
+                      ordered=True, max_pending=None, config_path=None,
+                      cache_spec=None, trace=False, sections=None,
+                      fail_fast=False):
+    # Yields one encoded NDJSON result line (bytes) per raw record, or per
+    # record of each (path, content) file item.
+    chunks = _map_chunks(
+        validate_chunk, raw_records, workers, chunk_size, ordered, max_pending,
+        (config_path, cache_spec, trace, sections, fail_fast), trace
+    )
+    for lines in chunks:
+        yield from lines
+
+def report_parallel(raw_records, workers, chunk_size=DEFAULT_CHUNK_SIZE,
+                    max_pending=None, config_path=None, cache_spec=None,
+                    trace=False, sections=None, fail_fast=False,
+                    top=DEFAULT_TOP, capacity=DEFAULT_CAPACITY):
+    # Each worker folds its chunk into a partial report; only those cross
+    # the process boundary and are merged here in completion order.
+    report = ValidationReport(top, capacity)
+    chunks = _map_chunks(
+        partial(report_chunk, capacity=capacity), raw_records, workers,
+        chunk_size, False, max_pending,
+        (config_path, cache_spec, trace, sections, fail_fast), trace
+    )
+    for part in chunks:
+        report.merge(part)
+    return report
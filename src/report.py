@@ -0,0 +1,148 @@
+from collections import Counter
+
+DEFAULT_TOP = 10
+DEFAULT_CAPACITY = 1024
+
+class HeavyHitters:
+    # Misra-Gries summary: at most 2 * capacity counters, each an undercount
+    # of the true frequency by no more than `error`, which stays below
+    # total / (capacity + 1). Summaries of disjoint streams merge into a
+    # summary of their union with the same guarantee.
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.counts = {}
+        self.total = 0
+        self.error = 0
+
+    def add(self, key, count=1):
+        self.total += count
+        counts = self.counts
+        counts[key] = counts.get(key, 0) + count
+        if len(counts) > 2 * self.capacity:
+            self._prune()
+
+    def _prune(self):
+        # Subtracting the (capacity + 1)-th largest count removes at least
+        # capacity + 1 units per pruned unit of error.
+        counts = self.counts
+        if len(counts) <= self.capacity:
+            return
+        cut = sorted(counts.values(), reverse=True)[self.capacity]
+        self.counts = {key: count - cut for key, count in counts.items() if count > cut}
+        self.error += cut
+
+    def merge(self, other):
+        counts = self.counts
+        for key, count in other.counts.items():
+            counts[key] = counts.get(key, 0) + count
+        self.total += other.total
+        self.error += other.error
+        self._prune()
+        return self
+
+    def top(self, n):
+        return sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))[:n]
+
+    def to_dict(self):
+        return {
+            "capacity": self.capacity,
+            "total": self.total,
+            "max_undercount": self.error,
+            "counts": dict(self.top(len(self.counts)))
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data["capacity"])
+        sketch.counts = dict(data["counts"])
+        sketch.total = data["total"]
+        sketch.error = data["max_undercount"]
+        return sketch
+
+def _counts(counter):
+    return dict(sorted(counter.items(), key=lambda item: (-item[1], item[0])))
+
+class ValidationReport:
+    # Running totals over a stream of validation results. Everything held
+    # here is bounded by the number of sections, statuses and issue codes,
+    # plus the issue sketch, so memory does not grow with the corpus.
+    def __init__(self, top=DEFAULT_TOP, capacity=DEFAULT_CAPACITY):
+        self.top = top
+        self.records = 0
+        self.statuses = Counter()
+        self.sections = {}
+        self.detected = Counter()
+        self.codes = {}
+        self.issues = HeavyHitters(capacity)
+
+    def add(self, result):
+        # Folds in one ValidationResult, as returned by validate_compact().
+        self.records += 1
+        self.statuses[result.status] += 1
+        if result.error is not None:
+            self.issues.add(result.error)
+        for section, value in result.sections.items():
+            counter = self.sections.get(section)
+            if counter is None:
+                counter = self.sections[section] = Counter()
+            counter[value.status] += 1
+        self.detected.update(result.detected)
+        for section, _, issue in result.issues():
+            codes = self.codes.get(section)
+            if codes is None:
+                codes = self.codes[section] = Counter()
+            codes[issue.code.name] += 1
+            self.issues.add(issue.message)
+        return self
+
+    def merge(self, other):
+        self.records += other.records
+        self.statuses.update(other.statuses)
+        for section, counter in other.sections.items():
+            self.sections.setdefault(section, Counter()).update(counter)
+        self.detected.update(other.detected)
+        for section, counter in other.codes.items():
+            self.codes.setdefault(section, Counter()).update(counter)
+        self.issues.merge(other.issues)
+        return self
+
+    def to_dict(self):
+        return {
+            "records": self.records,
+            "validation_status": _counts(self.statuses),
+            "sections": {
+                section: _counts(counter) for section, counter in self.sections.items()
+            },
+            "detected_sections": _counts(self.detected),
+            "issue_codes": {
+                section: _counts(counter) for section, counter in self.codes.items()
+            },
+            "top_issues": [
+                {"issue": issue, "count": count}
+                for issue, count in self.issues.top(self.top)
+            ],
+            "issues": self.issues.to_dict()
+        }
+
+    @classmethod
+    def from_dict(cls, data, top=None):
+        # top_issues is derived from the sketch and is rebuilt, not read.
+        report = cls(DEFAULT_TOP if top is None else top)
+        report.records = data["records"]
+        report.statuses = Counter(data["validation_status"])
+        report.sections = {
+            section: Counter(counts) for section, counts in data["sections"].items()
+        }
+        report.detected = Counter(data["detected_sections"])
+        report.codes = {
+            section: Counter(counts) for section, counts in data["issue_codes"].items()
+        }
+        report.issues = HeavyHitters.from_dict(data["issues"])
+        return report
+
+def merge_reports(reports, top=None):
+    merged = None
+    for data in reports:
+        report = ValidationReport.from_dict(data, top)
+        merged = report if merged is None else merged.merge(report)
+    return merged if merged is not None else ValidationReport(DEFAULT_TOP if top is None else top)
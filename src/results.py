@@ -0,0 +1,263 @@
+from enum import IntEnum
+
+# Compact validation results. Issues are stored as a code plus references to
+# the offending values and only become text in to_dict(), so a run that just
+# counts codes never formats a message. The arguments are the very values
+# read from the document, not copies: render before mutating the input.
+
+class IssueCode(IntEnum):
+    TEXT = 0
+    INVALID_FORMAT_LIST = 1
+    INVALID_FORMAT_OBJECT = 2
+    EMPTY_ENTRY = 3
+    ENTRY_EMPTY_OR_NULL = 4
+    INSUFFICIENT_DETAILS = 5
+    INVALID_START_DATE = 6
+    INVALID_END_DATE = 7
+    END_BEFORE_START = 8
+    DESCRIPTION_TOO_SHORT = 9
+    DESCRIPTION_BELOW_MIN = 10
+    MISSING_NAME = 11
+    MISSING_DESCRIPTION = 12
+    MISSING_TECHNOLOGIES = 13
+    INVALID_PERCENTAGE = 14
+    INVALID_CGPA = 15
+    INVALID_GRADE = 16
+    INVALID_LINK_FORMAT = 17
+    INVALID_URL_FORMAT = 18
+    INVALID_VERIFICATION_URL = 19
+    SECTION_EMPTY = 20
+    VALIDATION_ERROR = 21
+    INVALID_LINK = 22
+    INVALID_PLATFORM_URL = 23
+    LINK_ERROR = 24
+    INVALID_EMAIL = 25
+    INVALID_PHONE = 26
+    INVALID_NAME = 27
+    BASIC_INFO_ERROR = 28
+    MISSING_FIELD = 29
+
+MESSAGES = {
+    IssueCode.TEXT: "{}",
+    IssueCode.INVALID_FORMAT_LIST: "Invalid format - expected list",
+    IssueCode.INVALID_FORMAT_OBJECT: "Invalid format - expected object",
+    IssueCode.EMPTY_ENTRY: "Invalid or empty {} entry",
+    IssueCode.ENTRY_EMPTY_OR_NULL: "Entry is empty or null",
+    IssueCode.INSUFFICIENT_DETAILS: "Insufficient {} details",
+    IssueCode.INVALID_START_DATE: "Invalid start date format: {}",
+    IssueCode.INVALID_END_DATE: "Invalid end date format: {}",
+    IssueCode.END_BEFORE_START: "End date before start date",
+    IssueCode.DESCRIPTION_TOO_SHORT: "Description too short",
+    IssueCode.DESCRIPTION_BELOW_MIN: "Description too short (min {} chars)",
+    IssueCode.MISSING_NAME: "Missing or null name",
+    IssueCode.MISSING_DESCRIPTION: "Missing description",
+    IssueCode.MISSING_TECHNOLOGIES: "Missing technologies",
+    IssueCode.INVALID_PERCENTAGE: "Invalid percentage: {}",
+    IssueCode.INVALID_CGPA: "Invalid CGPA: {}",
+    IssueCode.INVALID_GRADE: "Invalid grade value: {}",
+    IssueCode.INVALID_LINK_FORMAT: "Invalid link format: {}",
+    IssueCode.INVALID_URL_FORMAT: "Invalid URL format: {}",
+    IssueCode.INVALID_VERIFICATION_URL: "Invalid verification URL: {}",
+    IssueCode.SECTION_EMPTY: "{} section is empty",
+    IssueCode.VALIDATION_ERROR: "Validation error: {}",
+    IssueCode.INVALID_LINK: "Invalid URL in '{}': {}",
+    IssueCode.INVALID_PLATFORM_URL: "Invalid {} URL: {}",
+    IssueCode.LINK_ERROR: "Link validation error: {}",
+    IssueCode.INVALID_EMAIL: "Invalid email format: {}",
+    IssueCode.INVALID_PHONE: "Invalid phone number format: {}",
+    IssueCode.INVALID_NAME: "Invalid name format",
+    IssueCode.BASIC_INFO_ERROR: "Basic info validation error: {}",
+    IssueCode.MISSING_FIELD: "Missing {}"
+}
+
+# Shared by every entry and check without issues.
+NO_ISSUES = ()
+
+class Issue:
+    __slots__ = ("code", "args")
+
+    def __init__(self, code, *args):
+        self.code = code
+        self.args = args
+
+    @property
+    def message(self):
+        return MESSAGES[self.code].format(*self.args)
+
+    def __str__(self):
+        return self.message
+
+    def __repr__(self):
+        return f"Issue({self.code.name}, {self.message!r})"
+
+def issue_message(issue):
+    return issue.message
+
+def text_issue(message):
+    # Wraps an already-rendered message, e.g. from a previous JSON result.
+    return Issue(IssueCode.TEXT, message)
+
+def issue_payload(issue):
+    # The code and the arguments as strings: every message formats its
+    # arguments with a bare {}, and format(arg, "") is str(arg), so the
+    # issue renders the same after a round trip through JSON.
+    return [int(issue.code), *map(str, issue.args)]
+
+def issue_from_payload(item):
+    return Issue(IssueCode(item[0]), *item[1:])
+
+def _issues(items, load):
+    return [load(item) for item in items] or NO_ISSUES
+
+class EntryResult:
+    # technologies lists what a project entry names when the projects
+    # section has list_technologies set, and is None otherwise.
+    __slots__ = ("number", "issues", "technologies")
+
+    def __init__(self, number, issues=NO_ISSUES, technologies=None):
+        self.number = number
+        self.issues = issues
+        self.technologies = technologies
+
+    @property
+    def status(self):
+        return "PASS" if not self.issues else "FAIL"
+
+    def to_dict(self, render=issue_message):
+        result = {
+            "entry_number": self.number,
+            "status": self.status,
+            "issues": [render(issue) for issue in self.issues]
+        }
+        if self.technologies is not None:
+            result["technologies"] = list(self.technologies)
+        return result
+
+    @classmethod
+    def from_dict(cls, data, load=text_issue):
+        return cls(
+            data["entry_number"], _issues(data["issues"], load), data.get("technologies")
+        )
+
+class SectionResult:
+    # One of the four core sections: entries plus, for an empty or broken
+    # section, section-level issues.
+    __slots__ = ("status", "entries", "section_issues")
+
+    def __init__(self, status, entries=NO_ISSUES, section_issues=None):
+        self.status = status
+        self.entries = entries
+        self.section_issues = section_issues
+
+    def to_dict(self, render=issue_message):
+        result = {
+            "status": self.status,
+            "entries": [entry.to_dict(render) for entry in self.entries]
+        }
+        if self.section_issues is not None:
+            result["section_issues"] = [render(issue) for issue in self.section_issues]
+        return result
+
+    @classmethod
+    def from_dict(cls, data, load=text_issue):
+        issues = data.get("section_issues")
+        return cls(
+            data["status"],
+            [EntryResult.from_dict(entry, load) for entry in data["entries"]],
+            None if issues is None else _issues(issues, load)
+        )
+
+class CheckResult:
+    # The links and basic_info checks: a flat issue list.
+    __slots__ = ("status", "issues")
+
+    def __init__(self, status, issues=NO_ISSUES):
+        self.status = status
+        self.issues = issues
+
+    @classmethod
+    def of(cls, issues):
+        return cls("PASS" if not issues else "FAIL", issues)
+
+    def to_dict(self, render=issue_message):
+        return {
+            "status": self.status,
+            "issues": [render(issue) for issue in self.issues]
+        }
+
+    @classmethod
+    def from_dict(cls, data, load=text_issue):
+        return cls(data["status"], _issues(data["issues"], load))
+
+SECTION_TYPES = {"links": CheckResult, "basic_info": CheckResult}
+
+class ValidationResult:
+    __slots__ = (
+        "candidate_id", "name", "email", "phone", "status", "error",
+        "sections", "detected", "extra"
+    )
+
+    def __init__(self, basic_info, status, sections, detected, error=None):
+        self.candidate_id = basic_info.get("candidate_id", "unknown")
+        self.name = basic_info.get("name", "unknown")
+        self.email = basic_info.get("email", "unknown")
+        self.phone = basic_info.get("phone", "unknown")
+        self.status = status
+        self.error = error
+        self.sections = sections
+        self.detected = detected
+        # Run metadata such as "cache" and "debug", appended after the result.
+        self.extra = None
+
+    @classmethod
+    def from_error(cls, message, status="ERROR"):
+        return cls({}, status, {}, [], message)
+
+    def issues(self):
+        # (section, entry_number or None, issue) for every issue, without
+        # rendering any of them.
+        for section, result in self.sections.items():
+            if isinstance(result, CheckResult):
+                for issue in result.issues:
+                    yield section, None, issue
+                continue
+            for issue in result.section_issues or NO_ISSUES:
+                yield section, None, issue
+            for entry in result.entries:
+                for issue in entry.issues:
+                    yield section, entry.number, issue
+
+    def to_dict(self, render=issue_message):
+        # render turns each Issue into its JSON form: the message by
+        # default, issue_payload for a result that is read back later.
+        result = {
+            "candidate_id": self.candidate_id,
+            "name": self.name,
+            "email": self.email,
+            "phone": self.phone,
+            "validation_status": self.status
+        }
+        if self.error is not None:
+            result["error"] = self.error
+        result["validated_sections"] = {
+            section: value.to_dict(render) for section, value in self.sections.items()
+        }
+        result["detected_sections"] = list(self.detected)
+        if self.extra:
+            result.update(self.extra)
+        return result
+
+    @classmethod
+    def from_dict(cls, data, load=text_issue):
+        result = cls(
+            data, data["validation_status"],
+            {
+                section: SECTION_TYPES.get(section, SectionResult).from_dict(value, load)
+                for section, value in data["validated_sections"].items()
+            },
+            list(data["detected_sections"]),
+            data.get("error")
+        )
+        extra = {key: data[key] for key in ("cache", "debug") if key in data}
+        result.extra = extra or None
+        return result
@@ -2,25 +2,73 @@ from .utils import (
     validate_date, calculate_days, validate_url, validate_email,
     validate_phone, validate_percentage, validate_cgpa, is_null_or_empty
 )
-from .detector import find_field, find_all_links
+from .detector import scan_links, find_fields, PLATFORM_TABLE
+from .matcher import MATCHER
+from .plan import DEFAULT_PLAN
+from .results import IssueCode, Issue, EntryResult, SectionResult, NO_ISSUES
 
 def get_field(item, possible_names):
-    if isinstance(item, dict):
-        for key, value in item.items():
-            for name in possible_names:
-                if key.lower() == name.lower():
-                    return value
-        for value in item.values():
-            result = get_field(value, possible_names)
-            if result is not None:
-                return result
-    elif isinstance(item, list):
-        for element in item:
-            result = get_field(element, possible_names)
-            if result is not None:
-                return result
+    # Depth first: the first matching key of an object wins, and one that
+    # holds null hides everything below that object.
+    names = MATCHER.exact_set(possible_names)
+    stack = [item]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            for key, value in obj.items():
+                if key.lower() in names:
+                    if value is not None:
+                        return value
+                    break
+            else:
+                stack.extend(reversed(obj.values()))
+        elif isinstance(obj, list):
+            stack.extend(reversed(obj))
     return None
 
+class _FieldLookup:
+    # get_field per logical field, on demand.
+    def __init__(self, entry, fields):
+        self.entry = entry
+        self.fields = fields
+
+    def get(self, name):
+        return get_field(self.entry, self.fields[name])
+
+def entry_fields(entry, section, names, deadline=None):
+    # {name: value} for each logical field in names (a tuple), holding what
+    # get_field(entry, section.fields[name]) returns, all from one walk of
+    # the entry. Fields get_field would not find are left out.
+    try:
+        return find_fields(entry, names, section.field_matcher, True, deadline)
+    except AttributeError:
+        # A key that is not a string: look the fields up one by one, so
+        # whatever fails still fails where it always did.
+        return _FieldLookup(entry, section.fields)
+
+# required_fields and required_any names that differ from the logical field.
+REQUIRED_FIELD_NAMES = {"start_date": "start", "end_date": "end"}
+
+def required_names(section):
+    # The logical fields the section's required_fields and required_any need.
+    return tuple(
+        REQUIRED_FIELD_NAMES.get(field, field)
+        for field in section.required_fields + section.required_any
+    )
+
+def _lacks_all(fields, present):
+    return bool(fields) and not any(present[field] for field in fields)
+
+def _missing_fields(fields, present):
+    return [
+        Issue(IssueCode.MISSING_FIELD, field.replace("_", " "))
+        for field in fields if not present[field]
+    ]
+
+def _end_text(end):
+    # A boolean end, such as a "current" flag, is not a date.
+    return str(end) if end and not isinstance(end, bool) else None
+
 def extract_text(obj):
     if isinstance(obj, str):
         return obj
@@ -36,93 +84,86 @@ def extract_text(obj):
         return " ".join(str(x) for x in obj if x)
     return ""
 
-def validate_experience(exp_list):
+def check_experience(exp_list, section=None, deadline=None):
+    section = section or DEFAULT_PLAN.sections["experience"]
+    parser = section.date_parser
+    check_dates = section.validate_dates or section.validate_duration
+    names = ("title", "company", "description", "highlights")
+    if check_dates:
+        names += ("start", "end")
+    names += tuple(name for name in required_names(section) if name not in names)
     if not exp_list:
-        return {"status": "NOT_FOUND", "entries": []}
+        return SectionResult("NOT_FOUND")
     if isinstance(exp_list, dict):
         exp_list = [v for v in exp_list.values() if isinstance(v, dict)]
     if not isinstance(exp_list, list):
-        return {
-            "status": "FAIL",
-            "entries": [{
-                "entry_number": 1,
-                "status": "FAIL",
-                "issues": ["Invalid format - expected list"]
-            }]
-        }
+        return SectionResult("FAIL", [
+            EntryResult(1, [Issue(IssueCode.INVALID_FORMAT_LIST)])
+        ])
     entries = []
     all_passed = True
     for idx, exp in enumerate(exp_list, 1):
         entry_issues = []
         if is_null_or_empty(exp) or not isinstance(exp, dict):
-            entry_issues.append("Invalid or empty experience entry")
+            entry_issues.append(Issue(IssueCode.EMPTY_ENTRY, "experience"))
             all_passed = False
         else:
-            title = get_field(exp, [
-                "title", "position", "role",
-                "job_title", "designation",
-                "profile", "jobRole"
-            ])
-            company = get_field(exp, [
-                "company", "employer",
-                "organization", "firm",
-                "company_name", "org"
-            ])
-            start = get_field(exp, [
-                "startDate", "start_date",
-                "from", "start",
-                "joining_date"
-            ])
-            end = get_field(exp, [
-                "endDate", "end_date",
-                "to", "end",
-                "leaving_date"
-            ])
-            start_str = str(start) if start else None
-            end_str = str(end) if end else None
-            if start_str and not validate_date(start_str):
-                entry_issues.append(f"Invalid start date format: {start_str}")
-                all_passed = False
-            if end_str and end_str.lower() not in [
-                "present", "current", "ongoing", "now"
-            ]:
-                if not validate_date(end_str):
-                    entry_issues.append(f"Invalid end date format: {end_str}")
+            found = entry_fields(exp, section, names, deadline)
+            title = found.get("title")
+            company = found.get("company")
+            start = found.get("start")
+            end = found.get("end")
+            if check_dates:
+                start_str = str(start) if start else None
+                end_str = _end_text(end)
+                start_valid = bool(start_str) and validate_date(start_str, parser)
+                if section.validate_dates and start_str and not start_valid:
+                    entry_issues.append(Issue(IssueCode.INVALID_START_DATE, start_str))
                     all_passed = False
-                elif start_str and validate_date(start_str):
-                    if calculate_days(start_str, end_str) < 1:
-                        entry_issues.append("End date before start date")
-                        all_passed = False
-            desc = get_field(exp, [
-                "summary", "description",
-                "details", "about"
-            ])
+                if end_str and end_str.lower() not in [
+                    "present", "current", "ongoing", "now"
+                ]:
+                    if not validate_date(end_str, parser):
+                        if section.validate_dates:
+                            entry_issues.append(Issue(IssueCode.INVALID_END_DATE, end_str))
+                            all_passed = False
+                    elif section.validate_duration and start_valid:
+                        days = calculate_days(start_str, end_str, parser)
+                        if days < section.min_duration_days:
+                            entry_issues.append(Issue(IssueCode.END_BEFORE_START))
+                            all_passed = False
+            desc = found.get("description")
             if not desc:
-                highlights = get_field(exp, [
-                    "highlights", "responsibilities",
-                    "duties", "points", "tasks"
-                ])
+                highlights = found.get("highlights")
                 if highlights:
                     desc = extract_text(highlights)
-            if not title and not company and not desc:
-                entry_issues.append("Insufficient experience details")
+            present = {
+                "title": title, "company": company, "description": desc,
+                "start_date": start, "end_date": end
+            }
+            if _lacks_all(section.required_any, present):
+                entry_issues.append(Issue(IssueCode.INSUFFICIENT_DETAILS, "experience"))
                 all_passed = False
-            elif desc and isinstance(desc, str) and len(desc.strip()) < 5:
-                entry_issues.append("Description too short")
+            elif desc and isinstance(desc, str) and len(desc.strip()) < section.min_description_length:
+                entry_issues.append(Issue(IssueCode.DESCRIPTION_TOO_SHORT))
                 all_passed = False
-        entries.append({
-            "entry_number": idx,
-            "status": "PASS" if not entry_issues else "FAIL",
-            "issues": entry_issues
-        })
-    return {
-        "status": "PASS" if all_passed else "FAIL",
-        "entries": entries
-    }
-
-def validate_education(edu_data):
+            missing = _missing_fields(section.required_fields, present)
+            if missing:
+                entry_issues.extend(missing)
+                all_passed = False
+        entries.append(EntryResult(idx, entry_issues or NO_ISSUES))
+    return SectionResult("PASS" if all_passed else "FAIL", entries)
+
+def check_education(edu_data, section=None, deadline=None):
+    section = section or DEFAULT_PLAN.sections["education"]
+    parser = section.date_parser
+    check_dates = section.validate_dates or section.validate_duration
+    names = ("degree", "institution", "grade")
+    if check_dates:
+        names += ("start", "end")
+    names += tuple(name for name in required_names(section) if name not in names)
     if not edu_data:
-        return {"status": "NOT_FOUND", "entries": []}
+        return SectionResult("NOT_FOUND")
     if isinstance(edu_data, dict):
         edu_list = []
         for value in edu_data.values():
@@ -132,234 +173,188 @@ def validate_education(edu_data):
                 edu_list.extend([v for v in value if isinstance(v, dict)])
         edu_data = edu_list
     if not isinstance(edu_data, list):
-        return {
-            "status": "FAIL",
-            "entries": [{
-                "entry_number": 1,
-                "status": "FAIL",
-                "issues": ["Invalid format - expected list"]
-            }]
-        }
+        return SectionResult("FAIL", [
+            EntryResult(1, [Issue(IssueCode.INVALID_FORMAT_LIST)])
+        ])
     if not edu_data:
-        return {"status": "NOT_FOUND", "entries": []}
+        return SectionResult("NOT_FOUND")
     entries = []
     all_passed = True
     for idx, edu in enumerate(edu_data, 1):
         entry_issues = []
         if is_null_or_empty(edu) or not isinstance(edu, dict):
-            entry_issues.append("Invalid or empty education entry")
+            entry_issues.append(Issue(IssueCode.EMPTY_ENTRY, "education"))
             all_passed = False
         else:
-            degree = get_field(edu, [
-                "degree", "qualification",
-                "degree_name", "course",
-                "program", "field_of_study"
-            ])
-            institution = get_field(edu, [
-                "institution", "school",
-                "college", "university",
-                "institution_name", "institute",
-                "academy"
-            ])
-            grade = get_field(edu, [
-                "grade", "gpa", "cgpa",
-                "percentage", "score",
-                "marks", "result"
-            ])
+            found = entry_fields(edu, section, names, deadline)
+            degree = found.get("degree")
+            institution = found.get("institution")
+            grade = found.get("grade")
             if grade and not is_null_or_empty(grade):
                 grade_str = str(grade).strip().lower()
                 try:
                     if "%" in grade_str:
                         if not validate_percentage(grade_str):
-                            entry_issues.append(f"Invalid percentage: {grade}")
+                            entry_issues.append(Issue(IssueCode.INVALID_PERCENTAGE, grade))
                             all_passed = False
                     elif "cgpa" in grade_str or "gpa" in grade_str or "/" in grade_str:
                         if not validate_cgpa(grade_str):
-                            entry_issues.append(f"Invalid CGPA: {grade}")
+                            entry_issues.append(Issue(IssueCode.INVALID_CGPA, grade))
                             all_passed = False
                     else:
                         num = float(grade_str)
                         if num > 10:
                             if not (0 <= num <= 100):
-                                entry_issues.append(f"Invalid grade value: {grade}")
+                                entry_issues.append(Issue(IssueCode.INVALID_GRADE, grade))
                                 all_passed = False
                         else:
                             if not (0 <= num <= 10):
-                                entry_issues.append(f"Invalid grade value: {grade}")
+                                entry_issues.append(Issue(IssueCode.INVALID_GRADE, grade))
                                 all_passed = False
 
                 except (ValueError, TypeError):
                     pass
-            start = get_field(edu, [
-                "startDate", "start_date",
-                "from", "start",
-                "admission_date"
-            ])
-            end = get_field(edu, [
-                "endDate", "end_date",
-                "to", "end",
-                "graduation_date"
-            ])
-            duration = get_field(edu, [
-                "duration", "academic_duration",
-                "period"
-            ])
-            start_str = str(start) if start else None
-            end_str = str(end) if end else None
-            if start_str and not validate_date(start_str):
-                entry_issues.append(f"Invalid start date format: {start}")
-                all_passed = False
-
-            if end_str and end_str.lower() not in [
-                "present", "current", "ongoing", "now"
-            ]:
-                if not validate_date(end_str):
-                    entry_issues.append(f"Invalid end date format: {end}")
+            start = found.get("start")
+            end = found.get("end")
+            if check_dates:
+                start_str = str(start) if start else None
+                end_str = _end_text(end)
+                start_valid = bool(start_str) and validate_date(start_str, parser)
+                if section.validate_dates and start_str and not start_valid:
+                    entry_issues.append(Issue(IssueCode.INVALID_START_DATE, start))
                     all_passed = False
-                elif start_str and validate_date(start_str):
-                    if calculate_days(start_str, end_str) < 1:
-                        entry_issues.append("End date before start date")
-                        all_passed = False
-            if not start and not end and duration:
-                pass
-            if not degree and not institution:
-                entry_issues.append("Insufficient education details")
+
+                if end_str and end_str.lower() not in [
+                    "present", "current", "ongoing", "now"
+                ]:
+                    if not validate_date(end_str, parser):
+                        if section.validate_dates:
+                            entry_issues.append(Issue(IssueCode.INVALID_END_DATE, end))
+                            all_passed = False
+                    elif section.validate_duration and start_valid:
+                        days = calculate_days(start_str, end_str, parser)
+                        if days < section.min_duration_days:
+                            entry_issues.append(Issue(IssueCode.END_BEFORE_START))
+                            all_passed = False
+            present = {
+                "degree": degree, "institution": institution,
+                "start_date": start, "end_date": end
+            }
+            if _lacks_all(section.required_any, present):
+                entry_issues.append(Issue(IssueCode.INSUFFICIENT_DETAILS, "education"))
+                all_passed = False
+            missing = _missing_fields(section.required_fields, present)
+            if missing:
+                entry_issues.extend(missing)
                 all_passed = False
-        entries.append({
-            "entry_number": idx,
-            "status": "PASS" if not entry_issues else "FAIL",
-            "issues": entry_issues
-        })
-    return {
-        "status": "PASS" if all_passed else "FAIL",
-        "entries": entries
-    }
-
-def validate_projects(proj_list):
+        entries.append(EntryResult(idx, entry_issues or NO_ISSUES))
+    return SectionResult("PASS" if all_passed else "FAIL", entries)
+
+def check_projects(proj_list, section=None, deadline=None):
+    section = section or DEFAULT_PLAN.sections["projects"]
+    min_length = section.min_description_length
+    names = ("points", "description", "link")
+    if "name" in required_names(section):
+        names += ("name",)
+    if section.require_technologies:
+        names += ("technologies",)
     if not proj_list:
-        return {"status": "NOT_FOUND", "entries": []}
+        return SectionResult("NOT_FOUND")
     if isinstance(proj_list, dict):
         proj_list = [v for v in proj_list.values() if isinstance(v, dict)]
     if not isinstance(proj_list, list):
-        return {
-            "status": "FAIL",
-            "entries": [{
-                "entry_number": 1,
-                "status": "FAIL",
-                "issues": ["Invalid format - expected list"]
-            }]
-        }
+        return SectionResult("FAIL", [
+            EntryResult(1, [Issue(IssueCode.INVALID_FORMAT_LIST)])
+        ])
     entries = []
     all_passed = True
     for idx, proj in enumerate(proj_list, 1):
         entry_issues = []
+        named = None
         if is_null_or_empty(proj):
-            entry_issues.append("Entry is empty or null")
+            entry_issues.append(Issue(IssueCode.ENTRY_EMPTY_OR_NULL))
             all_passed = False
         elif not isinstance(proj, dict):
-            entry_issues.append("Invalid format - expected object")
+            entry_issues.append(Issue(IssueCode.INVALID_FORMAT_OBJECT))
             all_passed = False
         else:
-            name = get_field(proj, [
-                "name", "title", "project_name",
-                "project_title", "project", "projectName"
-            ])
-            if is_null_or_empty(name):
-                entry_issues.append("Missing or null name")
-                all_passed = False
-            points = get_field(proj, ["points", "highlights", "bullets"])
-            desc = ""
-            if isinstance(points, dict):
-                desc = " ".join(
-                    str(v) for v in points.values()
-                    if isinstance(v, str)
-                )
-            elif isinstance(points, list):
-                desc = " ".join(
-                    str(v) for v in points
-                    if isinstance(v, str)
-                )
+            found = entry_fields(proj, section, names, deadline)
+            if "name" in section.required_fields:
+                name = found.get("name")
+                if is_null_or_empty(name):
+                    entry_issues.append(Issue(IssueCode.MISSING_NAME))
+                    all_passed = False
+            points_text = _joined_strings(found.get("points"))
+            desc = points_text
             if not desc:
-                desc = get_field(proj, [
-                    "description", "summary", "details",
-                    "about", "project_summary"
-                ])
+                desc = found.get("description")
                 if isinstance(desc, list):
                     desc = " ".join(str(x) for x in desc if x)
             if is_null_or_empty(desc):
-                entry_issues.append("Missing description")
+                if "description" in section.required_fields:
+                    entry_issues.append(Issue(IssueCode.MISSING_DESCRIPTION))
+                    all_passed = False
+            elif isinstance(desc, str) and len(desc.strip()) < min_length:
+                entry_issues.append(Issue(IssueCode.DESCRIPTION_BELOW_MIN, min_length))
                 all_passed = False
-            elif isinstance(desc, str) and len(desc.strip()) < 10:
-                entry_issues.append("Description too short (min 10 chars)")
+            if _lacks_all(section.required_any, {"name": found.get("name"), "description": desc}):
+                entry_issues.append(Issue(IssueCode.INSUFFICIENT_DETAILS, "project"))
                 all_passed = False
-            tech = get_field(proj, [
-                "technologies", "tech", "tech_stack",
-                "tools", "stack", "built_with",
-                "techstack", "techStack"
-            ])
-            combined_text = ""
-            if isinstance(points, dict):
-                combined_text += " ".join(
-                    str(v) for v in points.values()
-                    if isinstance(v, str)
-                )
-            elif isinstance(points, list):
-                combined_text += " ".join(
-                    str(v) for v in points
-                    if isinstance(v, str)
-                )
-            if isinstance(desc, str):
-                combined_text += " " + desc
-            tech_keywords = [
-                "python", "java", "c++", "c#", "javascript",
-                "react", "node", "mongodb", "mysql",
-                "django", "flask", "spring", "html",
-                "css", "machine learning", "ai",
-                "deep learning", "nlp"
-            ]
-            has_keyword = any(
-                keyword in combined_text.lower()
-                for keyword in tech_keywords
-            )
-            link = get_field(proj, [
-                "link", "github", "url",
-                "github_link", "repo",
-                "repository", "repo_link",
-                "github_url"
-            ])
+            link = found.get("link")
             if isinstance(link, dict):
-                nested_link = get_field(link, [
-                    "github_url", "url", "link"
-                ])
-                link = nested_link
+                link = entry_fields(link, section, ("nested_link",), deadline).get("nested_link")
             link_valid = True
             if link and not is_null_or_empty(link):
                 if not isinstance(link, str):
-                    entry_issues.append(f"Invalid link format: {link}")
+                    entry_issues.append(Issue(IssueCode.INVALID_LINK_FORMAT, link))
                     link_valid = False
                     all_passed = False
                 elif not validate_url(str(link)):
-                    entry_issues.append(f"Invalid URL format: {link}")
+                    entry_issues.append(Issue(IssueCode.INVALID_URL_FORMAT, link))
                     link_valid = False
                     all_passed = False
             else:
                 link_valid = False
-            if not tech and not has_keyword and not link_valid:
-                entry_issues.append("Missing technologies")
-                all_passed = False
-        entries.append({
-            "entry_number": idx,
-            "status": "PASS" if not entry_issues else "FAIL",
-            "issues": entry_issues
-        })
-    return {
-        "status": "PASS" if all_passed else "FAIL",
-        "entries": entries
-    }
-
-def validate_certifications(cert_list):
+            if section.list_technologies:
+                named = _named_technologies(section.technologies, points_text, desc)
+            if section.require_technologies and not link_valid:
+                tech = found.get("technologies")
+                if not tech and not (named or named is None and _mentions_technology(
+                    section.technologies, points_text, desc
+                )):
+                    entry_issues.append(Issue(IssueCode.MISSING_TECHNOLOGIES))
+                    all_passed = False
+        entries.append(EntryResult(idx, entry_issues or NO_ISSUES, named))
+    return SectionResult("PASS" if all_passed else "FAIL", entries)
+
+def _joined_strings(value):
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, list):
+        return ""
+    return " ".join(str(v) for v in value if isinstance(v, str))
+
+def _mentions_technology(technologies, points_text, desc):
+    # points_text and desc are scanned separately: desc is often the very
+    # same string, and a keyword must not straddle the two.
+    if technologies.contains(points_text):
+        return True
+    return isinstance(desc, str) and desc is not points_text and technologies.contains(desc)
+
+def _named_technologies(technologies, points_text, desc):
+    # The technologies named in the points or the description, each once.
+    found = technologies.find_all(points_text)
+    if isinstance(desc, str) and desc is not points_text:
+        found.extend(name for name in technologies.find_all(desc) if name not in found)
+    return found
+
+def check_certifications(cert_list, section=None, deadline=None):
+    section = section or DEFAULT_PLAN.sections["certifications"]
+    names = required_names(section)
+    if section.validate_url and "url" not in names:
+        names += ("url",)
     if not cert_list:
-        return {"status": "NOT_FOUND", "entries": []}
+        return SectionResult("NOT_FOUND")
     if isinstance(cert_list, dict):
         temp = []
         for value in cert_list.values():
@@ -373,14 +368,9 @@ def validate_certifications(cert_list):
     if isinstance(cert_list, str):
         cert_list = [{"name": cert_list}]
     if not isinstance(cert_list, list):
-        return {
-            "status": "FAIL",
-            "entries": [{
-                "entry_number": 1,
-                "status": "FAIL",
-                "issues": ["Invalid format - expected list"]
-            }]
-        }
+        return SectionResult("FAIL", [
+            EntryResult(1, [Issue(IssueCode.INVALID_FORMAT_LIST)])
+        ])
     entries = []
     all_passed = True
     for idx, cert in enumerate(cert_list, 1):
@@ -388,59 +378,50 @@ def validate_certifications(cert_list):
         if isinstance(cert, str):
             cert = {"name": cert}
         if is_null_or_empty(cert) or not isinstance(cert, dict):
-            entry_issues.append("Invalid or empty certification entry")
+            entry_issues.append(Issue(IssueCode.EMPTY_ENTRY, "certification"))
             all_passed = False
-        else:
-            name = get_field(cert, [
-                "name", "certificate",
-                "title", "certificate_name",
-                "cert_name", "credential"
-            ])
-            issuer = get_field(cert, [
-                "issuer", "organization",
-                "issued_by", "provider",
-                "authority", "platform"
-            ])
-            url = get_field(cert, [
-                "verification_url",
-                "credential_url",
-                "certificate_url",
-                "url", "link"
-            ])
-            if not name and not issuer:
-                entry_issues.append("Insufficient certification details")
+        elif names:
+            found = entry_fields(cert, section, names, deadline)
+            present = {
+                "name": found.get("name"), "issuer": found.get("issuer"),
+                "url": found.get("url")
+            }
+            if _lacks_all(section.required_any, present):
+                entry_issues.append(Issue(IssueCode.INSUFFICIENT_DETAILS, "certification"))
                 all_passed = False
-            if url and not is_null_or_empty(url):
-                if not isinstance(url, str):
-                    entry_issues.append(f"Invalid URL format: {url}")
-                    all_passed = False
-                elif not validate_url(str(url)):
-                    entry_issues.append(f"Invalid verification URL: {url}")
-                    all_passed = False
-        entries.append({
-            "entry_number": idx,
-            "status": "PASS" if not entry_issues else "FAIL",
-            "issues": entry_issues
-        })
-    return {
-        "status": "PASS" if all_passed else "FAIL",
-        "entries": entries
-    }
+            missing = _missing_fields(section.required_fields, present)
+            if missing:
+                entry_issues.extend(missing)
+                all_passed = False
+            if section.validate_url:
+                url = found.get("url")
+                if url and not is_null_or_empty(url):
+                    if not isinstance(url, str):
+                        entry_issues.append(Issue(IssueCode.INVALID_URL_FORMAT, url))
+                        all_passed = False
+                    elif not validate_url(str(url)):
+                        entry_issues.append(Issue(IssueCode.INVALID_VERIFICATION_URL, url))
+                        all_passed = False
+        entries.append(EntryResult(idx, entry_issues or NO_ISSUES))
+    return SectionResult("PASS" if all_passed else "FAIL", entries)
 
-def validate_links(data):
+def normalize_url(url):
+    if not isinstance(url, str):
+        return None
+    url = url.strip()
+    if not url:
+        return None
+    if not url.startswith(("http://", "https://")):
+        if "." in url:
+            url = "https://" + url
+    return url
+
+def check_links(data, deadline=None):
     issues = []
     seen_urls = set()
-    def normalize_url(url):
-        if not isinstance(url, str):
-            return None
-        url = url.strip()
-        if not url:
-            return None
-        if not url.startswith(("http://", "https://")):
-            if "." in url:
-                url = "https://" + url
-        return url
-    all_links = find_all_links(data)
+    # Free-standing links and the platform fields are collected in one walk;
+    # seen_urls makes sure each URL is checked and reported once.
+    all_links, platforms = scan_links(data, deadline=deadline)
     for field, url in all_links:
         url = normalize_url(url)
         if not url:
@@ -448,24 +429,10 @@ def validate_links(data):
         if url not in seen_urls:
             seen_urls.add(url)
             if not validate_url(url):
-                issues.append(f"Invalid URL in '{field}': {url}")
-    specific_fields = [
-        "linkedin", "github", "portfolio",
-        "website", "youtube", "twitter",
-        "leetcode", "codeforces",
-        "codechef", "hackerrank",
-        "stackoverflow", "medium",
-        "blog"
-    ]
-    for field in specific_fields:
-        value = find_field(data, [
-            field,
-            field + "_profile",
-            field + "_url",
-            field + "_link",
-            field + "Url",
-            field + "Link"
-        ])
+                issues.append(Issue(IssueCode.INVALID_LINK, field, url))
+    for slot in PLATFORM_TABLE:
+        field = slot[1]
+        value = platforms.get(slot)
         if isinstance(value, list):
             values = value
         else:
@@ -478,10 +445,20 @@ def validate_links(data):
                 seen_urls.add(url)
 
                 if not validate_url(url):
-                    issues.append(f"Invalid {field} URL: {url}")
+                    issues.append(Issue(IssueCode.INVALID_PLATFORM_URL, field, url))
     return issues
 
-def validate_basic_info(info):
+def has_invalid_links(values):
+    # Whether any of the values, link strings or platform field values,
+    # would get an issue from check_links.
+    for value in values:
+        for val in value if isinstance(value, list) else [value]:
+            url = normalize_url(val)
+            if url and not validate_url(url):
+                return True
+    return False
+
+def check_basic_info(info):
     issues = []
     email = info.get("email")
     if email and email != "unknown":
@@ -492,13 +469,13 @@ def validate_basic_info(info):
                     valid_found = True
                     break
             if not valid_found:
-                issues.append(f"Invalid email format: {email}")
+                issues.append(Issue(IssueCode.INVALID_EMAIL, email))
         elif isinstance(email, str):
             if not validate_email(email):
-                issues.append(f"Invalid email format: {email}")
+                issues.append(Issue(IssueCode.INVALID_EMAIL, email))
 
         else:
-            issues.append(f"Invalid email format: {email}")
+            issues.append(Issue(IssueCode.INVALID_EMAIL, email))
     phone = info.get("phone")
     if phone and phone != "unknown":
         if isinstance(phone, list):
@@ -508,15 +485,35 @@ def validate_basic_info(info):
                     valid_found = True
                     break
             if not valid_found:
-                issues.append(f"Invalid phone number format: {phone}")
+                issues.append(Issue(IssueCode.INVALID_PHONE, phone))
         elif isinstance(phone, (str, int)):
             if not validate_phone(str(phone)):
-                issues.append(f"Invalid phone number format: {phone}")
+                issues.append(Issue(IssueCode.INVALID_PHONE, phone))
 
         else:
-            issues.append(f"Invalid phone number format: {phone}")
+            issues.append(Issue(IssueCode.INVALID_PHONE, phone))
     name = info.get("name")
     if name and name != "unknown":
         if not isinstance(name, str) or len(name.strip()) < 2:
-            issues.append("Invalid name format")
+            issues.append(Issue(IssueCode.INVALID_NAME))
     return issues
+
+# Plain-dict forms of the checks above, as they appear in the JSON output.
+
+def validate_experience(exp_list, section=None):
+    return check_experience(exp_list, section).to_dict()
+
+def validate_education(edu_data, section=None):
+    return check_education(edu_data, section).to_dict()
+
+def validate_projects(proj_list, section=None):
+    return check_projects(proj_list, section).to_dict()
+
+def validate_certifications(cert_list, section=None):
+    return check_certifications(cert_list, section).to_dict()
+
+def validate_links(data):
+    return [issue.message for issue in check_links(data)]
+
+def validate_basic_info(info):
+    return [issue.message for issue in check_basic_info(info)]
@@ -0,0 +1,315 @@
+import os
+import json
+import asyncio
+from urllib.parse import parse_qs
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from . import pool, codec
+from .validator import error_result
+from .plan import load_plan, plan_changed
+from .tracing import TRACER
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+DEFAULT_QUEUE_SIZE = 64
+DEFAULT_MAX_BODY = 64 * 1024 * 1024
+MAX_HEADER_BYTES = 64 * 1024
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Payload Too Large",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable"
+}
+
+class _HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+def _validate_document(raw):
+    # Runs in a worker: a JSON array body is a batch, anything else is a
+    # single resume. Also returns how many records were validated.
+    try:
+        data = codec.loads(raw)
+    except ValueError as e:
+        return 400, json.dumps({"error": f"Invalid JSON: {str(e)}"}), 0
+    if isinstance(data, list):
+        results = [pool.worker_validator().validate(item) for item in data]
+        return 200, codec.dumpb(results), len(results)
+    return 200, codec.dumpb(pool.worker_validator().validate(data)), 1
+
+def _validate_lines(lines):
+    return b"".join(line + b"\n" for line in pool.validate_chunk(lines))
+
+def _set_plan(plan):
+    pool.worker_validator().set_plan(plan)
+
+class ValidationServer:
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, workers=None,
+                 queue_size=DEFAULT_QUEUE_SIZE, max_body=DEFAULT_MAX_BODY,
+                 config_path=None, chunk_size=pool.DEFAULT_CHUNK_SIZE,
+                 cache_spec=None, trace=False, sections=None, fail_fast=False):
+        self.host = host
+        self.port = port
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.queue_size = queue_size
+        self.max_body = max_body
+        self.config_path = config_path
+        self.chunk_size = chunk_size
+        self.cache_spec = cache_spec
+        self.trace = trace
+        self.sections = sections
+        self.fail_fast = fail_fast
+        self.executor = None
+        self.queue = None
+        self.plan = None
+        self.failed_mtime = None
+        self.stats = {"requests": 0, "records": 0, "rejected": 0, "reloads": 0}
+
+    def _make_executor(self):
+        # workers=0 keeps one warm validator in a single background thread,
+        # which still keeps validation off the event loop.
+        if self.workers > 0:
+            return ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=pool.init_worker,
+                initargs=self._worker_args()
+            )
+        pool.init_worker(*self._worker_args())
+        return ThreadPoolExecutor(max_workers=1)
+
+    def _worker_args(self):
+        return (
+            self.config_path, self.cache_spec, self.trace,
+            self.sections, self.fail_fast
+        )
+
+    async def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            fn, arg, future = await self.queue.get()
+            try:
+                if self.trace and self.workers > 0:
+                    result, stages = await loop.run_in_executor(
+                        self.executor, pool.traced_call, fn, arg
+                    )
+                    TRACER.merge(stages)
+                else:
+                    result = await loop.run_in_executor(self.executor, fn, arg)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                self.queue.task_done()
+
+    async def cache_stats(self):
+        # With worker processes the counters are those of whichever worker
+        # takes the call; each worker keeps its own caches.
+        if self.workers > 0:
+            return await asyncio.get_running_loop().run_in_executor(
+                self.executor, pool.cache_stats
+            )
+        return pool.cache_stats()
+
+    async def reload(self, force=False):
+        # Swaps in the plan of an edited config between requests. Worker
+        # processes load it themselves, so they are replaced; requests
+        # already running finish on the old ones. A config that fails to
+        # load keeps the current plan and is not retried until it changes
+        # again.
+        if not force:
+            if not plan_changed(self.plan):
+                return False
+            if os.path.getmtime(self.plan.source) == self.failed_mtime:
+                return False
+        try:
+            plan = load_plan(self.config_path)
+        except Exception as e:
+            source = self.plan.source
+            self.failed_mtime = os.path.getmtime(source) if os.path.exists(source) else None
+            self.stats["reload_error"] = str(e)
+            return False
+        self.plan = plan
+        self.failed_mtime = None
+        self.stats.pop("reload_error", None)
+        self.stats["reloads"] += 1
+        if self.workers > 0:
+            old, self.executor = self.executor, self._make_executor()
+            old.shutdown(wait=False)
+        else:
+            # On the validator's own thread, after the work queued before it.
+            await asyncio.get_running_loop().run_in_executor(
+                self.executor, _set_plan, plan
+            )
+        return True
+
+    def submit(self, fn, arg):
+        # Raises asyncio.QueueFull when the bounded queue is full, which the
+        # handler turns into a 503 so clients back off.
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((fn, arg, future))
+        return future
+
+    async def validate_body(self, body):
+        return await self.submit(_validate_document, body)
+
+    async def validate_ndjson(self, body):
+        lines = [line for line in (line.strip() for line in body.splitlines()) if line]
+        futures = []
+        try:
+            for i in range(0, len(lines), self.chunk_size):
+                futures.append(self.submit(_validate_lines, lines[i:i + self.chunk_size]))
+        except asyncio.QueueFull:
+            for future in futures:
+                future.cancel()
+            raise
+        parts = await asyncio.gather(*futures)
+        self.stats["records"] += len(lines)
+        return b"".join(parts)
+
+    async def _read_request(self, reader):
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError:
+            return None
+        except asyncio.LimitOverrunError:
+            raise _HTTPError(431, "Request headers too large")
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ", 2)
+        except ValueError:
+            raise _HTTPError(400, "Malformed request line")
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+        body = b""
+        if method == "POST":
+            if "content-length" not in headers:
+                raise _HTTPError(411, "Content-Length required")
+            try:
+                length = int(headers["content-length"])
+            except ValueError:
+                raise _HTTPError(400, "Invalid Content-Length")
+            if length > self.max_body:
+                raise _HTTPError(413, f"Body exceeds {self.max_body} bytes")
+            body = await reader.readexactly(length)
+        return method, target, version, headers, body
+
+    async def _route(self, method, target, headers, body):
+        path, _, query = target.partition("?")
+        if path == "/metrics":
+            if parse_qs(query).get("format") == ["json"]:
+                return 200, "application/json", TRACER.dump("json")
+            return 200, "text/plain; version=0.0.4", TRACER.dump("prometheus")
+        if path == "/health":
+            return 200, "application/json", json.dumps({
+                "status": "ok",
+                "queued": self.queue.qsize(),
+                "queue_size": self.queue_size,
+                **self.stats,
+                "plan_version": self.plan.version,
+                "caches": await self.cache_stats()
+            })
+        if path not in ("/validate", "/validate/ndjson", "/reload"):
+            return 404, "application/json", json.dumps({"error": "Not found"})
+        if method != "POST":
+            return 405, "application/json", json.dumps({"error": "Use POST"})
+        if path == "/reload":
+            reloaded = await self.reload(force=True)
+            payload = {"reloaded": reloaded, "version": self.plan.version}
+            if not reloaded:
+                payload["error"] = self.stats["reload_error"]
+            return (200 if reloaded else 400), "application/json", json.dumps(payload)
+        await self.reload()
+        content_type = headers.get("content-type", "")
+        if path == "/validate/ndjson" or "ndjson" in content_type:
+            return 200, "application/x-ndjson", await self.validate_ndjson(body)
+        status, payload, records = await self.validate_body(body)
+        self.stats["records"] += records
+        return status, "application/json", payload
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                headers, version = {}, "HTTP/1.0"
+                try:
+                    request = await self._read_request(reader)
+                    if request is None:
+                        break
+                    method, target, version, headers, body = request
+                    self.stats["requests"] += 1
+                    status, content_type, payload = await self._route(
+                        method, target, headers, body
+                    )
+                except _HTTPError as e:
+                    status, content_type = e.status, "application/json"
+                    payload = json.dumps({"error": e.message})
+                except asyncio.QueueFull:
+                    self.stats["rejected"] += 1
+                    status, content_type = 503, "application/json"
+                    payload = json.dumps({"error": "Server busy, retry later"})
+                except Exception as e:
+                    status, content_type = 500, "application/json"
+                    payload = json.dumps(error_result(f"Unexpected error: {str(e)}"))
+                keep_alive = (
+                    version == "HTTP/1.1"
+                    and headers.get("connection", "").lower() != "close"
+                    and status < 400
+                )
+                data = payload if isinstance(payload, bytes) else payload.encode("utf-8")
+                writer.write((
+                    f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    + ("Retry-After: 1\r\n" if status == 503 else "")
+                    + f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                ).encode("latin-1") + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, ready=None):
+        self.plan = load_plan(self.config_path)
+        self.executor = self._make_executor()
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        dispatchers = [
+            asyncio.create_task(self._dispatch())
+            for _ in range(max(self.workers, 1))
+        ]
+        server = await asyncio.start_server(
+            self.handle, self.host, self.port, limit=MAX_HEADER_BYTES
+        )
+        self.port = server.sockets[0].getsockname()[1]
+        if ready is not None:
+            ready(self)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            for task in dispatchers:
+                task.cancel()
+            self.executor.shutdown(cancel_futures=True)
+
+def run_server(**kwargs):
+    server = ValidationServer(**kwargs)
+    asyncio.run(server.serve(
+        ready=lambda s: print(
+            json.dumps({"listening": f"http://{s.host}:{s.port}", "workers": s.workers}),
+            flush=True
+        )
+    ))
@@ -0,0 +1,125 @@
+import os
+import glob
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from . import codec
+from .results import ValidationResult
+
+DEFAULT_READ_THREADS = 8
+DEFAULT_READ_AHEAD = 256
+FILE_SUFFIXES = (".json", ".ndjson", ".jsonl")
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+_GLOB_CHARS = "*?["
+
+def is_pattern(path):
+    # A path that names an existing file is taken literally, even if it
+    # contains glob characters.
+    return any(ch in path for ch in _GLOB_CHARS) and not os.path.exists(path)
+
+def is_multi_input(paths):
+    return len(paths) > 1 or any(
+        is_pattern(path) or os.path.isdir(path) for path in paths
+    )
+
+def _walk(directory):
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(FILE_SUFFIXES):
+                yield os.path.join(root, name)
+
+def expand_paths(paths):
+    # Directories are walked recursively for .json/.ndjson/.jsonl files and
+    # patterns are expanded with glob (** spans directories), both in sorted
+    # order. Explicit files are taken as given.
+    for path in paths:
+        if os.path.isdir(path):
+            yield from _walk(path)
+        elif is_pattern(path):
+            matches = sorted(glob.iglob(path, recursive=True))
+            if not matches:
+                raise ValueError(f"No files match {path!r}")
+            for match in matches:
+                if os.path.isdir(match):
+                    yield from _walk(match)
+                else:
+                    yield match
+        elif not os.path.exists(path):
+            raise FileNotFoundError(2, "No such file or directory", path)
+        else:
+            yield path
+
+def decode_file(path, data):
+    # An NDJSON line that is not valid JSON becomes its ValueError in the
+    # list, so it fails on its own as in stream mode.
+    if path.lower().endswith(NDJSON_SUFFIXES):
+        records = []
+        for line_number, line in enumerate(data.splitlines(), 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(codec.loads(line))
+            except ValueError as e:
+                records.append(ValueError(f"line {line_number}: {str(e)}"))
+        return records
+    return codec.loads(data)
+
+def read_file(path, parse=True):
+    # Returns (path, content). Content is the decoded document, the raw
+    # bytes when parse is false, or the OSError/ValueError that stopped it.
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        return path, e
+    if not parse:
+        return path, data
+    try:
+        return path, decode_file(path, data)
+    except ValueError as e:
+        return path, e
+
+def iter_files(paths, threads=DEFAULT_READ_THREADS, read_ahead=DEFAULT_READ_AHEAD,
+               parse=True):
+    # Reads files on a thread pool, which overlaps the open/read latency of
+    # many small files, and yields (path, content) in input order. At most
+    # read_ahead files are read but not yet consumed, so a slow consumer
+    # holds back the readers instead of filling memory.
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        pending = deque()
+        for path in paths:
+            pending.append(executor.submit(read_file, path, parse))
+            if len(pending) >= read_ahead:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def _sourced(result, path, index=None):
+    extra = dict(result.extra or {}, source=path)
+    if index is not None:
+        extra["source_index"] = index
+    result.extra = extra
+    return result
+
+def file_results(validator, path, content):
+    # Compact results for one file: one per record, each tagged with the
+    # file path and, for arrays and NDJSON files, the record's position.
+    if isinstance(content, (bytes, bytearray)):
+        try:
+            content = decode_file(path, content)
+        except ValueError as e:
+            content = e
+    if isinstance(content, OSError):
+        yield _sourced(ValidationResult.from_error(f"Error reading file: {str(content)}"), path)
+    elif isinstance(content, ValueError):
+        yield _sourced(ValidationResult.from_error(f"Invalid JSON: {str(content)}"), path)
+    elif isinstance(content, list):
+        for index, record in enumerate(content):
+            if isinstance(record, ValueError):
+                result = ValidationResult.from_error(f"Invalid JSON: {str(record)}")
+            else:
+                result = validator.validate_compact(record)
+            yield _sourced(result, path, index)
+    else:
+        yield _sourced(validator.validate_compact(content), path)
@@ -0,0 +1,163 @@
+import threading
+from time import perf_counter_ns
+from . import codec
+
+# Log-linear buckets in the style of HdrHistogram: values below 32ns are
+# exact, above that every power of two is split into 16 sub-buckets, which
+# keeps any recorded latency within ~6% of its bucket.
+SUB_BUCKETS = 16
+LINEAR_LIMIT = 2 * SUB_BUCKETS
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+def bucket_index(value):
+    if value < LINEAR_LIMIT:
+        return max(value, 0)
+    shift = value.bit_length() - 5
+    return LINEAR_LIMIT + (shift - 1) * SUB_BUCKETS + (value >> shift) - SUB_BUCKETS
+
+def bucket_bounds(index):
+    if index < LINEAR_LIMIT:
+        return index, index
+    shift = (index - LINEAR_LIMIT) // SUB_BUCKETS + 1
+    top = (index - LINEAR_LIMIT) % SUB_BUCKETS + SUB_BUCKETS
+    low = top << shift
+    return low, low + (1 << shift) - 1
+
+class LatencyHistogram:
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self.buckets = {}
+
+    def record(self, value):
+        index = bucket_index(value)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    def quantile(self, q):
+        if not self.count:
+            return 0
+        target = max(1, int(q * self.count + 0.5))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= target:
+                low, high = bucket_bounds(index)
+                return min((low + high) // 2, self.max)
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "sum_ns": self.total,
+            "min_ns": self.min or 0,
+            "max_ns": self.max or 0,
+            "quantiles_ns": {str(q): self.quantile(q) for q in QUANTILES},
+            "buckets": self.buckets
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls()
+        histogram.count = data["count"]
+        histogram.total = data["sum_ns"]
+        histogram.min = data["min_ns"] if data["count"] else None
+        histogram.max = data["max_ns"] if data["count"] else None
+        histogram.buckets = {int(k): v for k, v in data["buckets"].items()}
+        return histogram
+
+class StageTracer:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stages = {}
+
+    def record(self, stage, value):
+        with self._lock:
+            histogram = self.stages.get(stage)
+            if histogram is None:
+                histogram = self.stages[stage] = LatencyHistogram()
+            histogram.record(value)
+
+    def snapshot(self):
+        with self._lock:
+            return {stage: h.to_dict() for stage, h in self.stages.items()}
+
+    def drain(self):
+        # Hands the histograms to the caller and starts fresh, so worker
+        # processes can ship deltas back to the parent for merging.
+        with self._lock:
+            data = {stage: h.to_dict() for stage, h in self.stages.items()}
+            self.stages = {}
+        return data
+
+    def merge(self, data):
+        if not data:
+            return
+        with self._lock:
+            for stage, values in data.items():
+                incoming = LatencyHistogram.from_dict(values)
+                histogram = self.stages.get(stage)
+                if histogram is None:
+                    self.stages[stage] = incoming
+                else:
+                    histogram.merge(incoming)
+
+    def to_json(self):
+        return {
+            stage: {k: v for k, v in values.items() if k != "buckets"}
+            for stage, values in sorted(self.snapshot().items())
+        }
+
+    def to_prometheus(self, metric="resume_validator_stage_latency_seconds"):
+        lines = [
+            f"# HELP {metric} Per-stage validation latency.",
+            f"# TYPE {metric} summary"
+        ]
+        with self._lock:
+            stages = sorted(self.stages.items())
+        for stage, histogram in stages:
+            label = f'stage="{stage}"'
+            for q in QUANTILES:
+                value = histogram.quantile(q) / 1e9
+                lines.append(f'{metric}{{{label},quantile="{q}"}} {value:.9f}')
+            lines.append(f"{metric}_sum{{{label}}} {histogram.total / 1e9:.9f}")
+            lines.append(f"{metric}_count{{{label}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, fmt="json"):
+        if fmt == "prometheus":
+            return self.to_prometheus()
+        return codec.dumps(self.to_json(), "pretty")
+
+TRACER = StageTracer()
+
+def traced(stage, fn, timings):
+    # Wraps a stage so each call adds its latency to the process-wide
+    # histogram and to the current record's timings. Only installed when
+    # tracing is on; untraced validators call the stage functions directly.
+    def run(*args):
+        started = perf_counter_ns()
+        try:
+            return fn(*args)
+        finally:
+            elapsed = perf_counter_ns() - started
+            TRACER.record(stage, elapsed)
+            timings[stage] = round(elapsed / 1000, 1)
+    return run
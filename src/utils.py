@@ -1,99 +1,112 @@
-from datetime import datetime
 import re
+from functools import lru_cache
+from .config import load_config
+from .dates import shared_date_parser
 
-def validate_date(date_str):
+DATE_PARSER = shared_date_parser(load_config().get("rules", {}).get("date_formats"))
+
+def validate_date(date_str, parser=None):
     if not date_str or not isinstance(date_str, str):
         return False
-    date_str = date_str.strip()
-    if date_str.lower() in ("null", "none", ""):
-        return False
-    formats = [
-        "%Y-%m-%d", "%Y-%m", "%Y",
-        "%d/%m/%Y", "%m/%d/%Y",
-        "%d-%m-%Y", "%m-%d-%Y",
-        "%Y/%m/%d",
-        "%b %Y", "%B %Y",
-        "%d %b %Y", "%d %B %Y",
-        "%b %d, %Y", "%B %d, %Y",
-        "%Y.%m.%d", "%d.%m.%Y"
-    ]
-    for fmt in formats:
-        try:
-            datetime.strptime(date_str, fmt)
-            return True
-        except (ValueError, TypeError):
-            continue
-    return False
+    return (parser or DATE_PARSER).parse(date_str.strip()) is not None
 
-def parse_date(date_str):
+def parse_date(date_str, parser=None):
     if not date_str:
         return None
-    date_str = str(date_str).strip()
-    if date_str.lower() in ("null", "none", ""):
-        return None
-    formats = [
-        "%Y-%m-%d", "%Y-%m", "%Y",
-        "%d/%m/%Y", "%m/%d/%Y",
-        "%d-%m-%Y", "%m-%d-%Y",
-        "%Y/%m/%d",
-        "%b %Y", "%B %Y",
-        "%d %b %Y", "%d %B %Y",
-        "%b %d, %Y", "%B %d, %Y",
-        "%Y.%m.%d", "%d.%m.%Y"
-    ]
-    for fmt in formats:
-        try:
-            return datetime.strptime(date_str, fmt)
-        except:
-            continue
-    return None
+    return (parser or DATE_PARSER).parse(str(date_str).strip())
 
-def calculate_days(start, end):
-    s = parse_date(start)
-    e = parse_date(end)
+def calculate_days(start, end, parser=None):
+    s = parse_date(start, parser)
+    e = parse_date(end, parser)
     if s and e:
         return (e - s).days
     return 0
 
-def validate_url(url):
-    if not url or not isinstance(url, str):
-        return False
-    url = url.strip()
+URL_PATTERN = re.compile(
+    r'^(https?://)?(www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z]{2,6}\b([-a-zA-Z0-9()@:%_\+.~#?&//=]*)$',
+    re.IGNORECASE
+)
+EMAIL_PATTERN = re.compile(
+    r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+)
+NON_DIGIT_PATTERN = re.compile(r'\D')
+PERCENTAGE_PATTERN = re.compile(r'^\s*(\d+\.?\d*)\s*%?\s*$')
+FRACTION_PATTERN = re.compile(r'(\d+\.?\d*)\s*/\s*(\d+\.?\d*)')
+NUMBER_PATTERN = re.compile(r'^\s*(\d+\.?\d*)\s*$')
+
+CHECK_CACHE_SIZE = 65536
+CHECKS = {}
+
+def registered_check(name):
+    # Memoizes a check of an already-normalized string and registers it so
+    # its cache counters can be reported.
+    def register(fn):
+        cached = lru_cache(maxsize=CHECK_CACHE_SIZE)(fn)
+        CHECKS[name] = cached
+        return cached
+    return register
+
+def check_cache_info():
+    infos = [(name, fn.cache_info()) for name, fn in CHECKS.items()]
+    infos.append(("date", DATE_PARSER.cache_info()))
+    return {
+        name: {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize
+        }
+        for name, info in infos
+    }
+
+def dedup_report(before, after, records):
+    # What the memoized checks saved between two check_cache_info()
+    # snapshots: calls made, distinct values actually checked (the misses)
+    # and their ratio. Values checked before the first snapshot count as
+    # hits, since the caches live as long as the process.
+    kinds = {}
+    total = distinct = 0
+    for name, info in after.items():
+        hits = info["hits"] - before[name]["hits"]
+        misses = info["misses"] - before[name]["misses"]
+        kinds[name] = {
+            "calls": hits + misses,
+            "distinct": misses,
+            "dedup_ratio": round((hits + misses) / misses, 2) if misses else None
+        }
+        total += hits + misses
+        distinct += misses
+    return {
+        "records": records,
+        "calls": total,
+        "distinct": distinct,
+        "dedup_ratio": round(total / distinct, 2) if distinct else None,
+        "kinds": kinds
+    }
+
+@registered_check("url")
+def _check_url(url):
     if url.lower() in ("null", "none", ""):
         return False
-    pattern = re.compile(
-        r'^(https?://)?(www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z]{2,6}\b([-a-zA-Z0-9()@:%_\+.~#?&//=]*)$',
-        re.IGNORECASE
-    )
-    return bool(re.match(pattern, url))
+    return bool(URL_PATTERN.match(url))
 
-def validate_email(email):
-    if not email or not isinstance(email, str):
-        return False
-    email = email.strip()
+@registered_check("email")
+def _check_email(email):
     if email.lower() in ("null", "none", ""):
         return False
-    pattern = re.compile(
-        r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    )
-    return bool(re.match(pattern, email))
+    return bool(EMAIL_PATTERN.match(email))
 
-def validate_phone(phone):
-    if not phone:
-        return False
-    phone = str(phone).strip()
+@registered_check("phone")
+def _check_phone(phone):
     if phone.lower() in ("null", "none", ""):
         return False
-    cleaned = re.sub(r'\D', '', phone)
+    cleaned = NON_DIGIT_PATTERN.sub('', phone)
     if not cleaned.isdigit():
         return False
     return 10 <= len(cleaned) <= 13
 
-def validate_percentage(value):
-    if not value:
-        return False
-    value = str(value).strip()
-    match = re.search(r'^\s*(\d+\.?\d*)\s*%?\s*$', value)
+@registered_check("percentage")
+def _check_percentage(value):
+    match = PERCENTAGE_PATTERN.search(value)
     if match:
         try:
             num = float(match.group(1))
@@ -102,11 +115,9 @@ def validate_percentage(value):
             return False
     return False
 
-def validate_cgpa(value):
-    if not value:
-        return False
-    value = str(value).strip()
-    frac_match = re.search(r'(\d+\.?\d*)\s*/\s*(\d+\.?\d*)', value)
+@registered_check("cgpa")
+def _check_cgpa(value):
+    frac_match = FRACTION_PATTERN.search(value)
     if frac_match:
         try:
             num = float(frac_match.group(1))
@@ -119,7 +130,7 @@ def validate_cgpa(value):
                 return 0 <= num <= denom
         except:
             return False
-    num_match = re.search(r'^\s*(\d+\.?\d*)\s*$', value)
+    num_match = NUMBER_PATTERN.search(value)
     if num_match:
         try:
             num = float(num_match.group(1))
@@ -128,6 +139,31 @@ def validate_cgpa(value):
             return False
     return False
 
+def validate_url(url):
+    if not url or not isinstance(url, str):
+        return False
+    return _check_url(url.strip())
+
+def validate_email(email):
+    if not email or not isinstance(email, str):
+        return False
+    return _check_email(email.strip())
+
+def validate_phone(phone):
+    if not phone:
+        return False
+    return _check_phone(str(phone).strip())
+
+def validate_percentage(value):
+    if not value:
+        return False
+    return _check_percentage(str(value).strip())
+
+def validate_cgpa(value):
+    if not value:
+        return False
+    return _check_cgpa(str(value).strip())
+
 def is_null_or_empty(value):
     if value is None:
         return True
@@ -138,51 +174,52 @@ def is_null_or_empty(value):
         return True
     return False
 
-def extract_email_from_object(obj):
-    if isinstance(obj, dict):
-        email_fields = ["email", "emails", "mail", "e-mail", "emailId", "email_id","gmail"]
-        for field in email_fields:
-            if field in obj:
-                val = obj[field]
-                if isinstance(val, str) and validate_email(val):
-                    return val
-                if isinstance(val, list):
-                    for item in val:
-                        if isinstance(item, str) and validate_email(item):
-                            return item
-        for val in obj.values():
-            result = extract_email_from_object(val)
-            if result != "unknown":
-                return result
-    elif isinstance(obj, list):
-        for item in obj:
-            result = extract_email_from_object(item)
-            if result != "unknown":
-                return result
+def extract_email_from_object(obj, deadline=None):
+    # Depth first, checking each object's own email fields before anything
+    # nested in it.
+    email_fields = ["email", "emails", "mail", "e-mail", "emailId", "email_id","gmail"]
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if deadline is not None and isinstance(obj, (dict, list)):
+            deadline.check()
+        if isinstance(obj, dict):
+            for field in email_fields:
+                if field in obj:
+                    val = obj[field]
+                    if isinstance(val, str) and validate_email(val):
+                        return val
+                    if isinstance(val, list):
+                        for item in val:
+                            if isinstance(item, str) and validate_email(item):
+                                return item
+            stack.extend(reversed(obj.values()))
+        elif isinstance(obj, list):
+            stack.extend(reversed(obj))
     return "unknown"
 
-def extract_phone_from_object(obj):
-    if isinstance(obj, dict):
-        phone_fields = ["phone", "phone_number", "mobile", "contact", "telephone", "tel","mobile_number","phone_no"]
-        for field in phone_fields:
-            if field in obj:
-                val = obj[field]
-                if isinstance(val, str) and validate_phone(val):
-                    return val
-                if isinstance(val, list):
-                    for item in val:
-                        if isinstance(item, str) and validate_phone(item):
-                            return item
-        for val in obj.values():
-            result = extract_phone_from_object(val)
-            if result != "unknown":
-                return result
-    elif isinstance(obj, list):
-        for item in obj:
-            if isinstance(item, str) and validate_phone(item):
-                return item
-
-            result = extract_phone_from_object(item)
-            if result != "unknown":
-                return result
+def extract_phone_from_object(obj, deadline=None):
+    # Like extract_email_from_object, except that strings directly in a
+    # list count too. The stack holds (value, whether it is a list item).
+    phone_fields = ["phone", "phone_number", "mobile", "contact", "telephone", "tel","mobile_number","phone_no"]
+    stack = [(obj, False)]
+    while stack:
+        obj, in_list = stack.pop()
+        if deadline is not None and isinstance(obj, (dict, list)):
+            deadline.check()
+        if isinstance(obj, dict):
+            for field in phone_fields:
+                if field in obj:
+                    val = obj[field]
+                    if isinstance(val, str) and validate_phone(val):
+                        return val
+                    if isinstance(val, list):
+                        for item in val:
+                            if isinstance(item, str) and validate_phone(item):
+                                return item
+            stack.extend((val, False) for val in reversed(obj.values()))
+        elif isinstance(obj, list):
+            stack.extend((item, True) for item in reversed(obj))
+        elif in_list and isinstance(obj, str) and validate_phone(obj):
+            return obj
     return "unknown"
\ No newline at end of file
@@ -1,113 +1,313 @@
-from .detector import detect_all_sections, extract_basic_info
+from .detector import (
+    scan_document, scan_changes, rescan_document, find_fields, document_table,
+    DOCUMENT_TABLE, SECTION_PATTERNS, PLATFORM_TABLE, MATCHER
+)
 from .rules import (
-    validate_experience,
-    validate_education,
-    validate_projects,
-    validate_certifications,
-    validate_links,
-    validate_basic_info
+    check_experience,
+    check_education,
+    check_projects,
+    check_certifications,
+    check_links,
+    check_basic_info,
+    has_invalid_links
+)
+from .utils import is_null_or_empty, check_cache_info, dedup_report
+from .plan import load_plan, plan_changed
+from . import codec
+from .cache import document_key
+from .tracing import traced
+from .patch import apply_patch, document_changes, MISSING
+from .results import (
+    ValidationResult, SectionResult, CheckResult, Issue, IssueCode,
+    issue_payload, issue_from_payload
 )
-from .utils import is_null_or_empty
+from .budget import (
+    BudgetExceeded, BUDGET_EXCEEDED, check_document, check_changes, check_deadline,
+    start_deadline
+)
+
+STAGES = {
+    "scan_document": scan_document,
+    "validate_experience": check_experience,
+    "validate_education": check_education,
+    "validate_projects": check_projects,
+    "validate_certifications": check_certifications,
+    "validate_links": check_links,
+    "validate_basic_info": check_basic_info
+}
+SECTION_STAGES = {
+    "experience": "validate_experience",
+    "education": "validate_education",
+    "projects": "validate_projects",
+    "certifications": "validate_certifications"
+}
+CHECK_SECTIONS = ("links", "basic_info")
+SELECTABLE_SECTIONS = frozenset(SECTION_PATTERNS) | frozenset(CHECK_SECTIONS)
+
+def select_sections(names):
+    if names is None:
+        return None
+    selected = frozenset(name.strip() for name in names if name.strip())
+    unknown = sorted(selected - SELECTABLE_SECTIONS)
+    if unknown:
+        raise ValueError(
+            f"Unknown section(s): {', '.join(unknown)} "
+            f"(choose from {', '.join(sorted(SELECTABLE_SECTIONS))})"
+        )
+    return selected
+
+def error_result(message):
+    return ValidationResult.from_error(message).to_dict()
+
+def overall_status(fail_count, total_core):
+    if fail_count == 0:
+        return "STRUCTURED"
+    if fail_count < total_core:
+        return "PARTIALLY_STRUCTURED"
+    return "NOT_STRUCTURED"
+
 class ResumeValidator:
-    def __init__(self):
-        pass
+    def __init__(self, config_path=None, plan=None, cache=None, trace=False,
+                 sections=None, fail_fast=False):
+        self.config_path = config_path
+        self.plan = plan or load_plan(config_path)
+        self.cache = cache
+        self.trace = trace
+        self.sections = select_sections(sections)
+        self.fail_fast = fail_fast
+        if self.sections is None:
+            self._table = DOCUMENT_TABLE
+        else:
+            self._table = document_table(self.sections)
+    def _options_key(self):
+        # Results of a subset or fail-fast run must not be served to a full
+        # run, so those options are part of the cache key.
+        if self.sections is None and not self.fail_fast:
+            return ""
+        selected = "all" if self.sections is None else ",".join(sorted(self.sections))
+        return f":{selected}:{int(self.fail_fast)}"
+    def set_plan(self, plan):
+        self.plan = plan
+    def reload(self):
+        self.plan = load_plan(self.config_path)
+        return self.plan
+    def reload_if_changed(self):
+        if not plan_changed(self.plan):
+            return False
+        self.reload()
+        return True
     def validate(self, input_json):
+        return self._run(self._cached, input_json).to_dict()
+    def validate_compact(self, input_json):
+        # The same result as a ValidationResult, whose issues stay codes
+        # until to_dict() renders them.
+        return self._run(self._cached, input_json)
+    def validate_batch(self, records):
+        # Validates each record as validate() does; the memoized checks in
+        # utils check each distinct date, URL, email and phone once, and
+        # the report says how often they were reused. Returns (results,
+        # report).
+        before = check_cache_info()
+        results = [self.validate(record) for record in records]
+        return results, dedup_report(before, check_cache_info(), len(results))
+    def revalidate(self, previous_document, previous_result, patch=None, document=None):
+        # Re-runs only what an edit can affect. previous_result must come
+        # from validate() on previous_document with the same plan and
+        # options. Takes an RFC 6902 patch or the new document and returns
+        # (new_document, result).
+        if patch is not None:
+            document, changes = apply_patch(previous_document, patch)
+        elif document is None:
+            raise ValueError("revalidate needs a patch or the new document")
+        else:
+            changes = document_changes(previous_document, document)
+        result = self._run(
+            self._revalidate, previous_document, previous_result, document, changes
+        )
+        return document, result.to_dict()
+    def _run(self, fn, *args):
+        if not self.trace:
+            return self._bounded(fn, *args, STAGES)
+        # Traced runs wrap every stage in a timer; the untraced path above
+        # calls the stage functions directly.
+        timings = {}
+        stages = {name: traced(name, stage, timings) for name, stage in STAGES.items()}
+        result = self._bounded(traced("total", fn, timings), *args, stages)
+        result.extra = dict(result.extra or {}, debug={"stage_us": timings})
+        return result
+    def _bounded(self, fn, *args):
+        try:
+            return fn(*args)
+        except BudgetExceeded as e:
+            return ValidationResult.from_error(str(e), BUDGET_EXCEEDED)
+    def _cached(self, input_json, stages):
+        plan = self.plan
         if not isinstance(input_json, dict):
-            return {
-                "candidate_id": "unknown",
-                "name": "unknown",
-                "email": "unknown",
-                "phone": "unknown",
-                "validation_status": "ERROR",
-                "error": "Input must be a JSON object",
-                "validated_sections": {},
-                "detected_sections": []
-            }
+            return ValidationResult.from_error("Input must be a JSON object")
+        deadline = start_deadline(plan.budget)
+        check_document(input_json, plan.budget, deadline)
+        cache = self.cache
+        if cache is None:
+            return self._validate(input_json, plan, stages, deadline)
+        try:
+            key = document_key(input_json, plan.version) + self._options_key()
+        except (TypeError, ValueError):
+            return self._validate(input_json, plan, stages, deadline)
+        cached = cache.get(key)
+        if cached is not None:
+            result = ValidationResult.from_dict(codec.loads(cached), issue_from_payload)
+        else:
+            # A record that runs out of time raises before it is cached.
+            # Issues are cached as codes and arguments, so a hit comes back
+            # with the same issue codes as a fresh run.
+            result = self._validate(input_json, plan, stages, deadline)
+            cache.put(key, codec.dumps(result.to_dict(issue_payload)))
+        result.extra = {"cache": {
+            "hit": cached is not None,
+            "hits": cache.hits,
+            "misses": cache.misses
+        }}
+        return result
+    def _section_result(self, section, all_sections, plan, stages, deadline=None):
+        if section not in all_sections:
+            return SectionResult("NOT_FOUND")
+        section_data = all_sections.get(section)
+        if is_null_or_empty(section_data):
+            return SectionResult(
+                "FAIL", section_issues=[Issue(IssueCode.SECTION_EMPTY, section.capitalize())]
+            )
         try:
-            all_sections = detect_all_sections(input_json)
-            basic_info = extract_basic_info(input_json)
+            return stages[SECTION_STAGES[section]](
+                section_data, plan.sections[section], deadline
+            )
+        except BudgetExceeded:
+            raise
         except Exception as e:
-            return {
-                "candidate_id": "unknown",
-                "name": "unknown",
-                "email": "unknown",
-                "phone": "unknown",
-                "validation_status": "ERROR",
-                "error": f"Detection error: {str(e)}",
-                "validated_sections": {},
-                "detected_sections": []
-            }
-        validated = {}
-        detected_list = []
-        validation_map = {
-            "experience": validate_experience,
-            "education": validate_education,
-            "projects": validate_projects,
-            "certifications": validate_certifications
-        }
-        for section, validator_fn in validation_map.items():
-            if section in all_sections:
-                section_data = all_sections.get(section)
-                if is_null_or_empty(section_data):
-                    validated[section] = {
-                        "status": "FAIL",
-                        "entries": [],
-                        "section_issues": [f"{section.capitalize()} section is empty"]
-                    }
-                else:
-                    try:
-                        result = validator_fn(section_data)
-                        validated[section] = result
-                    except Exception as e:
-                        validated[section] = {
-                            "status": "ERROR",
-                            "entries": [],
-                            "section_issues": [f"Validation error: {str(e)}"]
-                        }
-
-            else:
-                validated[section] = {
-                    "status": "NOT_FOUND",
-                    "entries": []
-                }
+            return SectionResult(
+                "ERROR", section_issues=[Issue(IssueCode.VALIDATION_ERROR, str(e))]
+            )
+    def _links_result(self, input_json, stages, deadline=None):
         try:
-            link_issues = validate_links(input_json)
+            link_issues = stages["validate_links"](input_json, deadline)
+        except BudgetExceeded:
+            raise
         except Exception as e:
-            link_issues = [f"Link validation error: {str(e)}"]
-
-        validated["links"] = {
-            "status": "PASS" if not link_issues else "FAIL",
-            "issues": link_issues
-        }
+            link_issues = [Issue(IssueCode.LINK_ERROR, str(e))]
+        return CheckResult.of(link_issues)
+    def _basic_result(self, basic_info, stages):
         try:
-            basic_issues = validate_basic_info(basic_info)
+            basic_issues = stages["validate_basic_info"](basic_info)
         except Exception as e:
-            basic_issues = [f"Basic info validation error: {str(e)}"]
-
-        validated["basic_info"] = {
-            "status": "PASS" if not basic_issues else "FAIL",
-            "issues": basic_issues
-        }
-        for section in all_sections:
-            if section not in validation_map:
-                detected_list.append(section)
+            basic_issues = [Issue(IssueCode.BASIC_INFO_ERROR, str(e))]
+        return CheckResult.of(basic_issues)
+    def _selected(self, section):
+        return self.sections is None or section in self.sections
+    def _core_sections(self):
+        return [section for section in SECTION_STAGES if self._selected(section)]
+    def _validate(self, input_json, plan, stages=STAGES, deadline=None):
+        # The stages check the time budget as they walk the record; running
+        # out raises BudgetExceeded, which _run turns into the result.
+        fail_fast = self.fail_fast
+        try:
+            all_sections, basic_info = stages["scan_document"](
+                input_json, plan.matcher, plan.basic_fields, self._table, deadline
+            )
+        except BudgetExceeded:
+            raise
+        except Exception as e:
+            return ValidationResult.from_error(f"Detection error: {str(e)}")
+        validated = {}
+        core = self._core_sections()
         fail_count = 0
-        total_core = len(validation_map)
-        for sec in validation_map:
-            if validated[sec]["status"] == "FAIL":
+        for done, section in enumerate(core):
+            # Once one section failed and another did not, the status is
+            # PARTIALLY_STRUCTURED whatever the remaining sections say.
+            if fail_fast and 0 < fail_count < done:
+                validated[section] = SectionResult("SKIPPED")
+                continue
+            check_deadline(deadline)
+            validated[section] = self._section_result(
+                section, all_sections, plan, stages, deadline
+            )
+            if validated[section].status == "FAIL":
                 fail_count += 1
-        if fail_count == 0:
-            overall_status = "STRUCTURED"
-        elif fail_count < total_core:
-            overall_status = "PARTIALLY_STRUCTURED"
+        if fail_fast:
+            # Links and basic info never change validation_status.
+            for check in CHECK_SECTIONS:
+                if self._selected(check):
+                    validated[check] = CheckResult("SKIPPED")
         else:
-            overall_status = "NOT_STRUCTURED"
-        return {
-            "candidate_id": basic_info.get("candidate_id", "unknown"),
-            "name": basic_info.get("name", "unknown"),
-            "email": basic_info.get("email", "unknown"),
-            "phone": basic_info.get("phone", "unknown"),
-            "validation_status": overall_status,
-            "validated_sections": validated,
-            "detected_sections": detected_list
-        }
\ No newline at end of file
+            if self._selected("links"):
+                check_deadline(deadline)
+                validated["links"] = self._links_result(input_json, stages, deadline)
+            if self._selected("basic_info"):
+                validated["basic_info"] = self._basic_result(basic_info, stages)
+        detected = [section for section in all_sections if section not in SECTION_STAGES]
+        return self._result(basic_info, validated, detected, core)
+    def _result(self, basic_info, validated, detected, core):
+        fail_count = sum(1 for section in core if validated[section].status == "FAIL")
+        return ValidationResult(
+            basic_info, overall_status(fail_count, len(core)), validated, detected
+        )
+    def _revalidate(self, previous_document, previous_result, document, changes,
+                    stages=STAGES):
+        # Only the slots the edit mentions are looked up again, and only the
+        # sections and basic-info fields built from them are re-checked; the
+        # rest of the previous result is kept as it was.
+        plan = self.plan
+        previous_sections = previous_result.get("validated_sections") if isinstance(previous_result, dict) else None
+        if (
+            changes is None
+            or self.fail_fast
+            or not isinstance(previous_sections, dict)
+            or previous_result.get("validation_status") in ("ERROR", BUDGET_EXCEEDED)
+        ):
+            return self._cached(document, stages)
+        deadline = start_deadline(plan.budget)
+        check_changes(document, changes, plan.budget, MISSING, deadline)
+        slots, links = scan_changes(changes, (plan.matcher, MATCHER), MISSING)
+        try:
+            rescanned, all_sections, basic_update = rescan_document(
+                document, slots, plan.matcher, plan.basic_fields, self._table, deadline
+            )
+        except BudgetExceeded:
+            raise
+        except Exception as e:
+            return ValidationResult.from_error(f"Detection error: {str(e)}")
+        previous = ValidationResult.from_dict(previous_result)
+        validated = previous.sections
+        core = self._core_sections()
+        for section in core:
+            if section in rescanned:
+                check_deadline(deadline)
+                validated[section] = self._section_result(
+                    section, all_sections, plan, stages, deadline
+                )
+        detected = previous.detected
+        if rescanned.difference(SECTION_STAGES):
+            present = set(detected).difference(rescanned).union(all_sections)
+            detected = [
+                slot[1] for slot in self._table
+                if slot[1] in present and slot[1] not in SECTION_STAGES
+            ]
+        basic_info = {
+            "candidate_id": previous.candidate_id,
+            "name": previous.name,
+            "email": previous.email,
+            "phone": previous.phone,
+            **basic_update
+        }
+        if self._selected("basic_info") and basic_update:
+            validated["basic_info"] = self._basic_result(basic_info, stages)
+        if self._selected("links"):
+            # Links the edit wrote or removed, and the platform fields it
+            # can have changed before and after: while all of them are valid
+            # URLs the link issues stay the same.
+            platforms = tuple(slot for slot in PLATFORM_TABLE if slot in slots)
+            values = list(links)
+            for data in (previous_document, document) if platforms else ():
+                values.extend(find_fields(data, platforms, deadline=deadline).values())
+            if has_invalid_links(values):
+                check_deadline(deadline)
+                validated["links"] = self._links_result(document, stages, deadline)
+        return self._result(basic_info, validated, detected, core)
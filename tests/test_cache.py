@@ -0,0 +1,24 @@
+import unittest
+from src.cache import make_cache, document_key
+from src.validator import ResumeValidator
+
+# Field lookups take the first matching key, so a document with the same
+# keys in another order is a different document to the cache.
+FIRST = {"name": "Alice Smith", "full_name": "x"}
+REORDERED = {"full_name": "x", "name": "Alice Smith"}
+
+class DocumentKeyTest(unittest.TestCase):
+    def test_key_order_changes_the_key(self):
+        self.assertNotEqual(document_key(FIRST, "v"), document_key(REORDERED, "v"))
+
+    def test_reordered_document_is_not_a_cache_hit(self):
+        cached = ResumeValidator(cache=make_cache())
+        plain = ResumeValidator()
+        cached.validate(FIRST)
+        result = cached.validate(REORDERED)
+        self.assertFalse(result.pop("cache")["hit"])
+        self.assertEqual(result, plain.validate(REORDERED))
+        self.assertEqual(result["name"], "x")
+
+if __name__ == "__main__":
+    unittest.main()